@@ -0,0 +1,108 @@
+"""
+Derived article representation.
+Plain text, word counts, the heading outline and content hashes are computed from
+`sections` once, when an article is written, and stored on the document as
+`derived`. Export, SEO assistant, competition and link-building read it instead of
+stripping and counting the section HTML again on every call; every path that writes
+`sections` must store a new representation with it.
+"""
+
+import hashlib
+from typing import Optional
+
+from seo_scorer import section_content_hash
+from text_core import strip_tags
+
+# Bump when the shape or the semantics of the derived fields change
+DERIVED_VERSION = 1
+
+# Mongo projection that keeps the derived representation out of API responses
+PUBLIC_ARTICLE_PROJECTION = {"_id": 0, "derived": 0}
+
+
+def _derive_part(fragment: dict, previous: dict) -> dict:
+    html = fragment.get("content", "")
+    content_hash = section_content_hash(html)
+    reused = previous.get(content_hash)
+    if reused is not None:
+        return {**reused}
+    text = strip_tags(html).strip()
+    return {
+        "content_hash": content_hash,
+        "text": text,
+        "word_count": len(text.split()),
+    }
+
+
+def _parts_by_hash(derived: Optional[dict]) -> dict:
+    """content_hash -> part entry of a previous derived representation."""
+    parts = {}
+    if not derived or derived.get("version") != DERIVED_VERSION:
+        return parts
+    for section in derived.get("sections", []):
+        for part in [section] + section.get("subsections", []):
+            parts[part["content_hash"]] = {k: part[k] for k in ("content_hash", "text", "word_count")}
+    return parts
+
+
+def build_derived(sections: list, previous: Optional[dict] = None) -> dict:
+    """
+    Derived representation of article sections:
+    - sections: per section (and subsection) content hash, stripped text and word count
+    - outline: h2/h3 headings with anchors, in document order
+    - word_count: body words, counted like the SEO scorer does
+    - content_hash: hash over headings, anchors and section hashes
+
+    Parts whose content hash matches a part of `previous` are reused without stripping again.
+    """
+    reusable = _parts_by_hash(previous)
+    derived_sections = []
+    outline = []
+    word_count = 0
+    digest = hashlib.blake2b(digest_size=16)
+    for section in sections or []:
+        entry = _derive_part(section, reusable)
+        outline.append({"level": 2, "heading": section.get("heading", ""), "anchor": section.get("anchor", "")})
+        digest.update(f'2\x00{section.get("heading", "")}\x00{section.get("anchor", "")}\x00{entry["content_hash"]}\x00'.encode("utf-8"))
+        word_count += entry["word_count"]
+        entry["subsections"] = []
+        for sub in section.get("subsections", []):
+            sub_entry = _derive_part(sub, reusable)
+            outline.append({"level": 3, "heading": sub.get("heading", ""), "anchor": sub.get("anchor", "")})
+            digest.update(f'3\x00{sub.get("heading", "")}\x00{sub.get("anchor", "")}\x00{sub_entry["content_hash"]}\x00'.encode("utf-8"))
+            word_count += sub_entry["word_count"]
+            entry["subsections"].append(sub_entry)
+        derived_sections.append(entry)
+
+    return {
+        "version": DERIVED_VERSION,
+        "content_hash": digest.hexdigest(),
+        "word_count": word_count,
+        "outline": outline,
+        "sections": derived_sections,
+    }
+
+
+def get_derived(article: dict) -> dict:
+    """
+    The stored derived representation, or a freshly built one for documents written
+    before it existed (or under an older DERIVED_VERSION). Every write of `sections`
+    (generation, import, PUT, PATCH) stores a new representation and batch rescoring
+    backfills old documents, so a current version marker is trusted without re-hashing.
+    """
+    derived = article.get("derived")
+    if derived and derived.get("version") == DERIVED_VERSION:
+        return derived
+    return build_derived(article.get("sections") or [], derived)
+
+
+def derived_set_paths(previous: Optional[dict], derived: dict) -> dict:
+    """`$set` paths that turn the stored `previous` representation into `derived`."""
+    if (not previous or previous.get("version") != DERIVED_VERSION
+            or len(previous.get("sections", [])) != len(derived["sections"])):
+        return {"derived": derived}
+    fields = {f"derived.{key}": derived[key] for key in ("content_hash", "word_count", "outline")}
+    for i, (old, new) in enumerate(zip(previous["sections"], derived["sections"])):
+        if old != new:
+            fields[f"derived.sections.{i}"] = new
+    return fields
@@ -0,0 +1,165 @@
+"""
+JSON-patch style article updates.
+The editor sends only what changed, as RFC 6902 operations (add / replace / remove)
+on article fields and on `sections`. The operations are applied to an in-memory copy
+and turned into targeted MongoDB `$set` paths ("sections.3.content"), so an autosave
+of one edited paragraph neither uploads nor re-parses nor rewrites the whole article.
+"""
+
+import copy
+from typing import Any, Dict, List, Optional, Tuple
+
+# Article fields a patch may replace, with the JSON type they must have
+PATCHABLE_FIELDS = {
+    "title": str,
+    "slug": str,
+    "meta_title": str,
+    "meta_description": str,
+    "faq": list,
+    "toc": list,
+    "internal_link_suggestions": list,
+    "sources": list,
+}
+SECTION_FIELDS = ("heading", "anchor", "content")
+MAX_PATCH_OPERATIONS = 200
+
+
+class PatchError(ValueError):
+    """An operation that cannot be applied (bad path, op or value)."""
+
+
+def _parse_pointer(path: str) -> List[str]:
+    """JSON pointer -> list of reference tokens (~1 and ~0 unescaped)."""
+    if not path.startswith("/"):
+        raise PatchError(f"Nieprawidlowa sciezka: {path}")
+    return [token.replace("~1", "/").replace("~0", "~") for token in path[1:].split("/")]
+
+
+def _index(token: str, size: int, path: str, allow_end: bool = False) -> int:
+    """Array index of a pointer token; "-" (append) and `size` are allowed when adding."""
+    if token == "-" and allow_end:
+        return size
+    if not token.isdigit() or (len(token) > 1 and token.startswith("0")):
+        raise PatchError(f"Nieprawidlowa sciezka: {path}")
+    index = int(token)
+    if index > size or (index == size and not allow_end):
+        raise PatchError(f"Indeks poza zakresem: {path}")
+    return index
+
+
+def _check_fragment(value: Any, path: str, with_subsections: bool) -> dict:
+    """Validate a section / subsection object and return a normalised copy."""
+    if not isinstance(value, dict) or not all(isinstance(value.get(f, ""), str) for f in SECTION_FIELDS):
+        raise PatchError(f"Nieprawidlowa wartosc dla {path}")
+    fragment = {f: value.get(f, "") for f in SECTION_FIELDS}
+    if with_subsections:
+        subsections = value.get("subsections", [])
+        if not isinstance(subsections, list):
+            raise PatchError(f"Nieprawidlowa wartosc dla {path}")
+        fragment["subsections"] = [_check_fragment(sub, path, False) for sub in subsections]
+    return fragment
+
+
+def _apply_to_list(items: list, op: str, token: str, value: Any, path: str, with_subsections: bool) -> bool:
+    """add/replace/remove on a sections or subsections array. Returns True when its length changed."""
+    if op == "add":
+        items.insert(_index(token, len(items), path, allow_end=True), _check_fragment(value, path, with_subsections))
+        return True
+    index = _index(token, len(items), path)
+    if op == "remove":
+        del items[index]
+        return True
+    items[index] = _check_fragment(value, path, with_subsections)
+    return False
+
+
+def apply_article_patch(article: dict, operations: List[dict]) -> Tuple[Dict[str, Any], Optional[list]]:
+    """
+    Apply patch operations to `article`.
+    Returns (set_fields, sections): the MongoDB `$set` document with the narrowest
+    paths that cover every change, and the patched sections list (None when no
+    operation touched sections). `article` itself is not modified.
+    """
+    if len(operations) > MAX_PATCH_OPERATIONS:
+        raise PatchError(f"Za duzo operacji (maksymalnie {MAX_PATCH_OPERATIONS})")
+
+    fields = {}
+    sections = None
+    touched = set()  # paths (tuples) into sections that changed
+
+    for operation in operations:
+        op, path, value = operation.get("op"), operation.get("path", ""), operation.get("value")
+        if op not in ("add", "replace", "remove"):
+            raise PatchError(f"Nieobslugiwana operacja: {op}")
+        tokens = _parse_pointer(path)
+        head = tokens[0]
+
+        if head in PATCHABLE_FIELDS and len(tokens) == 1:
+            if op == "remove" or not isinstance(value, PATCHABLE_FIELDS[head]):
+                raise PatchError(f"Nieprawidlowa wartosc dla {path}")
+            fields[head] = value
+            continue
+        if head != "sections":
+            raise PatchError(f"Nieprawidlowa sciezka: {path}")
+
+        if sections is None:
+            sections = copy.deepcopy(article.get("sections") or [])
+
+        if len(tokens) == 1:
+            if op != "replace" or not isinstance(value, list):
+                raise PatchError(f"Nieprawidlowa wartosc dla {path}")
+            sections = [_check_fragment(s, path, True) for s in value]
+            touched.add(())
+        elif len(tokens) == 2:
+            resized = _apply_to_list(sections, op, tokens[1], value, path, True)
+            touched.add(() if resized else (int(tokens[1]),))
+        else:
+            i = _index(tokens[1], len(sections), path)
+            section = sections[i]
+            if len(tokens) == 3 and tokens[2] in SECTION_FIELDS:
+                if op == "remove" or not isinstance(value, str):
+                    raise PatchError(f"Nieprawidlowa wartosc dla {path}")
+                section[tokens[2]] = value
+                touched.add((i, tokens[2]))
+            elif len(tokens) == 3 and tokens[2] == "subsections":
+                if op != "replace" or not isinstance(value, list):
+                    raise PatchError(f"Nieprawidlowa wartosc dla {path}")
+                section["subsections"] = [_check_fragment(sub, path, False) for sub in value]
+                touched.add((i, "subsections"))
+            elif len(tokens) == 4 and tokens[2] == "subsections":
+                subsections = section.setdefault("subsections", [])
+                resized = _apply_to_list(subsections, op, tokens[3], value, path, False)
+                touched.add((i, "subsections") if resized else (i, "subsections", int(tokens[3])))
+            elif len(tokens) == 5 and tokens[2] == "subsections" and tokens[4] in SECTION_FIELDS:
+                j = _index(tokens[3], len(section.get("subsections", [])), path)
+                if op == "remove" or not isinstance(value, str):
+                    raise PatchError(f"Nieprawidlowa wartosc dla {path}")
+                section["subsections"][j][tokens[4]] = value
+                touched.add((i, "subsections", j, tokens[4]))
+            else:
+                raise PatchError(f"Nieprawidlowa sciezka: {path}")
+
+    if sections is not None:
+        fields.update(_section_set_paths(sections, touched))
+    return fields, sections
+
+
+def _section_set_paths(sections: list, touched: set) -> Dict[str, Any]:
+    """
+    `$set` paths for the touched parts of `sections`. A path under another touched
+    path is dropped (MongoDB rejects conflicting paths and the parent covers it).
+    Indices are only recorded for same-length arrays, so they are still valid here.
+    """
+    if () in touched:
+        return {"sections": sections}
+    kept = []
+    for path in sorted(touched, key=len):
+        if not any(path[:len(parent)] == parent for parent in kept):
+            kept.append(path)
+    result = {}
+    for path in kept:
+        value = sections
+        for key in path:
+            value = value[key]
+        result["sections." + ".".join(str(key) for key in path)] = value
+    return result
@@ -13,6 +13,8 @@ from typing import Optional
 from passlib.context import CryptContext
 from jose import jwt, JWTError
 
+from cpu_executor import run_cpu
+
 logger = logging.getLogger(__name__)
 
 # Password hashing
@@ -77,7 +79,7 @@ async def register_user(db, email: str, password: str, full_name: str = "") -> d
     user_doc = {
         "id": user_id,
         "email": email.lower(),
-        "password_hash": hash_password(password),
+        "password_hash": await run_cpu(hash_password, password),
         "full_name": full_name,
         "workspace_id": workspace_id,
         "is_admin": False,
@@ -93,7 +95,7 @@ async def authenticate_user(db, email: str, password: str) -> Optional[dict]:
     user = await db.users.find_one({"email": email.lower()})
     if not user:
         return None
-    if not verify_password(password, user["password_hash"]):
+    if not await run_cpu(verify_password, password, user["password_hash"]):
         return None
     if not user.get("is_active", True):
         return None
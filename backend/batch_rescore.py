@@ -0,0 +1,202 @@
+"""
+Batch SEO Rescoring
+Re-runs compute_seo_score over stored articles after scoring rules or keywords change.
+Articles are streamed from MongoDB with a cursor, scored in a process pool and
+written back with bulk_write, together with the derived representation for
+articles stored before it existed. Each write is conditioned on the version that
+was scored, so an article saved meanwhile keeps its new state and is counted as skipped. Usable from the admin API and from the command line:
+
+    python batch_rescore.py [--user-id ID] [--workers 4] [--batch-size 50] [--dry-run]
+"""
+
+import asyncio
+import logging
+import multiprocessing
+import os
+import time
+from concurrent.futures import ProcessPoolExecutor
+from datetime import datetime, timezone
+from typing import Callable, Optional
+
+from pymongo import UpdateOne
+
+from article_derived import DERIVED_VERSION, build_derived
+from seo_scorer import compute_seo_score
+
+logger = logging.getLogger(__name__)
+
+# Only the fields the scorer reads, plus the article version (to condition the write)
+# and the derived version (to spot documents to backfill)
+RESCORE_PROJECTION = {
+    "_id": 0, "id": 1, "title": 1, "meta_description": 1, "sections": 1, "faq": 1, "toc": 1,
+    "internal_link_suggestions": 1, "sources": 1, "primary_keyword": 1, "secondary_keywords": 1,
+    "version": 1, "derived.version": 1
+}
+
+DEFAULT_BATCH_SIZE = 50
+
+
+def max_workers() -> int:
+    """Upper bound on worker processes: RESCORE_MAX_WORKERS, else the CPU count."""
+    value = os.environ.get("RESCORE_MAX_WORKERS", "")
+    if value.isdigit() and int(value) > 0:
+        return int(value)
+    return os.cpu_count() or 1
+
+
+def resolve_workers(workers: Optional[int] = None) -> int:
+    """
+    Worker count for a rescoring run: the default is CPU count - 1, explicit values
+    are capped at max_workers(). Raises ValueError for values below 1.
+    """
+    limit = max_workers()
+    if workers is None:
+        return max(1, min(limit, (os.cpu_count() or 2) - 1))
+    if workers < 1:
+        raise ValueError("workers must be at least 1")
+    return min(workers, limit)
+
+
+def _score_batch(articles: list) -> list:
+    """
+    Score a batch of articles inside a worker process.
+    Returns (article_id, version, score, derived, error) tuples; `derived` is None when the
+    stored one is current. `version` is the article version that was scored (None before versioning).
+    """
+    results = []
+    for article in articles:
+        try:
+            score = compute_seo_score(
+                article,
+                article.get("primary_keyword", ""),
+                article.get("secondary_keywords", []),
+                use_cache=False
+            )
+            derived = None
+            if (article.get("derived") or {}).get("version") != DERIVED_VERSION:
+                derived = build_derived(article.get("sections", []))
+            results.append((article["id"], article.get("version"), score, derived, None))
+        except Exception as e:
+            results.append((article.get("id"), article.get("version"), None, None, str(e)))
+    return results
+
+
+async def rescore_articles(
+    db,
+    query: Optional[dict] = None,
+    workers: Optional[int] = None,
+    batch_size: int = DEFAULT_BATCH_SIZE,
+    dry_run: bool = False,
+    on_progress: Optional[Callable[[dict], None]] = None
+) -> dict:
+    """
+    Rescore every article matching `query` and store the new seo_score.
+    At most two batches per worker are in flight, so memory stays bounded
+    regardless of the number of articles.
+    """
+    workers = resolve_workers(workers)
+    batch_size = max(1, batch_size)
+    max_in_flight = workers * 2
+    loop = asyncio.get_running_loop()
+
+    stats = {"scanned": 0, "rescored": 0, "failed": 0, "written": 0, "skipped": 0, "errors": []}
+    started = time.perf_counter()
+
+    async def write_results(results: list):
+        scored_at = datetime.now(timezone.utc).isoformat()
+        ops = []
+        for article_id, version, score, derived, error in results:
+            if error:
+                stats["failed"] += 1
+                if len(stats["errors"]) < 20:
+                    stats["errors"].append({"id": article_id, "error": error})
+                continue
+            stats["rescored"] += 1
+            fields = {"seo_score": score, "seo_scored_at": scored_at}
+            if derived is not None:
+                fields["derived"] = derived
+            # {"version": None} also matches documents written before versioning
+            ops.append(UpdateOne({"id": article_id, "version": version}, {"$set": fields}))
+        if ops and not dry_run:
+            result = await db.articles.bulk_write(ops, ordered=False)
+            stats["written"] += result.modified_count
+            # Saved (or deleted) since it was read: the score is stale, keep the new state
+            stats["skipped"] += len(ops) - result.matched_count
+        if on_progress:
+            on_progress(stats)
+
+    # spawn: never fork the event loop / Mongo client threads into workers
+    with ProcessPoolExecutor(max_workers=workers, mp_context=multiprocessing.get_context("spawn")) as pool:
+        pending = set()
+        batch = []
+
+        async def drain(return_when):
+            nonlocal pending
+            done, pending = await asyncio.wait(pending, return_when=return_when)
+            for future in done:
+                await write_results(future.result())
+
+        cursor = db.articles.find(query or {}, RESCORE_PROJECTION).batch_size(batch_size)
+        async for article in cursor:
+            stats["scanned"] += 1
+            batch.append(article)
+            if len(batch) >= batch_size:
+                pending.add(loop.run_in_executor(pool, _score_batch, batch))
+                batch = []
+                if len(pending) >= max_in_flight:
+                    await drain(asyncio.FIRST_COMPLETED)
+        if batch:
+            pending.add(loop.run_in_executor(pool, _score_batch, batch))
+        if pending:
+            await drain(asyncio.ALL_COMPLETED)
+
+    elapsed = time.perf_counter() - started
+    stats["elapsed_seconds"] = round(elapsed, 3)
+    stats["articles_per_second"] = round(stats["scanned"] / elapsed, 1) if elapsed > 0 else 0.0
+    stats["workers"] = workers
+    stats["batch_size"] = batch_size
+    stats["dry_run"] = dry_run
+    logger.info(
+        f"Batch rescore: {stats['rescored']}/{stats['scanned']} articles in {stats['elapsed_seconds']}s "
+        f"({stats['articles_per_second']} art/s, {workers} workers)"
+    )
+    return stats
+
+
+async def _main():
+    import argparse
+    from pathlib import Path
+    from dotenv import load_dotenv
+    from motor.motor_asyncio import AsyncIOMotorClient
+
+    parser = argparse.ArgumentParser(description="Rescore stored articles with the current SEO rules.")
+    parser.add_argument("--user-id", help="only articles of this user")
+    parser.add_argument("--workers", type=int, default=None, help="worker processes (default: CPU count - 1, capped at RESCORE_MAX_WORKERS or the CPU count)")
+    parser.add_argument("--batch-size", type=int, default=DEFAULT_BATCH_SIZE)
+    parser.add_argument("--dry-run", action="store_true", help="score without writing results")
+    args = parser.parse_args()
+    if args.workers is not None and args.workers < 1:
+        parser.error("--workers must be at least 1")
+
+    load_dotenv(Path(__file__).parent / '.env')
+    client = AsyncIOMotorClient(os.environ['MONGO_URL'])
+    db = client[os.environ.get('DB_NAME', 'seo_article_writer')]
+
+    query = {"user_id": args.user_id} if args.user_id else {}
+    try:
+        stats = await rescore_articles(db, query, args.workers, args.batch_size, args.dry_run)
+    finally:
+        client.close()
+
+    print(
+        f"Scanned {stats['scanned']}, rescored {stats['rescored']}, failed {stats['failed']}, "
+        f"written {stats['written']}, skipped {stats['skipped']} (changed meanwhile) in {stats['elapsed_seconds']}s "
+        f"({stats['articles_per_second']} articles/s)"
+    )
+    for err in stats["errors"]:
+        print(f"  {err['id']}: {err['error']}")
+
+
+if __name__ == "__main__":
+    logging.basicConfig(level=logging.INFO, format='%(asctime)s - %(name)s - %(levelname)s - %(message)s')
+    asyncio.run(_main())
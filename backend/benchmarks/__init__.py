@@ -0,0 +1,4 @@
+"""
+Performance benchmarks for the CPU-bound backend hot paths.
+Run from the backend directory, e.g. `python -m benchmarks.bench_seo_scorer`.
+"""
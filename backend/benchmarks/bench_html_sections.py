@@ -0,0 +1,83 @@
+"""
+Benchmark: single-pass HTML-to-sections parser vs. the previous regex splitter.
+Documents are built from synthetic articles until they reach the requested size
+in bytes. The "unclosed" case appends <h2> tags that are never closed, which the
+regex splitter rescans to the end of the document for every one of them.
+Headings and section bodies of both parsers are compared; anchors differ by
+design because the regex splitter never read the id attribute.
+
+Usage (from the backend directory):
+    python -m benchmarks.bench_html_sections [--sizes-kb 100,500,1000,2000] [--repeat 5]
+"""
+
+import argparse
+import time
+
+from html_sections import parse_html_to_sections
+from benchmarks.reference_html_sections import parse_html_to_sections as reference_parse_html_to_sections
+from benchmarks.synthetic import make_article, make_html
+
+# Roughly 8.8 bytes of editor HTML per synthetic word
+_BYTES_PER_WORD = 8.8
+
+
+def _best_of(fn, repeat: int) -> float:
+    best = float("inf")
+    for _ in range(repeat):
+        start = time.perf_counter()
+        fn()
+        best = min(best, time.perf_counter() - start)
+    return best
+
+
+def _outline(sections: list) -> list:
+    """Headings and bodies only (anchors are compared separately)."""
+    return [
+        (s["heading"], s["content"], [(sub["heading"], sub["content"]) for sub in s["subsections"]])
+        for s in sections
+    ]
+
+
+def make_document(size_kb: int, unclosed: int = 0) -> str:
+    html = make_html(make_article(int(size_kb * 1024 / _BYTES_PER_WORD)))
+    if unclosed:
+        html += "".join(f"<h2>Niedomknięty nagłówek {i}<p>Treść akapitu.</p>" for i in range(unclosed))
+    return html
+
+
+def run(sizes_kb: list, repeat: int, unclosed: int = 200) -> list:
+    rows = []
+    for size_kb in sizes_kb:
+        for label, html in (("clean", make_document(size_kb)), ("unclosed", make_document(size_kb, unclosed))):
+            current = parse_html_to_sections(html)
+            reference = reference_parse_html_to_sections(html)
+            old = _best_of(lambda: reference_parse_html_to_sections(html), repeat)
+            new = _best_of(lambda: parse_html_to_sections(html), repeat)
+            rows.append({
+                "case": label,
+                "kb": round(len(html.encode()) / 1024),
+                "sections": len(current),
+                "reference_ms": round(old * 1000, 2),
+                "single_pass_ms": round(new * 1000, 2),
+                "speedup": round(old / new, 2) if new else None,
+                "same_outline": _outline(current) == _outline(reference),
+            })
+    return rows
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--sizes-kb", default="100,500,1000,2000")
+    parser.add_argument("--repeat", type=int, default=5)
+    parser.add_argument("--unclosed", type=int, default=200, help="unclosed <h2> tags in the unclosed case")
+    args = parser.parse_args()
+
+    sizes = [int(s) for s in args.sizes_kb.split(",") if s]
+    print(f"{'case':>9} {'KB':>6} {'sections':>9} {'reference ms':>14} {'single-pass ms':>15} {'speedup':>8} {'same':>5}")
+    for row in run(sizes, args.repeat, args.unclosed):
+        print(f"{row['case']:>9} {row['kb']:>6} {row['sections']:>9} {row['reference_ms']:>14} "
+              f"{row['single_pass_ms']:>15} {row['speedup']:>7}x {str(row['same_outline']):>5}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,86 @@
+"""
+Benchmark: single-pass WordPress inline styler vs. the previous 17 re.sub passes.
+"cold" clears the fragment cache before every run; "republish" builds the styled
+content of an article again after one section was edited, as a second publish or
+export does. Output of both stylers is compared on the synthetic fragments, which
+contain none of the tags the old patterns mismatched (<pre>, <abbr>, <thead>, <link>).
+
+Usage (from the backend directory):
+    python -m benchmarks.bench_inline_styles [--sizes 1000,5000,20000,50000] [--repeat 5]
+"""
+
+import argparse
+import copy
+import time
+
+from wordpress_service import _apply_inline_styles, _build_styled_content
+from benchmarks.reference_inline_styles import apply_inline_styles as reference_apply_inline_styles
+from benchmarks.synthetic import make_article
+
+
+def _best_of(fn, repeat: int) -> float:
+    best = float("inf")
+    for _ in range(repeat):
+        start = time.perf_counter()
+        fn()
+        best = min(best, time.perf_counter() - start)
+    return best
+
+
+def _fragments(article: dict) -> list:
+    fragments = []
+    for section in article["sections"]:
+        fragments.append(section["content"])
+        fragments.extend(sub["content"] for sub in section.get("subsections", []))
+    return fragments
+
+
+def run(sizes: list, repeat: int) -> list:
+    rows = []
+    for words in sizes:
+        article = make_article(words)
+        fragments = _fragments(article)
+        same = all(_apply_inline_styles(f) == reference_apply_inline_styles(f) for f in fragments)
+
+        def cold():
+            _apply_inline_styles.cache_clear()
+            for fragment in fragments:
+                _apply_inline_styles(fragment)
+
+        edited = copy.deepcopy(article)
+        _build_styled_content(edited)
+
+        def republish():
+            edited["sections"][0]["content"] += "<p>Nowe zdanie.</p>"
+            _build_styled_content(edited)
+
+        old = _best_of(lambda: [reference_apply_inline_styles(f) for f in fragments], repeat)
+        new = _best_of(cold, repeat)
+        rows.append({
+            "words": words,
+            "fragments": len(fragments),
+            "reference_ms": round(old * 1000, 2),
+            "single_pass_ms": round(new * 1000, 2),
+            "speedup": round(old / new, 2) if new else None,
+            "republish_ms": round(_best_of(republish, repeat) * 1000, 2),
+            "same_output": same,
+        })
+    return rows
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--sizes", default="1000,5000,20000,50000")
+    parser.add_argument("--repeat", type=int, default=5)
+    args = parser.parse_args()
+
+    sizes = [int(s) for s in args.sizes.split(",") if s]
+    print(f"{'words':>8} {'fragments':>10} {'reference ms':>14} {'single-pass ms':>15} {'speedup':>8} "
+          f"{'republish ms':>13} {'same':>5}")
+    for row in run(sizes, args.repeat):
+        print(f"{row['words']:>8} {row['fragments']:>10} {row['reference_ms']:>14} {row['single_pass_ms']:>15} "
+              f"{row['speedup']:>7}x {row['republish_ms']:>13} {str(row['same_output']):>5}")
+
+
+if __name__ == "__main__":
+    main()
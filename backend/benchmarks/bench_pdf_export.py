@@ -0,0 +1,78 @@
+"""
+Benchmark: cached PDF engine vs. the previous generate_pdf_bytes, which registered
+the fonts and rebuilt every paragraph style on each export. "cold" clears the section
+flowable cache before every run; "re-export" renders the article again after one
+section was edited, as a second download does. Outputs differ on purpose (the engine
+keeps bold, lists and links), so only timings are compared.
+
+Usage (from the backend directory):
+    python -m benchmarks.bench_pdf_export [--sizes 1000,5000,20000] [--repeat 3]
+"""
+
+import argparse
+import copy
+import time
+
+from article_derived import build_derived
+from benchmarks.reference_pdf_export import generate_pdf_bytes as reference_generate_pdf_bytes
+from benchmarks.synthetic import make_article
+from pdf_engine import clear_pdf_cache, load_pdf_styles, render_article_pdf
+
+
+def _best_of(fn, repeat: int) -> float:
+    best = float("inf")
+    for _ in range(repeat):
+        start = time.perf_counter()
+        fn()
+        best = min(best, time.perf_counter() - start)
+    return best
+
+
+def run(sizes: list, repeat: int) -> list:
+    load_pdf_styles()
+    rows = []
+    for words in sizes:
+        article = make_article(words)
+        article["derived"] = build_derived(article["sections"])
+
+        def cold():
+            clear_pdf_cache()
+            render_article_pdf(article)
+
+        edited = copy.deepcopy(article)
+        render_article_pdf(edited)
+
+        def re_export():
+            edited["sections"][0]["content"] += "<p>Nowe zdanie.</p>"
+            edited["derived"] = build_derived(edited["sections"], edited["derived"])
+            render_article_pdf(edited)
+
+        old = _best_of(lambda: reference_generate_pdf_bytes(article), repeat)
+        new = _best_of(cold, repeat)
+        warm = _best_of(re_export, repeat)
+        rows.append({
+            "words": words,
+            "reference_ms": round(old * 1000, 2),
+            "cold_ms": round(new * 1000, 2),
+            "re_export_ms": round(warm * 1000, 2),
+            "speedup_cold": round(old / new, 2) if new else None,
+            "speedup_re_export": round(old / warm, 2) if warm else None,
+        })
+    return rows
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--sizes", default="1000,5000,20000")
+    parser.add_argument("--repeat", type=int, default=3)
+    args = parser.parse_args()
+
+    sizes = [int(s) for s in args.sizes.split(",") if s]
+    print(f"{'words':>8} {'reference ms':>14} {'cold ms':>10} {'re-export ms':>13} {'cold x':>7} {'re-export x':>12}")
+    for row in run(sizes, args.repeat):
+        print(f"{row['words']:>8} {row['reference_ms']:>14} {row['cold_ms']:>10} {row['re_export_ms']:>13} "
+              f"{row['speedup_cold']:>6}x {row['speedup_re_export']:>11}x")
+
+
+if __name__ == "__main__":
+    main()
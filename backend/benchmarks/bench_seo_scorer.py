@@ -0,0 +1,83 @@
+"""
+Benchmark: compute_seo_score with the token index vs. the previous implementation.
+Cold runs clear the per-section cache first; "one-shot" runs bypass the cache, as
+batch rescoring does; "edit" rescoring changes one section of an already scored
+article, as the editor does on save. Keyword matching is
+inflection-aware since the reference was frozen, so scores may differ slightly;
+both percentages are reported.
+
+Usage (from the backend directory):
+    python -m benchmarks.bench_seo_scorer [--sizes 5000,10000,20000,50000] [--repeat 5] [--secondary 5]
+"""
+
+import argparse
+import copy
+import time
+
+from seo_scorer import compute_seo_score, clear_section_cache
+from benchmarks.reference_seo_scorer import compute_seo_score as reference_compute_seo_score
+from benchmarks.synthetic import make_article, make_keywords
+
+
+def _best_of(fn, repeat: int) -> float:
+    best = float("inf")
+    for _ in range(repeat):
+        start = time.perf_counter()
+        fn()
+        best = min(best, time.perf_counter() - start)
+    return best
+
+
+def run(sizes: list, repeat: int, secondary: int = 5) -> list:
+    rows = []
+    for words in sizes:
+        article = make_article(words, secondary_keywords=make_keywords(secondary))
+        pk = article["primary_keyword"]
+        sks = article["secondary_keywords"]
+        
+        current = compute_seo_score(article, pk, sks)
+        reference = reference_compute_seo_score(article, pk, sks)
+        
+        def cold():
+            clear_section_cache()
+            compute_seo_score(article, pk, sks)
+        
+        edited = copy.deepcopy(article)
+        
+        def edit():
+            edited["sections"][0]["content"] += "<p>Nowe zdanie.</p>"
+            compute_seo_score(edited, pk, sks)
+        
+        old = _best_of(lambda: reference_compute_seo_score(article, pk, sks), repeat)
+        new = _best_of(cold, repeat)
+        oneshot = _best_of(lambda: compute_seo_score(article, pk, sks, use_cache=False), repeat)
+        compute_seo_score(edited, pk, sks)
+        warm = _best_of(edit, repeat)
+        rows.append({
+            "words": current["word_count"],
+            "reference_ms": round(old * 1000, 2),
+            "indexed_ms": round(new * 1000, 2),
+            "speedup": round(old / new, 2) if new else None,
+            "oneshot_ms": round(oneshot * 1000, 2),
+            "edit_ms": round(warm * 1000, 2),
+            "score": current["percentage"],
+            "reference_score": reference["percentage"],
+        })
+    return rows
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--sizes", default="5000,10000,20000,50000")
+    parser.add_argument("--repeat", type=int, default=5)
+    parser.add_argument("--secondary", type=int, default=5, help="number of secondary keywords")
+    args = parser.parse_args()
+    
+    sizes = [int(s) for s in args.sizes.split(",") if s]
+    print(f"{'words':>8} {'reference ms':>14} {'indexed ms':>12} {'speedup':>8} {'one-shot ms':>12} {'edit ms':>9} {'score':>7}")
+    for row in run(sizes, args.repeat, args.secondary):
+        print(f"{row['words']:>8} {row['reference_ms']:>14} {row['indexed_ms']:>12} {row['speedup']:>7}x {row['oneshot_ms']:>12} {row['edit_ms']:>9} {row['score']:>3}/{row['reference_score']:<3}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,118 @@
+"""
+Frozen copy of the sequential re.sub inline styler from wordpress_service.py
+before the single-pass styler was introduced. Used by the benchmarks as the
+timing baseline.
+"""
+
+import re
+
+from wordpress_service import (
+    STYLE_A, STYLE_BLOCKQUOTE, STYLE_CALLOUT_INFO, STYLE_CALLOUT_TIP, STYLE_CALLOUT_WARNING, STYLE_H2,
+    STYLE_H3, STYLE_HR, STYLE_IMG, STYLE_LI, STYLE_OL, STYLE_P, STYLE_STRONG, STYLE_TABLE, STYLE_TD,
+    STYLE_TH, STYLE_UL,
+)
+
+
+def apply_inline_styles(html_fragment: str) -> str:
+    """Apply inline styles to HTML elements within a content fragment."""
+    # h2 (skip ones already inside styled containers)
+    html_fragment = re.sub(
+        r'<h2([^>]*)>',
+        lambda m: f'<h2{m.group(1)} style="{STYLE_H2}">',
+        html_fragment
+    )
+    # h3
+    html_fragment = re.sub(
+        r'<h3([^>]*)>',
+        lambda m: f'<h3{m.group(1)} style="{STYLE_H3}">',
+        html_fragment
+    )
+    # p
+    html_fragment = re.sub(
+        r'<p([^>]*)>',
+        lambda m: f'<p{m.group(1)} style="{STYLE_P}">',
+        html_fragment
+    )
+    # ul
+    html_fragment = re.sub(
+        r'<ul([^>]*)>',
+        lambda m: f'<ul{m.group(1)} style="{STYLE_UL}">',
+        html_fragment
+    )
+    # ol
+    html_fragment = re.sub(
+        r'<ol([^>]*)>',
+        lambda m: f'<ol{m.group(1)} style="{STYLE_OL}">',
+        html_fragment
+    )
+    # li
+    html_fragment = re.sub(
+        r'<li([^>]*)>',
+        lambda m: f'<li{m.group(1)} style="{STYLE_LI}">',
+        html_fragment
+    )
+    # strong
+    html_fragment = re.sub(
+        r'<strong([^>]*)>',
+        lambda m: f'<strong{m.group(1)} style="{STYLE_STRONG}">',
+        html_fragment
+    )
+    # a
+    html_fragment = re.sub(
+        r'<a([^>]*)>',
+        lambda m: f'<a{m.group(1)} style="{STYLE_A}">',
+        html_fragment
+    )
+    # blockquote
+    html_fragment = re.sub(
+        r'<blockquote([^>]*)>',
+        lambda m: f'<blockquote{m.group(1)} style="{STYLE_BLOCKQUOTE}">',
+        html_fragment
+    )
+    # hr
+    html_fragment = re.sub(
+        r'<hr([^>]*)(/?)>',
+        lambda m: f'<hr{m.group(1)} style="{STYLE_HR}"{m.group(2)}>',
+        html_fragment
+    )
+    # img
+    html_fragment = re.sub(
+        r'<img([^>]*)>',
+        lambda m: f'<img{m.group(1)} style="{STYLE_IMG}">',
+        html_fragment
+    )
+    # table
+    html_fragment = re.sub(
+        r'<table([^>]*)>',
+        lambda m: f'<table{m.group(1)} style="{STYLE_TABLE}">',
+        html_fragment
+    )
+    # th
+    html_fragment = re.sub(
+        r'<th([^>]*)>',
+        lambda m: f'<th{m.group(1)} style="{STYLE_TH}">',
+        html_fragment
+    )
+    # td
+    html_fragment = re.sub(
+        r'<td([^>]*)>',
+        lambda m: f'<td{m.group(1)} style="{STYLE_TD}">',
+        html_fragment
+    )
+    # callout divs
+    html_fragment = re.sub(
+        r'<div([^>]*class="[^"]*callout-tip[^"]*"[^>]*)>',
+        lambda m: f'<div{m.group(1)} style="{STYLE_CALLOUT_TIP}">',
+        html_fragment
+    )
+    html_fragment = re.sub(
+        r'<div([^>]*class="[^"]*callout-warning[^"]*"[^>]*)>',
+        lambda m: f'<div{m.group(1)} style="{STYLE_CALLOUT_WARNING}">',
+        html_fragment
+    )
+    html_fragment = re.sub(
+        r'<div([^>]*class="[^"]*callout-info[^"]*"[^>]*)>',
+        lambda m: f'<div{m.group(1)} style="{STYLE_CALLOUT_INFO}">',
+        html_fragment
+    )
+    return html_fragment
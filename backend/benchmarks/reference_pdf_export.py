@@ -0,0 +1,145 @@
+"""
+Frozen copy of export_service.generate_pdf_bytes before the cached PDF engine
+(fonts registered and styles rebuilt on every call, section text stripped to plain
+paragraphs). Used only by benchmarks/bench_pdf_export.py as the baseline.
+"""
+
+import io
+import os
+
+from reportlab.lib.pagesizes import A4
+from reportlab.lib.styles import getSampleStyleSheet, ParagraphStyle
+from reportlab.platypus import SimpleDocTemplate, Paragraph, Spacer
+from reportlab.lib.units import cm
+from reportlab.lib.enums import TA_JUSTIFY, TA_CENTER
+from reportlab.pdfbase import pdfmetrics
+from reportlab.pdfbase.ttfonts import TTFont
+
+from article_derived import get_derived
+
+# Characters that ReportLab's Paragraph markup parser would choke on
+_PDF_UNSAFE_CHARS = str.maketrans('', '', '<>&')
+
+
+def generate_pdf_bytes(article: dict) -> bytes:
+    """Generate PDF from article. Returns PDF bytes."""
+    # Register Polish-compatible fonts
+    FONT_PATH = '/usr/share/fonts/truetype/dejavu/'
+    pdfmetrics.registerFont(TTFont('DejaVuSans', os.path.join(FONT_PATH, 'DejaVuSans.ttf')))
+    pdfmetrics.registerFont(TTFont('DejaVuSans-Bold', os.path.join(FONT_PATH, 'DejaVuSans-Bold.ttf')))
+
+    buffer = io.BytesIO()
+    doc = SimpleDocTemplate(
+        buffer,
+        pagesize=A4,
+        rightMargin=2*cm,
+        leftMargin=2*cm,
+        topMargin=2*cm,
+        bottomMargin=2*cm
+    )
+    
+    styles = getSampleStyleSheet()
+    
+    # Custom styles with DejaVuSans (supports Polish diacritics)
+    title_style = ParagraphStyle(
+        'ArticleTitle',
+        parent=styles['Title'],
+        fontName='DejaVuSans-Bold',
+        fontSize=20,
+        spaceAfter=20,
+        alignment=TA_CENTER
+    )
+    
+    h2_style = ParagraphStyle(
+        'H2Style',
+        parent=styles['Heading2'],
+        fontName='DejaVuSans-Bold',
+        fontSize=16,
+        spaceBefore=20,
+        spaceAfter=10,
+        textColor='#04389E'
+    )
+    
+    h3_style = ParagraphStyle(
+        'H3Style',
+        parent=styles['Heading3'],
+        fontName='DejaVuSans-Bold',
+        fontSize=13,
+        spaceBefore=12,
+        spaceAfter=6,
+        textColor='#1a3a6e'
+    )
+    
+    body_style = ParagraphStyle(
+        'BodyText2',
+        parent=styles['BodyText'],
+        fontName='DejaVuSans',
+        fontSize=10,
+        leading=14,
+        alignment=TA_JUSTIFY,
+        spaceAfter=8
+    )
+    
+    faq_q_style = ParagraphStyle(
+        'FAQQuestion',
+        parent=styles['Heading4'],
+        fontName='DejaVuSans-Bold',
+        fontSize=11,
+        spaceBefore=10,
+        spaceAfter=4,
+        textColor='#04389E'
+    )
+    
+    elements = []
+    
+    # Title
+    title = article.get("title", "Artykuł")
+    elements.append(Paragraph(title, title_style))
+    elements.append(Spacer(1, 12))
+    
+    # Sections (plain text comes from the derived representation)
+    for section, derived in zip(article.get("sections", []), get_derived(article)["sections"]):
+        elements.append(Paragraph(section.get("heading", ""), h2_style))
+        
+        content = derived["text"]
+        # Split into paragraphs
+        for para in content.split("\n"):
+            para = para.strip()
+            if para:
+                try:
+                    elements.append(Paragraph(para, body_style))
+                except Exception:
+                    elements.append(Paragraph(para.translate(_PDF_UNSAFE_CHARS), body_style))
+        
+        for sub, derived_sub in zip(section.get("subsections", []), derived["subsections"]):
+            elements.append(Paragraph(sub.get("heading", ""), h3_style))
+            sub_content = derived_sub["text"]
+            for para in sub_content.split("\n"):
+                para = para.strip()
+                if para:
+                    try:
+                        elements.append(Paragraph(para, body_style))
+                    except Exception:
+                        elements.append(Paragraph(para.translate(_PDF_UNSAFE_CHARS), body_style))
+    
+    # FAQ
+    elements.append(Spacer(1, 20))
+    elements.append(Paragraph("Najczesciej zadawane pytania (FAQ)", h2_style))
+    for faq in article.get("faq", []):
+        elements.append(Paragraph(faq.get("question", ""), faq_q_style))
+        try:
+            elements.append(Paragraph(faq.get("answer", ""), body_style))
+        except Exception:
+            elements.append(Paragraph(faq.get("answer", "").translate(_PDF_UNSAFE_CHARS), body_style))
+    
+    # Sources
+    elements.append(Spacer(1, 20))
+    elements.append(Paragraph("Zrodla", h2_style))
+    for src in article.get("sources", []):
+        try:
+            elements.append(Paragraph(f"- {src.get('name', '')} ({src.get('url', '')})", body_style))
+        except Exception:
+            elements.append(Paragraph(f"- {src.get('name', '')}", body_style))
+    
+    doc.build(elements)
+    return buffer.getvalue()
@@ -0,0 +1,241 @@
+"""
+Micro-benchmark suite for the pure CPU hot paths (scoring, HTML parsing, styling, export).
+Runs every benchmark on synthetic articles of several sizes, records ops/sec and
+peak memory (tracemalloc), writes the results as JSON and compares them with a
+saved baseline. Exits with status 1 when a benchmark regressed beyond the threshold.
+
+Usage (from the backend directory):
+    python -m benchmarks.suite                       # run, write results/latest.json, compare
+    python -m benchmarks.suite --save-baseline       # run and store results/baseline.json
+    python -m benchmarks.suite --only compute_seo_score,slugify --sizes 1000,5000
+"""
+
+import argparse
+import json
+import platform
+import sys
+import time
+import tracemalloc
+from datetime import datetime, timezone
+from pathlib import Path
+
+from benchmarks.synthetic import make_article, make_html
+
+RESULTS_DIR = Path(__file__).parent / "results"
+DEFAULT_SIZES = [1000, 5000, 20000, 50000]
+# Allowed slowdown (ops/sec) and memory growth before a result counts as a regression
+DEFAULT_THRESHOLD = 0.2
+
+
+def _bench_compute_seo_score(article: dict):
+    from seo_scorer import compute_seo_score, clear_section_cache
+
+    def run():
+        clear_section_cache()
+        compute_seo_score(article, article["primary_keyword"], article["secondary_keywords"])
+    return run
+
+
+def _bench_parse_html_to_sections(article: dict):
+    from html_sections import parse_html_to_sections
+    html = make_html(article)
+    return lambda: parse_html_to_sections(html)
+
+
+def _bench_slugify(article: dict):
+    from text_core import slugify
+    headings = [s["heading"] for s in article["sections"]]
+    headings += [sub["heading"] for s in article["sections"] for sub in s.get("subsections", [])]
+
+    def run():
+        for heading in headings:
+            slugify(heading)
+    return run
+
+
+def _bench_apply_inline_styles(article: dict):
+    from wordpress_service import _apply_inline_styles
+    html = make_html(article)
+
+    def run():
+        _apply_inline_styles.cache_clear()
+        _apply_inline_styles(html)
+    return run
+
+
+def _bench_build_styled_content(article: dict):
+    from wordpress_service import _apply_inline_styles, _build_styled_content
+
+    def run():
+        _apply_inline_styles.cache_clear()
+        _build_styled_content(article)
+    return run
+
+
+def _bench_generate_full_html(article: dict):
+    from export_service import generate_full_html
+    return lambda: generate_full_html(article)
+
+
+def _bench_generate_pdf_bytes(article: dict):
+    from export_service import generate_pdf_bytes
+    from pdf_engine import clear_pdf_cache
+
+    def run():
+        clear_pdf_cache()
+        generate_pdf_bytes(article)
+    return run
+
+
+def _bench_analyze_readability(article: dict):
+    from readability import analyze_readability
+    return lambda: analyze_readability([article])
+
+
+# name -> factory(article) returning a zero-argument callable
+BENCHMARKS = {
+    "compute_seo_score": _bench_compute_seo_score,
+    "parse_html_to_sections": _bench_parse_html_to_sections,
+    "slugify": _bench_slugify,
+    "_apply_inline_styles": _bench_apply_inline_styles,
+    "_build_styled_content": _bench_build_styled_content,
+    "generate_full_html": _bench_generate_full_html,
+    "generate_pdf_bytes": _bench_generate_pdf_bytes,
+    "analyze_readability": _bench_analyze_readability,
+}
+
+# Former benchmark names -> current ones. Names are part of the results format:
+# never rename an entry without adding its old name here, so saved baselines still line up.
+BENCHMARK_ALIASES = {
+    "_parse_html_to_sections": "parse_html_to_sections",
+    "_slugify": "slugify",
+}
+
+
+def _canonical_results(results: dict) -> dict:
+    """Results keyed by current benchmark names (older runs may use aliased names)."""
+    canonical = {}
+    for name, by_size in results.items():
+        canonical.setdefault(BENCHMARK_ALIASES.get(name, name), {}).update(by_size)
+    return canonical
+
+
+def measure(fn, min_time: float, max_runs: int) -> dict:
+    """Time `fn` (one warm-up call, then runs until min_time or max_runs) and measure peak memory of one call."""
+    fn()
+    timings = []
+    total = 0.0
+    while not timings or (total < min_time and len(timings) < max_runs):
+        start = time.perf_counter()
+        fn()
+        elapsed = time.perf_counter() - start
+        timings.append(elapsed)
+        total += elapsed
+
+    tracemalloc.start()
+    try:
+        fn()
+        _, peak = tracemalloc.get_traced_memory()
+    finally:
+        tracemalloc.stop()
+
+    return {
+        "runs": len(timings),
+        "ops_per_sec": round(len(timings) / total, 2),
+        "mean_ms": round(total / len(timings) * 1000, 3),
+        "best_ms": round(min(timings) * 1000, 3),
+        "peak_kb": round(peak / 1024, 1),
+    }
+
+
+def run_suite(sizes: list, names: list, min_time: float = 0.5, max_runs: int = 50) -> dict:
+    """Run the selected benchmarks; returns {"meta": ..., "results": {name: {size: stats}}}."""
+    articles = {size: make_article(size) for size in sizes}
+    results = {}
+    for name in names:
+        results[name] = {}
+        for size in sizes:
+            try:
+                fn = BENCHMARKS[name](articles[size])
+                stats = measure(fn, min_time, max_runs)
+            except ImportError as e:
+                stats = {"skipped": f"missing dependency: {e}"}
+            results[name][str(size)] = stats
+            shown = stats.get("skipped") or f"{stats['ops_per_sec']:>10} ops/s {stats['mean_ms']:>10} ms {stats['peak_kb']:>10} KB"
+            print(f"{name:<26} {size:>7} {shown}", flush=True)
+    return {
+        "meta": {
+            "timestamp": datetime.now(timezone.utc).isoformat(),
+            "python": platform.python_version(),
+            "platform": platform.platform(),
+            "sizes": sizes,
+            "min_time": min_time,
+            "max_runs": max_runs,
+        },
+        "results": results,
+    }
+
+
+def compare(current: dict, baseline: dict, threshold: float = DEFAULT_THRESHOLD) -> list:
+    """Regressions of `current` against `baseline`: slower by more than threshold or using more memory."""
+    regressions = []
+    baseline_results = _canonical_results(baseline.get("results", {}))
+    for name, by_size in _canonical_results(current["results"]).items():
+        for size, stats in by_size.items():
+            base = baseline_results.get(name, {}).get(size)
+            if not base or "skipped" in base or "skipped" in stats:
+                continue
+            if stats["ops_per_sec"] < base["ops_per_sec"] * (1 - threshold):
+                regressions.append({
+                    "benchmark": name, "size": size, "metric": "ops_per_sec",
+                    "baseline": base["ops_per_sec"], "current": stats["ops_per_sec"]
+                })
+            if base["peak_kb"] and stats["peak_kb"] > base["peak_kb"] * (1 + threshold):
+                regressions.append({
+                    "benchmark": name, "size": size, "metric": "peak_kb",
+                    "baseline": base["peak_kb"], "current": stats["peak_kb"]
+                })
+    return regressions
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--sizes", default=",".join(str(s) for s in DEFAULT_SIZES))
+    parser.add_argument("--only", default="", help="comma-separated benchmark names")
+    parser.add_argument("--min-time", type=float, default=0.5, help="seconds of timed runs per case")
+    parser.add_argument("--max-runs", type=int, default=50)
+    parser.add_argument("--output", default=str(RESULTS_DIR / "latest.json"))
+    parser.add_argument("--baseline", default=str(RESULTS_DIR / "baseline.json"))
+    parser.add_argument("--threshold", type=float, default=DEFAULT_THRESHOLD)
+    parser.add_argument("--save-baseline", action="store_true", help="store the results as the new baseline")
+    args = parser.parse_args()
+
+    sizes = [int(s) for s in args.sizes.split(",") if s]
+    names = [BENCHMARK_ALIASES.get(n, n) for n in args.only.split(",") if n] or list(BENCHMARKS)
+    unknown = [n for n in names if n not in BENCHMARKS]
+    if unknown:
+        parser.error(f"unknown benchmarks: {', '.join(unknown)}")
+
+    current = run_suite(sizes, names, args.min_time, args.max_runs)
+
+    output = Path(args.baseline if args.save_baseline else args.output)
+    output.parent.mkdir(parents=True, exist_ok=True)
+    output.write_text(json.dumps(current, indent=2))
+    print(f"Results written to {output}")
+    if args.save_baseline:
+        return 0
+
+    baseline_path = Path(args.baseline)
+    if not baseline_path.exists():
+        print(f"No baseline at {baseline_path}; run with --save-baseline to create one")
+        return 0
+    regressions = compare(current, json.loads(baseline_path.read_text()), args.threshold)
+    for r in regressions:
+        print(f"REGRESSION {r['benchmark']} @ {r['size']} words: {r['metric']} {r['baseline']} -> {r['current']}")
+    if not regressions:
+        print(f"No regressions against {baseline_path} (threshold {args.threshold:.0%})")
+    return 1 if regressions else 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
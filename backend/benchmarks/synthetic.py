@@ -0,0 +1,144 @@
+"""
+Deterministic synthetic Polish accounting articles for benchmarks.
+"""
+
+import random
+
+_VOCABULARY = (
+    "podatek podatku podatkiem podatki podatków faktura faktury fakturze fakturą "
+    "przedsiębiorca przedsiębiorcy przedsiębiorców księgowość księgowości księgowe "
+    "rozliczenie rozliczenia rozliczeniu ulga ulgi ulgę ulgami składka składki składek "
+    "zus vat pit cit jpk kasa fiskalna koszty kosztów kosztach przychód przychodu "
+    "działalność działalności gospodarcza gospodarczej termin terminu deklaracja deklaracji "
+    "urząd skarbowy skarbowego ewidencja ewidencji odliczenie odliczenia zaliczka zaliczki "
+    "ryczałt ryczałtu skala podatkowa liniowy liniowego pracownik pracownika wynagrodzenie "
+    "wynagrodzenia umowa umowy zlecenie dzieło biuro rachunkowe rachunkowego klient klienta "
+    "ważne należy pamiętać zgodnie przepisami ustawy obowiązek obowiązku miesięcznie rocznie"
+).split()
+
+_CONNECTORS = ["w", "z", "i", "do", "na", "dla", "oraz", "przez", "od", "po", "że", "który"]
+
+
+def _sentence(rng: random.Random, keyword: str, keyword_rate: float) -> str:
+    length = rng.randint(6, 22)
+    words = []
+    for _ in range(length):
+        roll = rng.random()
+        if roll < keyword_rate:
+            words.append(keyword)
+        elif roll < 0.25:
+            words.append(rng.choice(_CONNECTORS))
+        else:
+            words.append(rng.choice(_VOCABULARY))
+    sentence = " ".join(words)
+    return sentence[0].upper() + sentence[1:] + rng.choice([".", ".", ".", "!", "?"])
+
+
+def _paragraph(rng: random.Random, keyword: str, keyword_rate: float, words_budget: int) -> tuple:
+    sentences = []
+    used = 0
+    while used < words_budget:
+        s = _sentence(rng, keyword, keyword_rate)
+        used += len(s.split())
+        sentences.append(s)
+    text = " ".join(sentences)
+    style = rng.random()
+    if style < 0.15:
+        items = "".join(f"<li>{s}</li>" for s in sentences)
+        return f"<ul>{items}</ul>", used
+    if style < 0.3:
+        first, _, rest = text.partition(" ")
+        return f"<p><strong>{first}</strong> {rest}</p>", used
+    if style < 0.35:
+        return f'<div class="callout callout-tip"><p>{text}</p></div>', used
+    return f"<p>{text}</p>", used
+
+
+def make_article(words: int, seed: int = 42, primary_keyword: str = "podatek vat",
+                 secondary_keywords: list = None) -> dict:
+    """Build an article dict with roughly `words` words of body text."""
+    rng = random.Random(seed)
+    secondary_keywords = secondary_keywords if secondary_keywords is not None else [
+        "faktura vat", "ulga na start", "kasa fiskalna", "jpk vat", "składki zus"
+    ]
+    keywords = [primary_keyword] + secondary_keywords
+    
+    section_count = max(3, min(40, words // 600))
+    per_section = words // section_count
+    sections = []
+    for i in range(section_count):
+        heading_kw = primary_keyword if i % 3 == 0 else rng.choice(_VOCABULARY)
+        section_words = per_section // 2
+        content = []
+        used = 0
+        while used < section_words:
+            html, n = _paragraph(rng, rng.choice(keywords), 0.01, rng.randint(40, 120))
+            content.append(html)
+            used += n
+        subsections = []
+        for j in range(2):
+            sub_content = []
+            sub_used = 0
+            while sub_used < per_section // 4:
+                html, n = _paragraph(rng, rng.choice(keywords), 0.01, rng.randint(40, 120))
+                sub_content.append(html)
+                sub_used += n
+            subsections.append({
+                "heading": f"Podsekcja {i + 1}.{j + 1} {rng.choice(_VOCABULARY)}",
+                "anchor": f"podsekcja-{i + 1}-{j + 1}",
+                "content": "\n".join(sub_content),
+            })
+        sections.append({
+            "heading": f"Rozdział {i + 1}: {heading_kw} {rng.choice(_VOCABULARY)}",
+            "anchor": f"rozdzial-{i + 1}",
+            "content": "\n".join(content),
+            "subsections": subsections,
+        })
+    
+    return {
+        "id": f"bench-{words}-{seed}",
+        "title": f"{primary_keyword.capitalize()} - kompletny przewodnik dla przedsiębiorców",
+        "slug": f"przewodnik-{words}",
+        "meta_title": f"{primary_keyword.capitalize()} 2026 - przewodnik",
+        "meta_description": (
+            f"Sprawdź, jak rozliczyć {primary_keyword} w 2026 roku. Praktyczny przewodnik "
+            "dla przedsiębiorców: terminy, ulgi, obowiązki i najczęstsze błędy w rozliczeniach."
+        ),
+        "primary_keyword": primary_keyword,
+        "secondary_keywords": secondary_keywords,
+        "toc": [{"label": s["heading"], "anchor": s["anchor"]} for s in sections],
+        "sections": sections,
+        "faq": [
+            {
+                "question": f"Jak rozliczyć {primary_keyword}? ({k + 1})",
+                "answer": " ".join(_sentence(rng, primary_keyword, 0.02) for _ in range(3)),
+            }
+            for k in range(6)
+        ],
+        "internal_link_suggestions": [
+            {"anchor_text": kw, "target_keyword": kw, "suggested_context": ""} for kw in secondary_keywords[:3]
+        ],
+        "sources": [
+            {"name": "Ustawa o VAT", "url": "https://isap.sejm.gov.pl/", "type": "ustawa"},
+            {"name": "Portal podatkowy", "url": "https://www.podatki.gov.pl/", "type": "portal"},
+            {"name": "ZUS", "url": "https://www.zus.pl/", "type": "instytucja"},
+        ],
+    }
+
+
+def make_keywords(count: int, seed: int = 7) -> list:
+    """Two-word secondary keyword phrases drawn from the synthetic vocabulary."""
+    rng = random.Random(seed)
+    return [f"{rng.choice(_VOCABULARY)} {rng.choice(_VOCABULARY)}" for _ in range(count)]
+
+
+def make_html(article: dict) -> str:
+    """Editor HTML (as sent in html_content) for a synthetic article."""
+    parts = [f"<h1>{article['title']}</h1>"]
+    for section in article["sections"]:
+        parts.append(f'<h2 id="{section["anchor"]}">{section["heading"]}</h2>')
+        parts.append(section["content"])
+        for sub in section.get("subsections", []):
+            parts.append(f'<h3 id="{sub["anchor"]}">{sub["heading"]}</h3>')
+            parts.append(sub["content"])
+    return "\n".join(parts)
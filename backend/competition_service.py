@@ -9,6 +9,9 @@ import httpx
 from bs4 import BeautifulSoup
 from emergentintegrations.llm.chat import LlmChat, UserMessage
 
+from article_derived import get_derived
+from cpu_executor import run_cpu
+
 logger = logging.getLogger(__name__)
 
 COMPETITION_PROMPT = """Porownaj dwa artykuly pod katem SEO. Znajdz przewagi i slabosci.
@@ -70,53 +73,60 @@ Odpowiedz WYLACZNIE JSON-em:
 }}"""
 
 
+def _extract_competitor(html: str, url: str) -> dict:
+    """Title, headings and text sample of a competitor page (blocking BeautifulSoup work)."""
+    soup = BeautifulSoup(html, "html.parser")
+
+    title = soup.find("title")
+    title_text = title.get_text(strip=True) if title else ""
+
+    meta_desc = ""
+    md_tag = soup.find("meta", attrs={"name": "description"})
+    if md_tag:
+        meta_desc = md_tag.get("content", "")
+
+    headings = []
+    for tag in ["h1", "h2", "h3"]:
+        for h in soup.find_all(tag):
+            headings.append(f"{tag.upper()}: {h.get_text(strip=True)}")
+
+    for tag in soup(["script", "style", "nav", "footer", "header", "aside"]):
+        tag.decompose()
+
+    article = soup.find("article") or soup.find("main") or soup.find("body")
+    text = article.get_text(separator=" ", strip=True) if article else ""
+
+    return {
+        "url": url,
+        "title": title_text,
+        "meta_desc": meta_desc,
+        "headings": headings[:15],
+        "word_count": len(text.split()),
+        "content_sample": text[:3000]
+    }
+
+
 async def scrape_competitor(url: str) -> dict:
     """Scrape competitor article."""
     async with httpx.AsyncClient(timeout=30.0, follow_redirects=True, verify=False) as client:
         headers = {"User-Agent": "Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36"}
         response = await client.get(url, headers=headers)
         response.raise_for_status()
-        soup = BeautifulSoup(response.text, "html.parser")
-
-        title = soup.find("title")
-        title_text = title.get_text(strip=True) if title else ""
-
-        meta_desc = ""
-        md_tag = soup.find("meta", attrs={"name": "description"})
-        if md_tag:
-            meta_desc = md_tag.get("content", "")
-
-        headings = []
-        for tag in ["h1", "h2", "h3"]:
-            for h in soup.find_all(tag):
-                headings.append(f"{tag.upper()}: {h.get_text(strip=True)}")
-
-        for tag in soup(["script", "style", "nav", "footer", "header", "aside"]):
-            tag.decompose()
-
-        article = soup.find("article") or soup.find("main") or soup.find("body")
-        text = article.get_text(separator=" ", strip=True) if article else ""
 
-        return {
-            "url": url,
-            "title": title_text,
-            "meta_desc": meta_desc,
-            "headings": headings[:15],
-            "word_count": len(text.split()),
-            "content_sample": text[:3000]
-        }
+    return await run_cpu(_extract_competitor, response.text, url)
 
 
 async def analyze_competition(my_article: dict, competitor_url: str, emergent_key: str) -> dict:
     """Compare your article against a competitor."""
     comp = await scrape_competitor(competitor_url)
 
-    sections_str = ", ".join([s.get("heading", "") for s in my_article.get("sections", [])][:10]) or "brak"
+    derived = get_derived(my_article)
+    sections_str = ", ".join([h["heading"] for h in derived["outline"] if h["level"] == 2][:10]) or "brak"
 
     prompt = COMPETITION_PROMPT.format(
         my_title=my_article.get("title", ""),
         my_keyword=my_article.get("primary_keyword", ""),
-        my_word_count=len(str(my_article.get("sections", "")).split()),
+        my_word_count=derived["word_count"],
         my_sections=sections_str,
         my_meta_title=my_article.get("meta_title", ""),
         my_meta_desc=my_article.get("meta_description", ""),
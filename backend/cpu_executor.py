@@ -0,0 +1,154 @@
+"""
+CPU offload for blocking work inside async handlers.
+PDF rendering, SEO scoring, HTML parsing and bcrypt run synchronously; called
+directly from an `async def` handler they stall every other request until they
+finish. `run_cpu` moves them off the event loop onto a bounded thread pool that
+the app starts and stops with its lifespan, and keeps queue and timing metrics
+per task.
+
+The pool threads share the GIL, so this is not CPU parallelism: pure-Python work
+(scoring, regex, HTML building) still runs one call at a time, it only stops
+blocking the loop. Only calls that release the GIL (bcrypt, zlib) overlap.
+
+Sizing comes from the environment:
+    CPU_EXECUTOR_WORKERS   pool threads (default: CPU count, capped at 8)
+"""
+
+import asyncio
+import functools
+import logging
+import os
+import threading
+import time
+from concurrent.futures import ThreadPoolExecutor
+from typing import Any, Callable, Optional
+
+logger = logging.getLogger(__name__)
+
+DEFAULT_MAX_WORKERS = 8
+
+
+def configured_workers() -> int:
+    """Pool size from CPU_EXECUTOR_WORKERS, else the CPU count capped at DEFAULT_MAX_WORKERS."""
+    value = os.environ.get("CPU_EXECUTOR_WORKERS", "")
+    if value.isdigit() and int(value) > 0:
+        return int(value)
+    return min(os.cpu_count() or 1, DEFAULT_MAX_WORKERS)
+
+
+class _TaskStats:
+    __slots__ = ("submitted", "completed", "failed", "wait_ms", "run_ms", "max_wait_ms", "max_run_ms")
+
+    def __init__(self):
+        self.submitted = self.completed = self.failed = 0
+        self.wait_ms = self.run_ms = self.max_wait_ms = self.max_run_ms = 0.0
+
+    def as_dict(self) -> dict:
+        finished = self.completed + self.failed
+        return {
+            "submitted": self.submitted,
+            "completed": self.completed,
+            "failed": self.failed,
+            "avg_wait_ms": round(self.wait_ms / finished, 3) if finished else 0.0,
+            "max_wait_ms": round(self.max_wait_ms, 3),
+            "avg_run_ms": round(self.run_ms / finished, 3) if finished else 0.0,
+            "max_run_ms": round(self.max_run_ms, 3),
+        }
+
+
+class CpuExecutor:
+    """Thread pool for blocking calls, with queue depth and per-task wait/run times."""
+
+    def __init__(self, max_workers: int):
+        self.max_workers = max_workers
+        self._pool = ThreadPoolExecutor(max_workers=max_workers, thread_name_prefix="cpu")
+        self._lock = threading.Lock()
+        self._stats = {}
+        self.queued = 0
+        self.running = 0
+        self.max_queued = 0
+
+    def _call(self, name: str, submitted_at: float, fn: Callable, args: tuple, kwargs: dict) -> Any:
+        started = time.perf_counter()
+        with self._lock:
+            self.queued -= 1
+            self.running += 1
+        failed = True
+        try:
+            result = fn(*args, **kwargs)
+            failed = False
+            return result
+        finally:
+            finished = time.perf_counter()
+            wait_ms = (started - submitted_at) * 1000
+            run_ms = (finished - started) * 1000
+            with self._lock:
+                self.running -= 1
+                stats = self._stats[name]
+                if failed:
+                    stats.failed += 1
+                else:
+                    stats.completed += 1
+                stats.wait_ms += wait_ms
+                stats.run_ms += run_ms
+                stats.max_wait_ms = max(stats.max_wait_ms, wait_ms)
+                stats.max_run_ms = max(stats.max_run_ms, run_ms)
+
+    async def run(self, fn: Callable, *args, **kwargs) -> Any:
+        """Run `fn(*args, **kwargs)` on the pool and await its result (exceptions propagate)."""
+        name = getattr(fn, "__qualname__", None) or getattr(fn, "__name__", None) or repr(fn)
+        with self._lock:
+            self._stats.setdefault(name, _TaskStats()).submitted += 1
+            self.queued += 1
+            self.max_queued = max(self.max_queued, self.queued)
+        loop = asyncio.get_running_loop()
+        call = functools.partial(self._call, name, time.perf_counter(), fn, args, kwargs)
+        return await loop.run_in_executor(self._pool, call)
+
+    def metrics(self) -> dict:
+        with self._lock:
+            return {
+                "max_workers": self.max_workers,
+                "queued": self.queued,
+                "running": self.running,
+                "max_queued": self.max_queued,
+                "tasks": {name: stats.as_dict() for name, stats in sorted(self._stats.items())},
+            }
+
+    def shutdown(self, wait: bool = True):
+        self._pool.shutdown(wait=wait, cancel_futures=not wait)
+
+
+_executor: Optional[CpuExecutor] = None
+
+
+def start_cpu_executor(max_workers: Optional[int] = None) -> CpuExecutor:
+    """Create the shared executor (app startup). A running one is kept."""
+    global _executor
+    if _executor is None:
+        _executor = CpuExecutor(max_workers or configured_workers())
+        logger.info(f"CPU executor started with {_executor.max_workers} workers")
+    return _executor
+
+
+def shutdown_cpu_executor(wait: bool = True):
+    """Stop the shared executor (app shutdown), letting running calls finish when `wait`."""
+    global _executor
+    if _executor is not None:
+        _executor.shutdown(wait=wait)
+        _executor = None
+
+
+async def run_cpu(fn: Callable, *args, **kwargs) -> Any:
+    """
+    Run a blocking call off the event loop on the shared executor. It is started on
+    first use when the app lifespan has not done it (scripts, tests).
+    """
+    return await start_cpu_executor().run(fn, *args, **kwargs)
+
+
+def get_cpu_executor_metrics() -> dict:
+    """Queue depth, worker count and per-task wait/run statistics of the shared executor."""
+    if _executor is None:
+        return {"max_workers": configured_workers(), "queued": 0, "running": 0, "max_queued": 0, "tasks": {}, "started": False}
+    return {**_executor.metrics(), "started": True}
@@ -0,0 +1,133 @@
+"""
+Export artifact cache.
+Rendered exports (HTML, page-speed HTML, WordPress HTML, PDF, social posts) are stored on disk keyed
+by article id, format and a fingerprint of the article fields the exporters read,
+so a repeat export of an unchanged article is a file read instead of a render and
+a repeat download with If-None-Match is a 304 without touching the file at all.
+
+Layout: EXPORT_CACHE_DIR/<article_id>/<format>-<fingerprint>.<ext>; writing a new
+fingerprint removes the older files of that format.
+"""
+
+import hashlib
+import json
+import logging
+import os
+import re
+import tempfile
+from collections import namedtuple
+from pathlib import Path
+from typing import Optional, Tuple
+
+from export_service import generate_facebook_post, generate_full_html, generate_google_business_post, generate_pdf_bytes
+from web_export import generate_optimized_html
+from wordpress_service import build_styled_wordpress_content
+
+logger = logging.getLogger(__name__)
+
+EXPORT_CACHE_DIR = Path(os.environ.get("EXPORT_CACHE_DIR") or os.path.join(tempfile.gettempdir(), "seo-export-cache"))
+
+# Bump when a renderer's output changes, so cached artifacts are not served any more
+RENDERER_VERSION = 1
+
+# Article fields the exporters read; only these go into the fingerprint
+EXPORT_FIELDS = (
+    "title", "slug", "meta_title", "meta_description", "primary_keyword",
+    "sections", "faq", "toc", "sources",
+)
+# Mongo projection for exports: the fields above plus the derived representation they use
+EXPORT_PROJECTION = {"_id": 0, **{field: 1 for field in EXPORT_FIELDS}, "derived": 1}
+
+ExportFormat = namedtuple("ExportFormat", ["render", "media_type", "extension"])
+
+
+def _text(render):
+    return lambda article: render(article).encode("utf-8")
+
+
+EXPORT_FORMATS = {
+    "facebook": ExportFormat(_text(generate_facebook_post), "text/plain; charset=utf-8", "txt"),
+    "google_business": ExportFormat(_text(generate_google_business_post), "text/plain; charset=utf-8", "txt"),
+    "html": ExportFormat(_text(generate_full_html), "text/html; charset=utf-8", "html"),
+    "html_optimized": ExportFormat(_text(generate_optimized_html), "text/html; charset=utf-8", "html"),
+    "wordpress": ExportFormat(_text(build_styled_wordpress_content), "text/html; charset=utf-8", "html"),
+    "pdf": ExportFormat(generate_pdf_bytes, "application/pdf", "pdf"),
+}
+
+_SAFE_ID_RE = re.compile(r'^[A-Za-z0-9_-]{1,128}$')
+
+
+def export_fingerprint(article: dict, fmt: str) -> str:
+    """Hash of the format, renderer version and every exported field of the article."""
+    payload = json.dumps(
+        [fmt, RENDERER_VERSION, [article.get(field) for field in EXPORT_FIELDS]],
+        sort_keys=True, ensure_ascii=False, default=str
+    )
+    return hashlib.blake2b(payload.encode("utf-8"), digest_size=16).hexdigest()
+
+
+def export_etag(fingerprint: str) -> str:
+    """Weak ETag: a re-rendered PDF is equivalent but not byte-identical (creation date)."""
+    return f'W/"{fingerprint}"'
+
+
+def _artifact_path(article_id: str, fmt: str, fingerprint: str) -> Optional[Path]:
+    if not _SAFE_ID_RE.match(article_id):
+        return None
+    return EXPORT_CACHE_DIR / article_id / f"{fmt}-{fingerprint}.{EXPORT_FORMATS[fmt].extension}"
+
+
+def cached_export_mtime(article_id: str, fmt: str, fingerprint: str) -> Optional[float]:
+    """Modification time of the cached artifact, or None when it is not cached."""
+    path = _artifact_path(article_id, fmt, fingerprint)
+    try:
+        return path.stat().st_mtime if path else None
+    except OSError:
+        return None
+
+
+def _store(path: Path, fmt: str, content: bytes) -> float:
+    path.parent.mkdir(parents=True, exist_ok=True)
+    # Write to a temporary file and rename, so readers never see a partial artifact
+    fd, tmp = tempfile.mkstemp(dir=path.parent, prefix=".tmp-")
+    with os.fdopen(fd, "wb") as f:
+        f.write(content)
+    os.replace(tmp, path)
+    for old in path.parent.glob(f"{fmt}-*.{EXPORT_FORMATS[fmt].extension}"):
+        if old != path:
+            old.unlink(missing_ok=True)
+    return path.stat().st_mtime
+
+
+def get_or_render_export(article: dict, article_id: str, fmt: str, fingerprint: str) -> Tuple[bytes, float]:
+    """
+    (content, modification time) of the export: read from the cache, or rendered
+    and stored. Blocking (disk and rendering) - run it on the CPU executor.
+    """
+    path = _artifact_path(article_id, fmt, fingerprint)
+    if path is not None:
+        try:
+            return path.read_bytes(), path.stat().st_mtime
+        except OSError:
+            pass
+    content = EXPORT_FORMATS[fmt].render(article)
+    if path is None:
+        return content, 0.0
+    try:
+        return content, _store(path, fmt, content)
+    except OSError as e:
+        logger.warning(f"Export cache write failed for {article_id}/{fmt}: {e}")
+        return content, 0.0
+
+
+def discard_exports(article_id: str):
+    """Remove every cached artifact of an article (after deletion)."""
+    if not _SAFE_ID_RE.match(article_id):
+        return
+    directory = EXPORT_CACHE_DIR / article_id
+    for path in directory.glob("*"):
+        path.unlink(missing_ok=True)
+    try:
+        directory.rmdir()
+    except OSError:
+        pass
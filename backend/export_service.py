@@ -2,22 +2,16 @@
 Export Service - Generate formatted content for Facebook, Google Business, HTML, and PDF.
 """
 
-import re
-import io
 from bs4 import BeautifulSoup
-from reportlab.lib.pagesizes import A4
-from reportlab.lib.styles import getSampleStyleSheet, ParagraphStyle
-from reportlab.platypus import SimpleDocTemplate, Paragraph, Spacer
-from reportlab.lib.units import cm
-from reportlab.lib.enums import TA_JUSTIFY, TA_CENTER
-from reportlab.pdfbase import pdfmetrics
-from reportlab.pdfbase.ttfonts import TTFont
-import os
+
+from article_derived import get_derived
+from pdf_engine import render_article_pdf
+from text_core import strip_tags
 
 
 def strip_html(html: str) -> str:
     """Strip HTML tags and return plain text."""
-    return re.sub(r'<[^>]+>', '', html).strip()
+    return strip_tags(html).strip()
 
 
 def generate_facebook_post(article: dict) -> str:
@@ -27,9 +21,10 @@ def generate_facebook_post(article: dict) -> str:
     
     # Get first section content as intro
     sections = article.get("sections", [])
+    derived_sections = get_derived(article)["sections"]
     intro = ""
-    if sections:
-        intro = strip_html(sections[0].get("content", ""))
+    if derived_sections:
+        intro = derived_sections[0]["text"]
         # Limit to ~200 chars
         if len(intro) > 200:
             intro = intro[:197] + "..."
@@ -64,10 +59,10 @@ def generate_google_business_post(article: dict) -> str:
     meta_desc = article.get("meta_description", "")
     
     # Google Business posts have ~1500 char limit, keep it concise
-    sections = article.get("sections", [])
+    derived_sections = get_derived(article)["sections"]
     intro = ""
-    if sections:
-        intro = strip_html(sections[0].get("content", ""))
+    if derived_sections:
+        intro = derived_sections[0]["text"]
         if len(intro) > 300:
             intro = intro[:297] + "..."
     
@@ -95,16 +90,16 @@ def generate_full_html(article: dict) -> str:
         toc_html += f'<li><a href="#{item.get("anchor", "")}">{item.get("label", item.get("title", ""))}</a></li>'
     toc_html += '</ol></nav>'
     
-    # Build sections HTML
-    sections_html = ""
+    # Build sections HTML (joined once: += copies the growing string on long articles)
+    parts = []
     for section in article.get("sections", []):
-        sections_html += f'<section id="{section.get("anchor", "")}">'
-        sections_html += f'<h2>{section.get("heading", "")}</h2>'
-        sections_html += section.get("content", "")
+        parts.append(f'<section id="{section.get("anchor", "")}"><h2>{section.get("heading", "")}</h2>')
+        parts.append(section.get("content", ""))
         for sub in section.get("subsections", []):
-            sections_html += f'<h3 id="{sub.get("anchor", "")}">{sub.get("heading", "")}</h3>'
-            sections_html += sub.get("content", "")
-        sections_html += '</section>'
+            parts.append(f'<h3 id="{sub.get("anchor", "")}">{sub.get("heading", "")}</h3>')
+            parts.append(sub.get("content", ""))
+        parts.append('</section>')
+    sections_html = "".join(parts)
     
     # Build FAQ HTML with Schema.org markup
     faq_html = '<section class="faq"><h2>Najczęściej zadawane pytania (FAQ)</h2>'
@@ -253,124 +248,5 @@ def generate_full_html(article: dict) -> str:
 
 
 def generate_pdf_bytes(article: dict) -> bytes:
-    """Generate PDF from article. Returns PDF bytes."""
-    # Register Polish-compatible fonts
-    FONT_PATH = '/usr/share/fonts/truetype/dejavu/'
-    pdfmetrics.registerFont(TTFont('DejaVuSans', os.path.join(FONT_PATH, 'DejaVuSans.ttf')))
-    pdfmetrics.registerFont(TTFont('DejaVuSans-Bold', os.path.join(FONT_PATH, 'DejaVuSans-Bold.ttf')))
-
-    buffer = io.BytesIO()
-    doc = SimpleDocTemplate(
-        buffer,
-        pagesize=A4,
-        rightMargin=2*cm,
-        leftMargin=2*cm,
-        topMargin=2*cm,
-        bottomMargin=2*cm
-    )
-    
-    styles = getSampleStyleSheet()
-    
-    # Custom styles with DejaVuSans (supports Polish diacritics)
-    title_style = ParagraphStyle(
-        'ArticleTitle',
-        parent=styles['Title'],
-        fontName='DejaVuSans-Bold',
-        fontSize=20,
-        spaceAfter=20,
-        alignment=TA_CENTER
-    )
-    
-    h2_style = ParagraphStyle(
-        'H2Style',
-        parent=styles['Heading2'],
-        fontName='DejaVuSans-Bold',
-        fontSize=16,
-        spaceBefore=20,
-        spaceAfter=10,
-        textColor='#04389E'
-    )
-    
-    h3_style = ParagraphStyle(
-        'H3Style',
-        parent=styles['Heading3'],
-        fontName='DejaVuSans-Bold',
-        fontSize=13,
-        spaceBefore=12,
-        spaceAfter=6,
-        textColor='#1a3a6e'
-    )
-    
-    body_style = ParagraphStyle(
-        'BodyText2',
-        parent=styles['BodyText'],
-        fontName='DejaVuSans',
-        fontSize=10,
-        leading=14,
-        alignment=TA_JUSTIFY,
-        spaceAfter=8
-    )
-    
-    faq_q_style = ParagraphStyle(
-        'FAQQuestion',
-        parent=styles['Heading4'],
-        fontName='DejaVuSans-Bold',
-        fontSize=11,
-        spaceBefore=10,
-        spaceAfter=4,
-        textColor='#04389E'
-    )
-    
-    elements = []
-    
-    # Title
-    title = article.get("title", "Artykuł")
-    elements.append(Paragraph(title, title_style))
-    elements.append(Spacer(1, 12))
-    
-    # Sections
-    for section in article.get("sections", []):
-        elements.append(Paragraph(section.get("heading", ""), h2_style))
-        
-        content = strip_html(section.get("content", ""))
-        # Split into paragraphs
-        for para in content.split("\n"):
-            para = para.strip()
-            if para:
-                try:
-                    elements.append(Paragraph(para, body_style))
-                except Exception:
-                    elements.append(Paragraph(re.sub(r'[<>&]', '', para), body_style))
-        
-        for sub in section.get("subsections", []):
-            elements.append(Paragraph(sub.get("heading", ""), h3_style))
-            sub_content = strip_html(sub.get("content", ""))
-            for para in sub_content.split("\n"):
-                para = para.strip()
-                if para:
-                    try:
-                        elements.append(Paragraph(para, body_style))
-                    except Exception:
-                        elements.append(Paragraph(re.sub(r'[<>&]', '', para), body_style))
-    
-    # FAQ
-    elements.append(Spacer(1, 20))
-    elements.append(Paragraph("Najczesciej zadawane pytania (FAQ)", h2_style))
-    for faq in article.get("faq", []):
-        elements.append(Paragraph(faq.get("question", ""), faq_q_style))
-        try:
-            elements.append(Paragraph(faq.get("answer", ""), body_style))
-        except Exception:
-            elements.append(Paragraph(re.sub(r'[<>&]', '', faq.get("answer", "")), body_style))
-    
-    # Sources
-    elements.append(Spacer(1, 20))
-    elements.append(Paragraph("Zrodla", h2_style))
-    for src in article.get("sources", []):
-        try:
-            elements.append(Paragraph(f"- {src.get('name', '')} ({src.get('url', '')})", body_style))
-        except Exception:
-            elements.append(Paragraph(f"- {src.get('name', '')}", body_style))
-    
-    doc.build(elements)
-    return buffer.getvalue()
+    """Generate PDF from article. Returns PDF bytes (fonts, styles and section flowables are cached)."""
+    return render_article_pdf(article)
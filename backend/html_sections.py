@@ -0,0 +1,111 @@
+"""
+HTML-to-sections parser for the visual editor.
+Tokenises the editor HTML once, left to right, and slices section and subsection
+bodies straight out of the source, so parsing is linear in the document size and
+markup between headings is kept verbatim. The tokenizer follows the HTML rules that
+matter for finding headings: comments and <script>/<style> bodies are skipped, and
+quoted attribute values may contain ">".
+"""
+
+import re
+
+from text_core import slugify, strip_tags
+
+# Attribute text of a tag: quoted values may contain ">"
+_ATTRS = r'''((?:[^>"']|"[^"]*"|'[^']*')*)'''
+
+# Comment, raw-text element (body not parsed as markup) or <h2>/<h3> tag
+_TOKEN_RE = re.compile(
+    r'<(?:!--.*?(?:-->|\Z)'
+    r'|(script|style)\b' + _ATTRS + r'>.*?(?:</\1\s*>|\Z)'
+    r'|(/?)h([23])\b' + _ATTRS + r'>)',
+    re.IGNORECASE | re.DOTALL
+)
+_ID_ATTR_RE = re.compile(r'''(?:^|\s)id\s*=\s*(?:"([^"]*)"|'([^']*)'|([^\s"'>]+))''', re.IGNORECASE)
+_H1_RE = re.compile(r'<h1[^>]*>(.*?)</h1>', re.IGNORECASE | re.DOTALL)
+
+
+def _heading_id(attrs: str) -> str:
+    """Value of the id attribute, wherever it appears among the attributes."""
+    match = _ID_ATTR_RE.search(attrs)
+    if not match:
+        return ""
+    return next(g for g in match.groups() if g is not None)
+
+
+def extract_h1_title(html: str) -> str:
+    """Plain text of the first <h1>, or an empty string."""
+    match = _H1_RE.search(html or "")
+    return strip_tags(match.group(1)).strip() if match else ""
+
+
+def parse_html_to_sections(html: str) -> list:
+    """
+    Parse HTML content from the visual editor back into structured sections.
+
+    Content before the first <h2> is ignored, as is an <h3> that comes before any <h2>.
+    Anchors come from the heading's id attribute, or are slugified from its text.
+    A heading without a closing tag is left in the body as content. An <h3> inside a
+    closed <h2> is part of the <h2> text; inside an unclosed one it is a subsection.
+    """
+    if not html or not html.strip():
+        return []
+
+    sections = []
+    state = {"section": None, "target": None, "body_start": None}
+
+    def emit(level, anchor_id, tag_start, inner_start, inner_end, end):
+        target = state["target"]
+        if target is not None:
+            target["content"] = html[state["body_start"]:tag_start].strip()
+        heading_text = strip_tags(html[inner_start:inner_end]).strip()
+        anchor = anchor_id or slugify(heading_text)
+        if level == "2":
+            section = {"heading": heading_text, "anchor": anchor, "content": "", "subsections": []}
+            sections.append(section)
+            state["section"] = state["target"] = section
+        elif state["section"] is not None:
+            target = {"heading": heading_text, "anchor": anchor, "content": ""}
+            state["section"]["subsections"].append(target)
+            state["target"] = target
+        else:
+            state["target"] = None
+        state["body_start"] = end
+
+    # Open headings, outermost first: [level, anchor_id, tag_start, inner_start, completed nested headings]
+    stack = []
+
+    def drop_unclosed(depth: int):
+        # Headings that were never closed stay content; headings completed inside them are real
+        for entry in stack[depth:]:
+            for heading in entry[4]:
+                emit(*heading)
+        del stack[depth:]
+
+    for match in _TOKEN_RE.finditer(html):
+        level = match.group(4)
+        if level is None:
+            continue  # comment or script/style body
+        if not match.group(3):
+            depth = next((i for i, entry in enumerate(stack) if entry[0] >= level), len(stack))
+            drop_unclosed(depth)
+            stack.append([level, _heading_id(match.group(5)), match.start(), match.end(), []])
+            continue
+        k = next((i for i in range(len(stack) - 1, -1, -1) if stack[i][0] == level), None)
+        if k is None:
+            continue
+        # Anything still open inside the heading is part of its text
+        entry = stack[k]
+        del stack[k:]
+        heading = (level, entry[1], entry[2], entry[3], match.start(), match.end())
+        if stack:
+            stack[-1][4].append(heading)
+        else:
+            emit(*heading)
+    drop_unclosed(0)
+
+    target = state["target"]
+    if target is not None:
+        target["content"] = html[state["body_start"]:].strip()
+
+    return sections
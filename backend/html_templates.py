@@ -0,0 +1,39 @@
+"""
+Jinja2 templates for the page-speed HTML export and the static site listings.
+Templates live in backend/templates, are compiled once (load_templates at startup, or
+lazily on first use) and never re-checked on disk. Autoescaping is off: article
+content is stored as HTML and is inserted as is.
+"""
+
+from functools import lru_cache
+from pathlib import Path
+
+from jinja2 import Environment, FileSystemLoader
+
+TEMPLATES_DIR = Path(__file__).parent / "templates"
+
+TEMPLATE_NAMES = ("article_body.html", "article_web.html", "site_list.html")
+
+_environment = Environment(
+    loader=FileSystemLoader(str(TEMPLATES_DIR)),
+    autoescape=False,
+    auto_reload=False,
+    keep_trailing_newline=False,
+)
+
+
+@lru_cache(maxsize=None)
+def get_template(name: str):
+    """Compiled template by file name (compiled on first use, then shared)."""
+    return _environment.get_template(name)
+
+
+def load_templates():
+    """Compile every template up front, so the first export does not pay for it."""
+    for name in TEMPLATE_NAMES:
+        get_template(name)
+
+
+def render_template(name: str, **context) -> str:
+    return get_template(name).render(**context)
+
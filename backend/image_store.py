@@ -0,0 +1,241 @@
+"""
+Content-addressed image blob store (GridFS)
+Image binaries live in the "image_blobs" GridFS bucket, one file per SHA-256 of the
+decoded bytes (unique filename index); documents in db.images keep only metadata (blob_sha256, size,
+width/height, mime_type). Identical images are stored once, and queries on
+db.images no longer pull megabytes of base64 through Mongo.
+
+Deleting the last image of a blob only marks the blob as released; it is deleted a
+grace period later if nothing references it by then, and storing the same content
+again clears the mark. An upload that found the blob just before the release so never
+ends up pointing at deleted bytes.
+
+Documents written before the store keep their base64 in `data` until migrated:
+
+    python image_store.py [--batch-size 20] [--dry-run]
+"""
+
+import asyncio
+import base64
+import binascii
+import hashlib
+import logging
+import os
+import time
+from typing import Callable, Optional
+
+from bson import ObjectId
+from gridfs.errors import NoFile
+from motor.motor_asyncio import AsyncIOMotorGridFSBucket
+from pymongo import UpdateOne
+from pymongo.errors import DuplicateKeyError
+
+from cpu_executor import run_cpu
+from image_info import image_size
+
+logger = logging.getLogger(__name__)
+
+BLOB_BUCKET = "image_blobs"
+DEFAULT_BATCH_SIZE = 20
+# How long a released blob is kept before it is deleted
+BLOB_GRACE_SECONDS = int(os.environ.get("IMAGE_BLOB_GRACE_SECONDS", 600))
+
+
+class ImageDataError(ValueError):
+    """Image payload is not valid base64."""
+
+
+def _bucket(db) -> AsyncIOMotorGridFSBucket:
+    return AsyncIOMotorGridFSBucket(db, bucket_name=BLOB_BUCKET)
+
+
+def _decode(data_b64: str) -> tuple:
+    """(raw bytes, sha256 hex, (width, height) or None). Blocking - runs on the CPU executor."""
+    try:
+        raw = base64.b64decode(data_b64, validate=True)
+    except (binascii.Error, ValueError) as e:
+        raise ImageDataError(f"Nieprawidlowe dane obrazu: {e}")
+    return raw, hashlib.sha256(raw).hexdigest(), image_size(raw)
+
+
+async def _reuse_blob(db, sha256: str) -> bool:
+    """Whether the blob exists. Reusing a blob cancels a pending release; once it is purged, nothing matches."""
+    reused = await db[f"{BLOB_BUCKET}.files"].update_one(
+        {"filename": sha256}, {"$unset": {"metadata.released_at": ""}}
+    )
+    return bool(reused.matched_count)
+
+
+async def store_image_blob(db, data_b64: str, mime_type: str) -> dict:
+    """
+    Store a base64 image in the blob store (once per content) and return the metadata
+    fields for its db.images document.
+    """
+    raw, sha256, size = await run_cpu(_decode, data_b64)
+    if not await _reuse_blob(db, sha256):
+        # The unique filename index rejects a second upload of the same content; GridFS
+        # writes the chunks before the files document, so the loser removes its chunks
+        file_id = ObjectId()
+        try:
+            await _bucket(db).upload_from_stream_with_id(file_id, sha256, raw, metadata={"mime_type": mime_type})
+        except DuplicateKeyError:
+            await db[f"{BLOB_BUCKET}.chunks"].delete_many({"files_id": file_id})
+            await _reuse_blob(db, sha256)
+    fields = {"blob_sha256": sha256, "size": len(raw)}
+    if size:
+        fields["width"], fields["height"] = size
+    return fields
+
+
+async def load_image_bytes(db, image: dict) -> Optional[bytes]:
+    """Raw bytes of an image document: from the blob store, or the legacy `data` field."""
+    if image.get("blob_sha256"):
+        try:
+            stream = await _bucket(db).open_download_stream_by_name(image["blob_sha256"])
+        except NoFile as e:
+            logger.warning(f"Image blob {image['blob_sha256']} missing: {e}")
+            return None
+        return await stream.read()
+    if image.get("data"):
+        return (await run_cpu(_decode, image["data"]))[0]
+    return None
+
+
+async def load_image_data(db, image: dict) -> str:
+    """Base64 payload of an image document (the API still returns images as base64)."""
+    if not image.get("blob_sha256"):
+        return image.get("data", "")
+    raw = await load_image_bytes(db, image)
+    return base64.b64encode(raw).decode("ascii") if raw else ""
+
+
+async def release_image_blob(db, sha256: Optional[str]):
+    """
+    Mark a blob as released once no image document references it any more (after deleting
+    an image), then purge the blobs whose grace period is over.
+    """
+    if sha256 and not await db.images.find_one({"blob_sha256": sha256}, {"_id": 1}):
+        await db[f"{BLOB_BUCKET}.files"].update_many(
+            {"filename": sha256}, {"$set": {"metadata.released_at": time.time()}}
+        )
+    await purge_released_blobs(db)
+
+
+async def purge_released_blobs(db, grace_seconds: int = BLOB_GRACE_SECONDS) -> int:
+    """
+    Delete blobs released more than `grace_seconds` ago that are still unreferenced.
+    The delete is conditional on the release mark, so a blob reused meanwhile is kept.
+    Returns the number of blobs deleted.
+    """
+    files = db[f"{BLOB_BUCKET}.files"]
+    cutoff = time.time() - grace_seconds
+    released = {"metadata.released_at": {"$lt": cutoff}}
+    deleted = 0
+    async for blob in files.find(released, {"_id": 1, "filename": 1}):
+        if await db.images.find_one({"blob_sha256": blob["filename"]}, {"_id": 1}):
+            await files.update_one({"_id": blob["_id"]}, {"$unset": {"metadata.released_at": ""}})
+            continue
+        if await files.find_one_and_delete({"_id": blob["_id"], **released}, {"_id": 1}):
+            await db[f"{BLOB_BUCKET}.chunks"].delete_many({"files_id": blob["_id"]})
+            deleted += 1
+    return deleted
+
+
+async def migrate_image_documents(
+    db,
+    batch_size: int = DEFAULT_BATCH_SIZE,
+    dry_run: bool = False,
+    on_progress: Optional[Callable[[dict], None]] = None
+) -> dict:
+    """
+    Move the base64 `data` of every legacy image document into the blob store, in
+    batches: each batch is read with a cursor, its blobs are uploaded and the documents
+    are updated with one bulk_write that also unsets `data`. The update is conditional
+    on `data` still being present, so concurrent or repeated runs are harmless.
+    """
+    batch_size = max(1, batch_size)
+    stats = {"scanned": 0, "migrated": 0, "deduplicated": 0, "failed": 0, "bytes_moved": 0, "errors": []}
+    started = time.perf_counter()
+    seen = set()
+
+    async def write_batch(batch: list):
+        ops = []
+        for image in batch:
+            try:
+                if dry_run:
+                    _, sha256, _ = await run_cpu(_decode, image["data"])
+                    fields = {"blob_sha256": sha256}
+                else:
+                    fields = await store_image_blob(db, image["data"], image.get("mime_type", ""))
+            except Exception as e:
+                stats["failed"] += 1
+                if len(stats["errors"]) < 20:
+                    stats["errors"].append({"id": image.get("id"), "error": str(e)})
+                continue
+            if fields["blob_sha256"] in seen:
+                stats["deduplicated"] += 1
+            seen.add(fields["blob_sha256"])
+            stats["migrated"] += 1
+            stats["bytes_moved"] += len(image["data"])
+            ops.append(UpdateOne(
+                {"id": image["id"], "data": {"$exists": True}},
+                {"$set": fields, "$unset": {"data": ""}}
+            ))
+        if ops and not dry_run:
+            await db.images.bulk_write(ops, ordered=False)
+        if on_progress:
+            on_progress(stats)
+
+    query = {"data": {"$type": "string", "$ne": ""}, "blob_sha256": {"$exists": False}}
+    cursor = db.images.find(query, {"_id": 0, "id": 1, "data": 1, "mime_type": 1}).batch_size(batch_size)
+    batch = []
+    async for image in cursor:
+        stats["scanned"] += 1
+        batch.append(image)
+        if len(batch) >= batch_size:
+            await write_batch(batch)
+            batch = []
+    if batch:
+        await write_batch(batch)
+
+    stats["elapsed_seconds"] = round(time.perf_counter() - started, 3)
+    stats["dry_run"] = dry_run
+    logger.info(
+        f"Image migration: {stats['migrated']}/{stats['scanned']} images "
+        f"({stats['bytes_moved'] / 1e6:.1f} MB base64, {stats['deduplicated']} duplicates) "
+        f"in {stats['elapsed_seconds']}s"
+    )
+    return stats
+
+
+async def _main():
+    import argparse
+    from pathlib import Path
+    from dotenv import load_dotenv
+    from motor.motor_asyncio import AsyncIOMotorClient
+
+    parser = argparse.ArgumentParser(description="Move base64 image data from db.images into the GridFS blob store.")
+    parser.add_argument("--batch-size", type=int, default=DEFAULT_BATCH_SIZE)
+    parser.add_argument("--dry-run", action="store_true", help="decode and hash without writing")
+    args = parser.parse_args()
+
+    load_dotenv(Path(__file__).parent / '.env')
+    client = AsyncIOMotorClient(os.environ['MONGO_URL'])
+    db = client[os.environ.get('DB_NAME', 'seo_article_writer')]
+
+    try:
+        stats = await migrate_image_documents(db, args.batch_size, args.dry_run)
+    finally:
+        client.close()
+
+    print(
+        f"Scanned {stats['scanned']}, migrated {stats['migrated']} ({stats['deduplicated']} duplicates), "
+        f"failed {stats['failed']}, {stats['bytes_moved'] / 1e6:.1f} MB moved in {stats['elapsed_seconds']}s"
+    )
+    for err in stats["errors"]:
+        print(f"  {err['id']}: {err['error']}")
+
+
+if __name__ == "__main__":
+    logging.basicConfig(level=logging.INFO, format='%(asctime)s - %(name)s - %(levelname)s - %(message)s')
+    asyncio.run(_main())
@@ -10,6 +10,8 @@ import httpx
 from bs4 import BeautifulSoup
 from emergentintegrations.llm.chat import LlmChat, UserMessage
 
+from cpu_executor import run_cpu
+
 logger = logging.getLogger(__name__)
 
 OPTIMIZE_PROMPT = """Przeanalizuj ponizszy artykul i zoptymalizuj go pod SEO.
@@ -53,6 +55,51 @@ Zwroc WYLACZNIE JSON (bez markdown):
 }}"""
 
 
+def _extract_article(html: str, url: str) -> dict:
+    """Title, meta description and main content of a scraped page (blocking BeautifulSoup work)."""
+    soup = BeautifulSoup(html, "html.parser")
+    
+    # Remove scripts, styles, nav, footer
+    for tag in soup(["script", "style", "nav", "footer", "header", "aside", "iframe"]):
+        tag.decompose()
+    
+    # Try to find article content
+    article = soup.find("article") or soup.find("main") or soup.find(class_=re.compile(r"post|article|content|entry"))
+    
+    if article:
+        content_html = str(article)
+    else:
+        body = soup.find("body")
+        content_html = str(body) if body else str(soup)
+    
+    # Get title
+    title = ""
+    h1 = soup.find("h1")
+    if h1:
+        title = h1.get_text(strip=True)
+    elif soup.find("title"):
+        title = soup.find("title").get_text(strip=True)
+    
+    # Get meta description
+    meta_desc = ""
+    meta_tag = soup.find("meta", attrs={"name": "description"})
+    if meta_tag:
+        meta_desc = meta_tag.get("content", "")
+    
+    # Clean content
+    clean_soup = BeautifulSoup(content_html, "html.parser")
+    text_content = clean_soup.get_text(separator="\n", strip=True)
+    
+    return {
+        "title": title,
+        "content_html": content_html[:15000],
+        "text_content": text_content[:10000],
+        "meta_description": meta_desc,
+        "source_url": url,
+        "word_count": len(text_content.split())
+    }
+
+
 async def scrape_article_from_url(url: str) -> dict:
     """Scrape article content from a URL."""
     async with httpx.AsyncClient(timeout=30.0, follow_redirects=True) as client:
@@ -61,48 +108,13 @@ async def scrape_article_from_url(url: str) -> dict:
         }
         response = await client.get(url, headers=headers)
         response.raise_for_status()
-        
-        soup = BeautifulSoup(response.text, "html.parser")
-        
-        # Remove scripts, styles, nav, footer
-        for tag in soup(["script", "style", "nav", "footer", "header", "aside", "iframe"]):
-            tag.decompose()
-        
-        # Try to find article content
-        article = soup.find("article") or soup.find("main") or soup.find(class_=re.compile(r"post|article|content|entry"))
-        
-        if article:
-            content_html = str(article)
-        else:
-            body = soup.find("body")
-            content_html = str(body) if body else str(soup)
-        
-        # Get title
-        title = ""
-        h1 = soup.find("h1")
-        if h1:
-            title = h1.get_text(strip=True)
-        elif soup.find("title"):
-            title = soup.find("title").get_text(strip=True)
-        
-        # Get meta description
-        meta_desc = ""
-        meta_tag = soup.find("meta", attrs={"name": "description"})
-        if meta_tag:
-            meta_desc = meta_tag.get("content", "")
-        
-        # Clean content
-        clean_soup = BeautifulSoup(content_html, "html.parser")
-        text_content = clean_soup.get_text(separator="\n", strip=True)
-        
-        return {
-            "title": title,
-            "content_html": content_html[:15000],
-            "text_content": text_content[:10000],
-            "meta_description": meta_desc,
-            "source_url": url,
-            "word_count": len(text_content.split())
-        }
+    
+    return await run_cpu(_extract_article, response.text, url)
+
+
+def _html_word_counts(fragments: list) -> list:
+    """Word count of each HTML fragment (blocking BeautifulSoup work)."""
+    return [len(BeautifulSoup(html, "html.parser").get_text().split()) for html in fragments]
 
 
 async def import_from_wordpress(wp_url: str, wp_user: str = None, wp_password: str = None, limit: int = 20) -> list:
@@ -161,8 +173,9 @@ async def import_from_wordpress(wp_url: str, wp_user: str = None, wp_password: s
             raise ValueError("Bledne dane logowania lub brak uprawnien. Sprawdz uzytkownika i haslo aplikacji.")
         
         posts = response.json()
+        word_counts = await run_cpu(_html_word_counts, [post.get("content", {}).get("rendered", "") for post in posts])
         articles = []
-        for post in posts:
+        for post, word_count in zip(posts, word_counts):
             articles.append({
                 "wp_id": post.get("id"),
                 "title": post.get("title", {}).get("rendered", ""),
@@ -171,7 +184,7 @@ async def import_from_wordpress(wp_url: str, wp_user: str = None, wp_password: s
                 "slug": post.get("slug", ""),
                 "date": post.get("date", ""),
                 "source_url": post.get("link", ""),
-                "word_count": len(BeautifulSoup(post.get("content", {}).get("rendered", ""), "html.parser").get_text().split())
+                "word_count": word_count
             })
         
         return articles
@@ -0,0 +1,234 @@
+"""
+Polish inflection-aware keyword matching.
+A light suffix-stripping stemmer maps inflected forms (podatek / podatku / podatków)
+to one stem, and precompiled, LRU-cached matchers count keyword phrases over
+a stream of stemmed tokens in a single scan.
+"""
+
+import re
+from functools import lru_cache
+from itertools import compress
+from typing import Dict, Iterable, Optional, Sequence
+
+from text_core import POLISH_STOP_WORDS, WORD_RE, tokenize
+
+# Minimum length of what is left after stripping a suffix
+MIN_STEM_LENGTH = 3
+
+# (suffix, replacement) pairs; the longest matching suffix wins.
+# Covers noun/adjective declension, the -ek/-k- mobile vowel (podatek, podatku),
+# the r/rz alternation (faktura, fakturze) and k/c before -e and -y (spółka, spółce;
+# pracownik, pracownicy). Stems of k-nouns never keep the k, so the bare -ik/-yk
+# nominative (pracownik, podatnik) loses it as well.
+_SUFFIX_RULES = [
+    ("ościami", ""), ("ościach", ""), ("eniami", ""), ("eniach", ""), ("ikowi", "i"),
+    ("kiego", ""), ("kami", ""), ("kach", ""), ("kiem", ""), ("kiej", ""), ("kich", ""), ("kimi", ""),
+    ("ości", ""), ("ością", ""), ("enie", ""), ("enia", ""), ("eniu", ""), ("eniem", ""),
+    ("iami", ""), ("iach", ""), ("iego", ""), ("iemu", ""), ("nicy", "ni"), ("czce", "cz"),
+    ("ość", ""), ("ami", ""), ("ach", ""), ("ych", ""), ("ich", ""), ("ymi", ""), ("imi", ""),
+    ("ego", ""), ("emu", ""), ("iej", ""), ("iom", ""), ("ków", ""), ("kom", ""), ("kie", ""), ("kim", ""),
+    ("iem", ""), ("łce", "ł"), ("dce", "d"), ("wce", "w"), ("yce", "y"),
+    ("rze", "r"), ("eń", ""), ("ów", ""), ("om", ""), ("em", ""), ("ek", ""), ("ik", "i"), ("yk", "y"),
+    ("ka", ""), ("ki", ""), ("ku", ""),
+    ("kę", ""), ("ką", ""), ("ie", ""), ("ej", ""), ("ym", ""), ("im", ""), ("ać", ""), ("eć", ""), ("ić", ""),
+    ("a", ""), ("e", ""), ("i", ""), ("o", ""), ("u", ""), ("y", ""), ("ą", ""), ("ę", ""),
+]
+_SUFFIX_RULES.sort(key=lambda rule: len(rule[0]), reverse=True)
+
+_STEM_FOLD = str.maketrans({"ó": "o"})
+
+# A keyword counts as present in a text when at least this share of its terms appear
+TERM_PRESENCE_RATIO = 0.7
+
+
+def is_significant(token: str) -> bool:
+    """Tokens that take part in keyword matching (no stop words, longer than 2 chars)."""
+    return token not in POLISH_STOP_WORDS and len(token) > 2
+
+
+@lru_cache(maxsize=65536)
+def stem(token: str) -> str:
+    """Suffix-stripping stem of a lowercase Polish word."""
+    if len(token) > MIN_STEM_LENGTH and not token.isdigit():
+        for suffix, replacement in _SUFFIX_RULES:
+            if token.endswith(suffix) and len(token) - len(suffix) + len(replacement) >= MIN_STEM_LENGTH:
+                token = token[:len(token) - len(suffix)] + replacement
+                break
+    return token.translate(_STEM_FOLD)
+
+
+@lru_cache(maxsize=65536)
+def significant_stem(token: str) -> str:
+    """Stem of a significant token, "" for stop words and short words."""
+    return stem(token) if is_significant(token) else ""
+
+
+@lru_cache(maxsize=65536)
+def word_stems(word: str) -> tuple:
+    """
+    Stems of the significant tokens of one whitespace-separated word, as written (any
+    case, punctuation attached). Word tokens never span whitespace, so chaining this
+    over text.split() equals stem_tokens(tokenize(text)) with one cache lookup per word.
+    """
+    return tuple(filter(None, map(significant_stem, WORD_RE.findall(word.lower()))))
+
+
+def stem_map(tokens: Iterable[str]) -> Dict[str, str]:
+    """Stem of every distinct token ("" for tokens that are not significant)."""
+    distinct = set(tokens)
+    return dict(zip(distinct, map(significant_stem, distinct)))
+
+
+def stem_tokens(tokens: Sequence[str], stems: Optional[Dict[str, str]] = None) -> tuple:
+    """
+    Stems of the significant lowercase tokens, in text order. Stop words and short
+    words are dropped, so a phrase like "ulga na start" is a contiguous run of stems.
+    """
+    if stems is None:
+        stems = stem_map(tokens)
+    return tuple(filter(None, map(stems.__getitem__, tokens)))
+
+
+class KeywordMatcher:
+    """
+    Precompiled matcher for one keyword phrase.
+    `stems` are the stems of the significant terms, in phrase order; `pattern`
+    finds the phrase verbatim on word boundaries.
+    """
+
+    __slots__ = ("keyword", "terms", "stems", "pattern")
+
+    def __init__(self, keyword: str):
+        self.keyword = keyword
+        self.terms = [w for w in tokenize(keyword) if is_significant(w)]
+        self.stems = tuple(stem(t) for t in self.terms)
+        self.pattern = re.compile(r'(?<!\w)' + re.escape(keyword) + r'(?!\w)')
+
+    def count_phrases(self, stem_streams: Iterable[Sequence[str]]) -> int:
+        """
+        Count non-overlapping phrase occurrences in streams from stem_tokens(), in one
+        scan per stream. Each stream (section body) is scanned separately.
+        """
+        stems = self.stems
+        size = len(stems)
+        if not size:
+            return 0
+        first = stems[0]
+        count = 0
+        for stream in stem_streams:
+            if size == 1:
+                count += stream.count(first)
+                continue
+            i = 0
+            while True:
+                try:
+                    i = stream.index(first, i)
+                except ValueError:
+                    break
+                if tuple(stream[i:i + size]) == stems:
+                    count += 1
+                    i += size
+                else:
+                    i += 1
+        return count
+
+    def term_counts(self, stem_counts: Dict[str, int]) -> Dict[str, int]:
+        """Occurrences of every term (any inflected form) given stem frequencies."""
+        return {term: stem_counts.get(s, 0) for term, s in zip(self.terms, self.stems)}
+
+    def present_in(self, lower_text: str, stem_set) -> bool:
+        """Phrase present verbatim, or at least 70% of its terms present in any inflected form."""
+        if not self.stems:
+            # Only stop words / short words: verbatim match on word boundaries
+            return self.keyword in lower_text and self.pattern.search(lower_text) is not None
+        # A verbatim occurrence always has all of its stems present
+        found = sum(1 for s in self.stems if s in stem_set)
+        return found >= len(self.stems) * TERM_PRESENCE_RATIO
+
+
+@lru_cache(maxsize=1024)
+def get_keyword_matcher(keyword: str) -> KeywordMatcher:
+    """Cached matcher for a normalized (lowercase, stripped) keyword phrase."""
+    return KeywordMatcher(keyword)
+
+
+class PhraseAutomaton:
+    """
+    Aho-Corasick automaton over stem sequences for a set of keyword phrases.
+    One pass over a stem stream counts every phrase, so the cost of scanning
+    does not grow with the number of keywords. Counts are non-overlapping per
+    phrase, the same as KeywordMatcher.count_phrases().
+    """
+
+    __slots__ = ("phrases", "_goto", "_fail", "_out", "_alphabet")
+
+    def __init__(self, phrases: Sequence[str]):
+        self.phrases = tuple(phrases)
+        self._goto = [{}]
+        self._out = [[]]
+        for pid, phrase in enumerate(self.phrases):
+            stems = get_keyword_matcher(phrase).stems
+            if not stems:
+                continue
+            state = 0
+            for s in stems:
+                nxt = self._goto[state].get(s)
+                if nxt is None:
+                    nxt = len(self._goto)
+                    self._goto[state][s] = nxt
+                    self._goto.append({})
+                    self._out.append([])
+                state = nxt
+            self._out[state].append((pid, len(stems)))
+
+        # Breadth-first failure links; outputs of the failure state are inherited
+        self._fail = [0] * len(self._goto)
+        queue = list(self._goto[0].values())
+        for state in queue:
+            for s, nxt in self._goto[state].items():
+                queue.append(nxt)
+                f = self._fail[state]
+                while f and s not in self._goto[f]:
+                    f = self._fail[f]
+                self._fail[nxt] = self._goto[f].get(s, 0) if self._goto[f].get(s) != nxt else 0
+                self._out[nxt] = self._out[nxt] + self._out[self._fail[nxt]]
+        # Stems that occur in any phrase; every other stem sends the automaton back to the root
+        self._alphabet = frozenset(s for edges in self._goto for s in edges)
+
+    def find(self, stream: Sequence[str]) -> Dict[str, tuple]:
+        """End positions (stem indices) of every phrase in one stream from stem_tokens()."""
+        positions = [[] for _ in self.phrases]
+        goto, fail, out = self._goto, self._fail, self._out
+        alphabet = self._alphabet
+        last_end = {}
+        state = 0
+        previous = -2
+        # Only stems from the phrases can advance the automaton, so the scan visits just
+        # those positions and restarts from the root after a gap
+        for pos in compress(range(len(stream)), map(alphabet.__contains__, stream)):
+            if pos != previous + 1:
+                state = 0
+            previous = pos
+            s = stream[pos]
+            while state and s not in goto[state]:
+                state = fail[state]
+            state = goto[state].get(s, 0)
+            for pid, size in out[state]:
+                if pos - size >= last_end.get(pid, -1):
+                    positions[pid].append(pos)
+                    last_end[pid] = pos
+        return dict(zip(self.phrases, map(tuple, positions)))
+
+    def count(self, stem_streams: Iterable[Sequence[str]]) -> Dict[str, int]:
+        """Occurrences of every phrase in streams from stem_tokens(); streams are scanned separately."""
+        counts = dict.fromkeys(self.phrases, 0)
+        for stream in stem_streams:
+            for phrase, ends in self.find(stream).items():
+                counts[phrase] += len(ends)
+        return counts
+
+
+@lru_cache(maxsize=256)
+def get_phrase_automaton(phrases: tuple) -> PhraseAutomaton:
+    """Cached automaton for a tuple of normalized keyword phrases (an article's keyword set)."""
+    return PhraseAutomaton(phrases)
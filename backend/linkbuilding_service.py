@@ -7,6 +7,8 @@ import json
 import logging
 from emergentintegrations.llm.chat import LlmChat, UserMessage
 
+from article_derived import get_derived
+
 logger = logging.getLogger(__name__)
 
 LINKBUILDING_PROMPT = """Przeanalizuj ponizsze artykuly na blogu ksiegowym i zasugeruj linkowanie wewnetrzne.
@@ -50,12 +52,11 @@ Odpowiedz WYLACZNIE JSON-em:
 
 async def analyze_internal_links(current_article: dict, all_articles: list, emergent_key: str) -> dict:
     """Analyze and suggest internal links for an article."""
-    # Build sections summary
-    sections = []
-    for s in current_article.get("sections", []):
-        sections.append(s.get("heading", ""))
-        for sub in s.get("subsections", []):
-            sections.append(f"  - {sub.get('heading', '')}")
+    # Build sections summary from the stored heading outline
+    sections = [
+        h["heading"] if h["level"] == 2 else f"  - {h['heading']}"
+        for h in get_derived(current_article)["outline"]
+    ]
     sections_str = "\n".join(sections) if sections else "brak"
     
     # Build other articles summary
@@ -0,0 +1,391 @@
+"""
+PDF rendering engine.
+Fonts are registered and paragraph styles built once per process (load_pdf_styles()
+runs at app startup). Section HTML is turned into reportlab flowables in a single
+parse that keeps bold/italic, links and lists, and the flowables are cached per
+section content hash, so exporting an article again only converts the sections
+that changed.
+"""
+
+import copy
+import io
+import logging
+import os
+import threading
+from collections import OrderedDict
+from functools import lru_cache
+from html import escape
+from html.parser import HTMLParser
+from typing import List, Optional
+
+from reportlab.lib.enums import TA_CENTER, TA_JUSTIFY
+from reportlab.lib.pagesizes import A4
+from reportlab.lib.styles import ParagraphStyle, getSampleStyleSheet
+from reportlab.lib.units import cm
+from reportlab.pdfbase import pdfmetrics
+from reportlab.pdfbase.ttfonts import TTFont
+from reportlab.platypus import Paragraph, SimpleDocTemplate, Spacer
+
+from article_derived import get_derived
+from text_core import strip_tags
+
+logger = logging.getLogger(__name__)
+
+FONT_DIR = os.environ.get("PDF_FONT_DIR", "/usr/share/fonts/truetype/dejavu/")
+LINK_COLOR = "#04389E"
+MAX_LIST_DEPTH = 3
+
+# Tags that start and end a paragraph of their own
+_BLOCK_TAGS = {
+    "p", "div", "section", "article", "header", "footer", "figure", "figcaption",
+    "pre", "dt", "dd", "table", "thead", "tbody", "tfoot", "tr",
+}
+_HEADING_TAGS = {"h1", "h2", "h3", "h4", "h5", "h6"}
+# HTML inline tag -> reportlab paragraph markup tag
+_INLINE_TAGS = {
+    "b": "b", "strong": "b", "i": "i", "em": "i", "u": "u",
+    "s": "strike", "strike": "strike", "del": "strike", "sup": "super", "sub": "sub",
+}
+_SKIPPED_TAGS = {"script", "style", "noscript", "template"}
+_LINK_SCHEMES = ("http://", "https://", "mailto:")
+
+
+def _register_fonts() -> dict:
+    """Register the DejaVu family (Polish diacritics); falls back to Helvetica when the files are missing."""
+    files = {
+        "normal": ("DejaVuSans", "DejaVuSans.ttf"),
+        "bold": ("DejaVuSans-Bold", "DejaVuSans-Bold.ttf"),
+        "italic": ("DejaVuSans-Oblique", "DejaVuSans-Oblique.ttf"),
+        "boldItalic": ("DejaVuSans-BoldOblique", "DejaVuSans-BoldOblique.ttf"),
+    }
+    fonts = {}
+    for variant, (name, filename) in files.items():
+        path = os.path.join(FONT_DIR, filename)
+        if os.path.exists(path):
+            if name not in pdfmetrics.getRegisteredFontNames():
+                pdfmetrics.registerFont(TTFont(name, path))
+            fonts[variant] = name
+    if "normal" not in fonts or "bold" not in fonts:
+        logger.warning(f"DejaVu fonts not found in {FONT_DIR} - PDF export falls back to Helvetica")
+        return {"normal": "Helvetica", "bold": "Helvetica-Bold"}
+    # Without oblique files <i> renders upright rather than failing
+    fonts.setdefault("italic", fonts["normal"])
+    fonts.setdefault("boldItalic", fonts["bold"])
+    pdfmetrics.registerFontFamily(fonts["normal"], **fonts)
+    return fonts
+
+
+@lru_cache(maxsize=1)
+def load_pdf_styles() -> dict:
+    """Register fonts and build every paragraph style once; later calls return the same styles."""
+    fonts = _register_fonts()
+    regular, bold = fonts["normal"], fonts["bold"]
+    sample = getSampleStyleSheet()
+
+    styles = {
+        "title": ParagraphStyle(
+            "ArticleTitle", parent=sample["Title"], fontName=bold,
+            fontSize=20, spaceAfter=20, alignment=TA_CENTER
+        ),
+        "h2": ParagraphStyle(
+            "H2Style", parent=sample["Heading2"], fontName=bold,
+            fontSize=16, spaceBefore=20, spaceAfter=10, textColor="#04389E"
+        ),
+        "h3": ParagraphStyle(
+            "H3Style", parent=sample["Heading3"], fontName=bold,
+            fontSize=13, spaceBefore=12, spaceAfter=6, textColor="#1a3a6e"
+        ),
+        "body": ParagraphStyle(
+            "BodyText2", parent=sample["BodyText"], fontName=regular,
+            fontSize=10, leading=14, alignment=TA_JUSTIFY, spaceAfter=8
+        ),
+        "faq_q": ParagraphStyle(
+            "FAQQuestion", parent=sample["Heading4"], fontName=bold,
+            fontSize=11, spaceBefore=10, spaceAfter=4, textColor="#04389E"
+        ),
+    }
+    # Headings inside section content (h4 and below, or stray h1-h3)
+    styles["minor_heading"] = ParagraphStyle(
+        "MinorHeading", parent=styles["body"], fontName=bold, alignment=TA_JUSTIFY, spaceBefore=6, spaceAfter=4
+    )
+    styles["quote"] = ParagraphStyle(
+        "Quote", parent=styles["body"], leftIndent=18, rightIndent=18, textColor="#333333"
+    )
+    for level in range(1, MAX_LIST_DEPTH + 1):
+        styles[f"list{level}"] = ParagraphStyle(
+            f"ListItem{level}", parent=styles["body"], leftIndent=14 + 16 * level,
+            bulletIndent=2 + 16 * level, bulletFontName=regular, spaceAfter=3
+        )
+    return styles
+
+
+class _SectionParser(HTMLParser):
+    """
+    Section HTML -> (style key, paragraph markup, bullet text) blocks in one pass.
+    Inline formatting becomes reportlab markup (<b>, <i>, <a href>); lists become
+    bullet or numbered paragraphs indented by depth; table rows become one
+    paragraph with the cells separated by " | ".
+    """
+
+    def __init__(self):
+        super().__init__(convert_charrefs=True)
+        self.blocks = []
+        self._parts = []
+        self._has_text = False
+        self._open_inline = []  # (markup tag, opening markup) open in the current paragraph
+        self._lists = []  # [ordered, next number] per open list
+        self._style = "body"
+        self._bullet = None
+        self._quote_depth = 0
+        self._skip_depth = 0
+        self._row_cells = 0
+
+    def _base_style(self) -> str:
+        return "quote" if self._quote_depth else "body"
+
+    def _flush(self):
+        if self._has_text:
+            closing = "".join(f"</{tag}>" for tag, _ in reversed(self._open_inline))
+            self.blocks.append((self._style, "".join(self._parts).strip() + closing, self._bullet))
+        # Formatting still open continues in the next paragraph
+        self._parts = [opening for _, opening in self._open_inline]
+        self._has_text = False
+        self._bullet = None
+        self._style = self._base_style()
+
+    def _open(self, markup: str, opening: str):
+        self._parts.append(opening)
+        self._open_inline.append((markup, opening))
+
+    def _close(self, markup: str):
+        """Close `markup` and everything opened inside it, then reopen those (keeps the markup balanced)."""
+        names = [name for name, _ in self._open_inline]
+        if markup not in names:
+            return
+        index = len(names) - 1 - names[::-1].index(markup)
+        inner = self._open_inline[index + 1:]
+        self._parts.extend(f"</{name}>" for name, _ in reversed(self._open_inline[index:]))
+        del self._open_inline[index:]
+        for name, opening in inner:
+            self._open(name, opening)
+
+    def handle_starttag(self, tag, attrs):
+        if tag in _SKIPPED_TAGS:
+            self._skip_depth += 1
+        elif self._skip_depth:
+            return
+        elif tag in _INLINE_TAGS:
+            self._open(_INLINE_TAGS[tag], f"<{_INLINE_TAGS[tag]}>")
+        elif tag == "a":
+            href = dict(attrs).get("href") or ""
+            if href.startswith(_LINK_SCHEMES):
+                self._open("a", f'<a href="{escape(href)}" color="{LINK_COLOR}">')
+        elif tag == "br":
+            if self._has_text:
+                self._parts.append("<br/>")
+        elif tag in ("ul", "ol"):
+            self._flush()
+            self._lists.append([tag == "ol", 1])
+        elif tag == "li":
+            self._flush()
+            if self._lists:
+                current = self._lists[-1]
+                self._bullet = f"{current[1]}." if current[0] else "•"
+                current[1] += 1
+                self._style = f"list{min(len(self._lists), MAX_LIST_DEPTH)}"
+        elif tag == "blockquote":
+            self._flush()
+            self._quote_depth += 1
+            self._style = "quote"
+        elif tag in _HEADING_TAGS:
+            self._flush()
+            self._style = "minor_heading"
+        elif tag in ("td", "th"):
+            if self._row_cells and self._has_text:
+                self._parts.append(" | ")
+            self._row_cells += 1
+        elif tag in _BLOCK_TAGS:
+            self._flush()
+            if tag == "tr":
+                self._row_cells = 0
+
+    def handle_endtag(self, tag):
+        if tag in _SKIPPED_TAGS:
+            self._skip_depth = max(0, self._skip_depth - 1)
+        elif self._skip_depth:
+            return
+        elif tag in _INLINE_TAGS:
+            self._close(_INLINE_TAGS[tag])
+        elif tag == "a":
+            self._close("a")
+        elif tag in ("ul", "ol"):
+            self._flush()
+            if self._lists:
+                self._lists.pop()
+        elif tag == "blockquote":
+            self._flush()
+            self._quote_depth = max(0, self._quote_depth - 1)
+            self._style = self._base_style()
+        elif tag == "li" or tag in _HEADING_TAGS or tag in _BLOCK_TAGS:
+            self._flush()
+
+    def handle_data(self, data):
+        if self._skip_depth:
+            return
+        if data.strip():
+            self._has_text = True
+        elif not self._has_text:
+            return
+        self._parts.append(escape(data, quote=False))
+
+    def close(self):
+        super().close()
+        self._flush()
+
+
+def html_to_blocks(html: str) -> list:
+    """(style key, paragraph markup, bullet text) for each paragraph of an HTML fragment."""
+    parser = _SectionParser()
+    parser.feed(html or "")
+    parser.close()
+    return parser.blocks
+
+
+class _CachedLayoutParagraph(Paragraph):
+    """
+    Paragraph that remembers its line breaking per available width. Shallow copies
+    share the memo, so a cached section is broken into lines once for all exports
+    (every export lays it out in the same frame width). Paragraphs created by
+    split() have no memo and break their lines as usual.
+    """
+
+    def breakLines(self, width):
+        memo = self.__dict__.get("_line_memo")
+        if memo is None:
+            return super().breakLines(width)
+        key = tuple(width) if isinstance(width, (list, tuple)) else width
+        lines = memo.get(key)
+        if lines is None:
+            # breakLines adjusts the widths list in place (bullet width), so pass a copy
+            lines = super().breakLines(list(width) if isinstance(width, (list, tuple)) else width)
+            memo[key] = lines
+        return lines
+
+
+def _paragraph(markup: str, style: ParagraphStyle, bullet: Optional[str] = None, cls=Paragraph) -> Paragraph:
+    try:
+        return cls(markup, style, bulletText=bullet)
+    except ValueError:
+        # Markup reportlab still rejects: keep the text without formatting
+        return cls(escape(strip_tags(markup), quote=False), style, bulletText=bullet)
+
+
+def html_to_flowables(html: str, styles: Optional[dict] = None) -> list:
+    """Reportlab paragraphs for an HTML fragment (uncached)."""
+    styles = styles or load_pdf_styles()
+    return [_paragraph(markup, styles[style], bullet) for style, markup, bullet in html_to_blocks(html)]
+
+
+def _cacheable_flowables(html: str) -> tuple:
+    """Paragraphs for a cached section, with a line-breaking memo shared by their copies."""
+    styles = load_pdf_styles()
+    flowables = []
+    for style, markup, bullet in html_to_blocks(html):
+        paragraph = _paragraph(markup, styles[style], bullet, cls=_CachedLayoutParagraph)
+        paragraph._line_memo = {}
+        flowables.append(paragraph)
+    return tuple(flowables)
+
+
+class _FlowableCache:
+    """
+    Thread-safe LRU cache of converted section flowables keyed by content hash.
+    Layout stores its results on the flowable (wrap/split), so every caller gets
+    shallow copies; the parsed fragments and the line-breaking memo are shared.
+    """
+
+    def __init__(self, maxsize: int):
+        self.maxsize = maxsize
+        self._entries = OrderedDict()
+        self._lock = threading.Lock()
+        self.hits = 0
+        self.misses = 0
+
+    def get(self, content_hash: str, html: str) -> list:
+        with self._lock:
+            flowables = self._entries.get(content_hash)
+            if flowables is not None:
+                self._entries.move_to_end(content_hash)
+                self.hits += 1
+            else:
+                self.misses += 1
+        if flowables is None:
+            flowables = _cacheable_flowables(html)
+            with self._lock:
+                self._entries[content_hash] = flowables
+                if len(self._entries) > self.maxsize:
+                    self._entries.popitem(last=False)
+        return [copy.copy(f) for f in flowables]
+
+    def clear(self):
+        with self._lock:
+            self._entries.clear()
+            self.hits = self.misses = 0
+
+    def info(self) -> dict:
+        with self._lock:
+            return {"size": len(self._entries), "maxsize": self.maxsize, "hits": self.hits, "misses": self.misses}
+
+
+_flowable_cache = _FlowableCache(maxsize=int(os.environ.get("PDF_SECTION_CACHE_SIZE", "1024")))
+
+
+def get_pdf_cache_info() -> dict:
+    """Hit/miss statistics of the per-section flowable cache."""
+    return _flowable_cache.info()
+
+
+def clear_pdf_cache():
+    """Drop all cached section flowables."""
+    _flowable_cache.clear()
+
+
+def render_article_pdf(article: dict) -> bytes:
+    """Render an article (title, sections, FAQ, sources) as an A4 PDF."""
+    styles = load_pdf_styles()
+    buffer = io.BytesIO()
+    doc = SimpleDocTemplate(
+        buffer,
+        pagesize=A4,
+        rightMargin=2*cm,
+        leftMargin=2*cm,
+        topMargin=2*cm,
+        bottomMargin=2*cm
+    )
+
+    elements: List = [
+        _paragraph(escape(article.get("title", "Artykuł"), quote=False), styles["title"]),
+        Spacer(1, 12),
+    ]
+
+    # Section bodies come from the cache keyed by the derived content hashes
+    for section, derived in zip(article.get("sections", []), get_derived(article)["sections"]):
+        elements.append(_paragraph(escape(section.get("heading", ""), quote=False), styles["h2"]))
+        elements.extend(_flowable_cache.get(derived["content_hash"], section.get("content", "")))
+        for sub, derived_sub in zip(section.get("subsections", []), derived["subsections"]):
+            elements.append(_paragraph(escape(sub.get("heading", ""), quote=False), styles["h3"]))
+            elements.extend(_flowable_cache.get(derived_sub["content_hash"], sub.get("content", "")))
+
+    elements.append(Spacer(1, 20))
+    elements.append(Paragraph("Najczesciej zadawane pytania (FAQ)", styles["h2"]))
+    for faq in article.get("faq", []):
+        elements.append(_paragraph(escape(faq.get("question", ""), quote=False), styles["faq_q"]))
+        elements.extend(html_to_flowables(faq.get("answer", ""), styles))
+
+    elements.append(Spacer(1, 20))
+    elements.append(Paragraph("Zrodla", styles["h2"]))
+    for src in article.get("sources", []):
+        elements.append(_paragraph(escape(f"- {src.get('name', '')} ({src.get('url', '')})", quote=False), styles["body"]))
+
+    doc.build(elements)
+    return buffer.getvalue()
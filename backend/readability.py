@@ -0,0 +1,231 @@
+"""
+Readability Analytics for Polish articles.
+Splits article bodies into paragraphs and sentences, then computes per-sentence
+statistics as NumPy arrays: length in words, long-word ratio and a syllable-based
+FOG-PL index (hard words = 4+ syllables). A whole workspace is processed as one set
+of flat arrays, so per-article and per-section distributions and outlier paragraphs
+come from a few vectorised reductions.
+"""
+
+import html as html_lib
+import re
+from functools import lru_cache
+from typing import Iterable, List
+
+import numpy as np
+
+from text_core import split_sentences, strip_tags
+
+# Block-level tags that end a paragraph
+_BLOCK_SPLIT_RE = re.compile(
+    r'</?(?:p|li|div|ul|ol|h[1-6]|blockquote|table|tr|td|th|br|section)\b[^>]*>', re.IGNORECASE
+)
+_WORD_RE = re.compile(r'[^\W\d_]+(?:-[^\W\d_]+)*|\d+(?:[.,]\d+)*')
+_VOWEL_GROUP_RE = re.compile(r'[aąeęioóuy]+')
+
+# A word with this many syllables counts as long/hard (FOG-PL)
+LONG_WORD_SYLLABLES = 4
+# Paragraphs this far above the workspace median (in MADs) are reported as outliers
+OUTLIER_MAD_FACTOR = 3.0
+MIN_OUTLIER_WORDS = 20
+
+
+@lru_cache(maxsize=65536)
+def count_syllables(word: str) -> int:
+    """Polish syllables approximated by vowel groups; "i" before a vowel only softens ("nie", "sie")."""
+    groups = _VOWEL_GROUP_RE.findall(word.lower())
+    count = 0
+    for group in groups:
+        # "ia", "ie", "io", "iu", "ią", "ię" are one syllable; other runs are one per vowel
+        if len(group) > 1 and group[0] == "i":
+            group = group[1:]
+        count += len(group)
+    return max(count, 1) if word[:1].isalpha() else 1
+
+
+def split_paragraphs(html: str) -> List[str]:
+    """Plain-text paragraphs of an HTML fragment."""
+    paragraphs = []
+    for block in _BLOCK_SPLIT_RE.split(html or ""):
+        text = html_lib.unescape(strip_tags(block)).strip()
+        if text:
+            paragraphs.append(" ".join(text.split()))
+    return paragraphs
+
+
+def _fog(words: np.ndarray, sentences: np.ndarray, long_words: np.ndarray) -> np.ndarray:
+    """FOG-PL: 0.4 * (words per sentence + 100 * share of hard words)."""
+    with np.errstate(divide="ignore", invalid="ignore"):
+        per_sentence = np.where(sentences > 0, words / np.maximum(sentences, 1), 0.0)
+        long_ratio = np.where(words > 0, long_words / np.maximum(words, 1), 0.0)
+    return 0.4 * (per_sentence + 100.0 * long_ratio)
+
+
+def _percentiles(values: np.ndarray) -> dict:
+    if values.size == 0:
+        return {"p10": 0.0, "p50": 0.0, "p90": 0.0}
+    p10, p50, p90 = np.percentile(values, [10, 50, 90])
+    return {"p10": round(float(p10), 2), "p50": round(float(p50), 2), "p90": round(float(p90), 2)}
+
+
+class _Corpus:
+    """Flat per-sentence arrays for many articles, with paragraph/section/article ids."""
+
+    def __init__(self):
+        self.sentence_words = []
+        self.sentence_paragraph = []
+        self.word_syllables = []
+        # (article_idx, section_idx, paragraph_text) per paragraph
+        self.paragraphs = []
+        # (article_idx, heading, anchor) per section
+        self.sections = []
+        self.paragraph_section = []
+
+    def add_article(self, article_idx: int, article: dict):
+        for section in article.get("sections", []):
+            fragments = [section.get("content", "")] + [s.get("content", "") for s in section.get("subsections", [])]
+            section_idx = len(self.sections)
+            self.sections.append((article_idx, section.get("heading", ""), section.get("anchor", "")))
+            for fragment in fragments:
+                for paragraph in split_paragraphs(fragment):
+                    self._add_paragraph(article_idx, section_idx, paragraph)
+
+    def _add_paragraph(self, article_idx: int, section_idx: int, paragraph: str):
+        paragraph_idx = len(self.paragraphs)
+        self.paragraphs.append((article_idx, section_idx, paragraph))
+        self.paragraph_section.append(section_idx)
+        for sentence in split_sentences(paragraph):
+            words = _WORD_RE.findall(sentence)
+            if not words:
+                continue
+            self.sentence_words.append(len(words))
+            self.sentence_paragraph.append(paragraph_idx)
+            self.word_syllables.extend(map(count_syllables, words))
+
+    def arrays(self) -> dict:
+        sentence_words = np.asarray(self.sentence_words, dtype=np.int64)
+        syllables = np.asarray(self.word_syllables, dtype=np.float64)
+        word_sentence = np.repeat(np.arange(sentence_words.size), sentence_words)
+        n_sentences = sentence_words.size
+        sentence_paragraph = np.asarray(self.sentence_paragraph, dtype=np.int64)
+        paragraph_section = np.asarray(self.paragraph_section, dtype=np.int64)
+        section_article = np.asarray([s[0] for s in self.sections], dtype=np.int64)
+        sentence_section = paragraph_section[sentence_paragraph] if sentence_paragraph.size else sentence_paragraph
+        sentence_article = section_article[sentence_section] if sentence_section.size else sentence_section
+        return {
+            "words": sentence_words.astype(np.float64),
+            "long": np.bincount(word_sentence, weights=syllables >= LONG_WORD_SYLLABLES, minlength=n_sentences),
+            "syllables": np.bincount(word_sentence, weights=syllables, minlength=n_sentences),
+            "paragraph": sentence_paragraph,
+            "section": sentence_section,
+            "article": sentence_article,
+        }
+
+
+def _group_stats(arrays: dict, key: str, size: int) -> dict:
+    """Per-group sums of sentences, words, long words and syllables via bincount."""
+    ids = arrays[key]
+    return {
+        "sentences": np.bincount(ids, minlength=size).astype(np.float64),
+        "words": np.bincount(ids, weights=arrays["words"], minlength=size),
+        "long": np.bincount(ids, weights=arrays["long"], minlength=size),
+        "syllables": np.bincount(ids, weights=arrays["syllables"], minlength=size),
+    }
+
+
+def _stats_entry(stats: dict, i: int, fog: np.ndarray) -> dict:
+    sentences = int(stats["sentences"][i])
+    words = int(stats["words"][i])
+    return {
+        "sentences": sentences,
+        "words": words,
+        "avg_sentence_length": round(words / sentences, 2) if sentences else 0.0,
+        "long_word_ratio": round(float(stats["long"][i]) / words, 4) if words else 0.0,
+        "syllables_per_word": round(float(stats["syllables"][i]) / words, 3) if words else 0.0,
+        "fog_index": round(float(fog[i]), 2),
+    }
+
+
+def analyze_readability(articles: Iterable[dict], outlier_limit: int = 50) -> dict:
+    """
+    Readability of many articles at once.
+    Returns a workspace summary with distributions, per-article and per-section
+    statistics and the paragraphs that are outliers against the workspace median.
+    """
+    articles = list(articles)
+    corpus = _Corpus()
+    for i, article in enumerate(articles):
+        corpus.add_article(i, article)
+    arrays = corpus.arrays()
+
+    n_articles, n_sections, n_paragraphs = len(articles), len(corpus.sections), len(corpus.paragraphs)
+    by_article = _group_stats(arrays, "article", n_articles)
+    by_section = _group_stats(arrays, "section", n_sections)
+    by_paragraph = _group_stats(arrays, "paragraph", n_paragraphs)
+    article_fog = _fog(by_article["words"], by_article["sentences"], by_article["long"])
+    section_fog = _fog(by_section["words"], by_section["sentences"], by_section["long"])
+    paragraph_fog = _fog(by_paragraph["words"], by_paragraph["sentences"], by_paragraph["long"])
+    sentence_fog = _fog(arrays["words"], np.ones_like(arrays["words"]), arrays["long"])
+
+    # Per-article sentence-length distribution (sorted once, sliced per article)
+    order = np.argsort(arrays["article"], kind="stable")
+    bounds = np.searchsorted(arrays["article"][order], np.arange(n_articles + 1))
+    sorted_words = arrays["words"][order]
+
+    section_entries = [[] for _ in range(n_articles)]
+    for j, (article_idx, heading, anchor) in enumerate(corpus.sections):
+        section_entries[article_idx].append({"heading": heading, "anchor": anchor, **_stats_entry(by_section, j, section_fog)})
+
+    article_entries = []
+    for i, article in enumerate(articles):
+        lengths = sorted_words[bounds[i]:bounds[i + 1]]
+        article_entries.append({
+            "id": article.get("id"),
+            "title": article.get("title", ""),
+            **_stats_entry(by_article, i, article_fog),
+            "sentence_length": _percentiles(lengths),
+            "sections": section_entries[i],
+        })
+
+    # Outlier paragraphs: FOG far above the workspace median (robust MAD scale)
+    outliers = []
+    candidates = np.flatnonzero(by_paragraph["words"] >= MIN_OUTLIER_WORDS)
+    if candidates.size:
+        fog_values = paragraph_fog[candidates]
+        median = float(np.median(fog_values))
+        mad = float(np.median(np.abs(fog_values - median))) or 1.0
+        scores = (fog_values - median) / mad
+        flagged = candidates[scores > OUTLIER_MAD_FACTOR]
+        flagged = flagged[np.argsort(-paragraph_fog[flagged], kind="stable")][:outlier_limit]
+        for p in flagged:
+            article_idx, section_idx, text = corpus.paragraphs[p]
+            entry = _stats_entry(by_paragraph, p, paragraph_fog)
+            outliers.append({
+                "article_id": articles[article_idx].get("id"),
+                "section_anchor": corpus.sections[section_idx][2],
+                "fog_index": entry["fog_index"],
+                "avg_sentence_length": entry["avg_sentence_length"],
+                "long_word_ratio": entry["long_word_ratio"],
+                "excerpt": text[:200],
+            })
+
+    total_words = float(arrays["words"].sum())
+    total_sentences = int(arrays["words"].size)
+    return {
+        "summary": {
+            "articles": n_articles,
+            "sections": n_sections,
+            "paragraphs": n_paragraphs,
+            "sentences": total_sentences,
+            "words": int(total_words),
+            "avg_sentence_length": round(total_words / total_sentences, 2) if total_sentences else 0.0,
+            "long_word_ratio": round(float(arrays["long"].sum()) / total_words, 4) if total_words else 0.0,
+            "fog_index": round(float(_fog(np.array([total_words]), np.array([total_sentences]),
+                                          np.array([arrays["long"].sum()]))[0]), 2),
+            "sentence_length": _percentiles(arrays["words"]),
+            "sentence_fog": _percentiles(sentence_fog),
+            "article_fog": _percentiles(article_fog[by_article["sentences"] > 0]),
+        },
+        "articles": article_entries,
+        "outliers": outliers,
+    }
@@ -8,8 +8,13 @@ import re
 import os
 import logging
 import uuid
+import hashlib
+from typing import Optional
 from emergentintegrations.llm.chat import LlmChat, UserMessage
 
+from article_derived import get_derived
+from text_core import plain_text
+
 logger = logging.getLogger(__name__)
 
 SEO_ASSISTANT_SYSTEM_PROMPT = """Jestes ekspertem SEO specjalizujacym sie w tresciach ksiegowych, podatkowych i rachunkowych w Polsce.
@@ -102,14 +107,51 @@ Jesli pytanie nie wymaga sugestii, zwroc pusta liste suggestions.
 Zawsze odpowiadaj po polsku, konkretnie i merytorycznie.
 """
 
+ANALYZE_SECTIONS_PROMPT = """Artykul blogowy zostal czesciowo zmieniony. Przeanalizuj pod katem SEO WYLACZNIE ponizsze zmienione sekcje.
+
+TEMAT: {topic}
+SLOWO KLUCZOWE GLOWNE: {primary_keyword}
+SLOWA KLUCZOWE DODATKOWE: {secondary_keywords}
+
+AKTUALNY WYNIK SEO: {seo_score}%
+LICZBA SLOW CALEGO ARTYKULU: {word_count}
+
+ZMIENIONE SEKCJE (HTML):
+{sections_content}
+
+Odpowiedz WYLACZNIE w formacie JSON (bez markdown, bez ```json):
+{{
+  "assistant_message": "Krotkie podsumowanie analizy zmienionych sekcji (1-2 zdania po polsku)",
+  "suggestions": [
+    {{
+      "id": "unikalny-id-sugestii",
+      "title": "Krotki tytul sugestii",
+      "category": "headings|content|keywords|readability",
+      "impact": "high|medium|low",
+      "rationale": "Dlaczego ta zmiana jest wazna dla SEO",
+      "current_value": "Obecna wartosc (jesli dotyczy)",
+      "proposed_value": "Proponowana nowa wartosc",
+      "apply_target": "html_content|none",
+      "section_anchor": "anchor sekcji, ktorej dotyczy sugestia"
+    }}
+  ]
+}}
+
+WAZNE:
+- Zaproponuj 1-5 sugestii dotyczacych tylko podanych sekcji.
+- Sugestie dotyczace tresci HTML powinny byc konkretnymi akapitami/zdaniami do dodania lub modyfikacji.
+"""
+
+# Maximum number of changed H2 sections for which an incremental re-analysis is offered
+INCREMENTAL_MAX_CHANGED_SECTIONS = 3
+
 
 def _truncate_html(html: str, max_chars: int = 6000) -> str:
     """Truncate HTML content for prompt context."""
     if not html:
         return ""
     # Strip tags for analysis, keep structure indicators
-    clean = re.sub(r'<[^>]+>', ' ', html)
-    clean = re.sub(r'\s+', ' ', clean).strip()
+    clean = plain_text(html)
     if len(clean) > max_chars:
         return clean[:max_chars] + "... [skrocono]"
     return clean
@@ -125,6 +167,123 @@ def _build_html_from_sections(article: dict) -> str:
     return html
 
 
+def _hash_payload(payload) -> str:
+    """Stable SHA-256 hash of a JSON-serializable payload."""
+    raw = json.dumps(payload, ensure_ascii=False, sort_keys=True, default=str)
+    return hashlib.sha256(raw.encode("utf-8")).hexdigest()
+
+
+def _build_analyze_context(article: dict) -> dict:
+    """Build the values that are formatted into ANALYZE_PROMPT."""
+    html_content = article.get("html_content") or _build_html_from_sections(article)
+    faq_summary = ""
+    for faq in article.get("faq", [])[:6]:
+        faq_summary += f"Q: {faq.get('question', '')}\nA: {faq.get('answer', '')[:100]}...\n\n"
+    
+    seo_score = article.get("seo_score", {})
+    sections = article.get("sections", [])
+    
+    word_count = seo_score.get("word_count", 0) or get_derived(article)["word_count"]
+    
+    return {
+        "topic": article.get("topic", ""),
+        "primary_keyword": article.get("primary_keyword", ""),
+        "secondary_keywords": json.dumps(article.get("secondary_keywords", []), ensure_ascii=False),
+        "meta_title": article.get("meta_title", ""),
+        "meta_description": article.get("meta_description", ""),
+        "seo_score": seo_score.get("percentage", 0),
+        "html_content_truncated": _truncate_html(html_content),
+        "faq_summary": faq_summary or "Brak FAQ",
+        "h2_count": len(sections),
+        "word_count": word_count,
+    }
+
+
+def compute_analysis_fingerprint(article: dict) -> str:
+    """Hash of everything that feeds ANALYZE_PROMPT - equal hashes mean an identical prompt."""
+    return _hash_payload(_build_analyze_context(article))
+
+
+def compute_context_fingerprint(article: dict) -> str:
+    """Hash of the prompt fields that do not come from the article sections."""
+    context = _build_analyze_context(article)
+    return _hash_payload({
+        key: context[key]
+        for key in ("topic", "primary_keyword", "secondary_keywords", "meta_title", "meta_description", "faq_summary")
+    })
+
+
+def compute_section_hashes(article: dict) -> list:
+    """Content hash per H2 section (heading, content and subsections)."""
+    return [
+        {
+            "anchor": section.get("anchor", ""),
+            "hash": _hash_payload({
+                "heading": section.get("heading", ""),
+                "content": section.get("content", ""),
+                "subsections": [
+                    [sub.get("heading", ""), sub.get("content", "")]
+                    for sub in section.get("subsections", [])
+                ],
+            }),
+        }
+        for section in article.get("sections", [])
+    ]
+
+
+def build_analysis_cache_entry(article: dict, result: dict) -> dict:
+    """Build the cached analysis document stored per article."""
+    return {
+        "article_id": article.get("id"),
+        "fingerprint": compute_analysis_fingerprint(article),
+        "context_fingerprint": compute_context_fingerprint(article),
+        "section_hashes": compute_section_hashes(article),
+        "result": result,
+        "stale": False,
+    }
+
+
+def find_changed_sections(cache_entry: Optional[dict], article: dict) -> Optional[list]:
+    """
+    Compare a cached analysis with the current article.
+    Returns indices of changed sections when an incremental re-analysis makes sense,
+    otherwise None (nothing cached, structure or meta/keywords changed, or too many changes).
+    """
+    if not cache_entry or not cache_entry.get("result"):
+        return None
+    if cache_entry.get("context_fingerprint") != compute_context_fingerprint(article):
+        return None
+    
+    previous = cache_entry.get("section_hashes", [])
+    current = compute_section_hashes(article)
+    if len(previous) != len(current):
+        return None
+    
+    changed = [i for i, (old, new) in enumerate(zip(previous, current)) if old["hash"] != new["hash"]]
+    if not changed or len(changed) > INCREMENTAL_MAX_CHANGED_SECTIONS or len(changed) == len(current):
+        return None
+    return changed
+
+
+def _merge_incremental_suggestions(previous: list, fresh: list, article: dict, changed_anchors: set) -> list:
+    """
+    Keep previous suggestions that are still valid after a partial edit:
+    meta/FAQ suggestions (those fields did not change) and content suggestions
+    that neither point at a changed section nor quote text which no longer exists.
+    """
+    article_text = plain_text(_build_html_from_sections(article))
+    kept = []
+    for suggestion in previous:
+        if suggestion.get("apply_target") == "html_content":
+            if suggestion.get("section_anchor") in changed_anchors:
+                continue
+            quoted = plain_text(suggestion.get("current_value") or "")
+            if quoted and quoted not in article_text:
+                continue
+        kept.append(suggestion)
+    return fresh + kept
+
+
 def _clean_json_response(response: str) -> dict:
     """Clean and parse JSON from LLM response."""
     clean = response.strip()
@@ -140,32 +299,7 @@ async def analyze_article_seo(article: dict) -> dict:
     if not api_key:
         raise ValueError("EMERGENT_LLM_KEY not configured")
     
-    # Build context
-    html_content = article.get("html_content") or _build_html_from_sections(article)
-    faq_summary = ""
-    for faq in article.get("faq", [])[:6]:
-        faq_summary += f"Q: {faq.get('question', '')}\nA: {faq.get('answer', '')[:100]}...\n\n"
-    
-    seo_score = article.get("seo_score", {})
-    sections = article.get("sections", [])
-    
-    word_count = seo_score.get("word_count", 0)
-    if word_count == 0:
-        text = re.sub(r'<[^>]+>', ' ', html_content)
-        word_count = len(text.split())
-    
-    prompt = ANALYZE_PROMPT.format(
-        topic=article.get("topic", ""),
-        primary_keyword=article.get("primary_keyword", ""),
-        secondary_keywords=json.dumps(article.get("secondary_keywords", []), ensure_ascii=False),
-        meta_title=article.get("meta_title", ""),
-        meta_description=article.get("meta_description", ""),
-        seo_score=seo_score.get("percentage", 0),
-        html_content_truncated=_truncate_html(html_content),
-        faq_summary=faq_summary or "Brak FAQ",
-        h2_count=len(sections),
-        word_count=word_count
-    )
+    prompt = ANALYZE_PROMPT.format(**_build_analyze_context(article))
     
     session_id = f"seo-assistant-{article.get('id', 'unknown')}-{uuid.uuid4().hex[:6]}"
     
@@ -193,6 +327,55 @@ async def analyze_article_seo(article: dict) -> dict:
     return result
 
 
+async def analyze_article_sections(article: dict, section_indices: list, previous_result: dict) -> dict:
+    """
+    Incremental re-analysis: send only the changed sections to the model and
+    merge the fresh suggestions with the still-valid ones from the previous analysis.
+    """
+    api_key = os.environ.get("EMERGENT_LLM_KEY")
+    if not api_key:
+        raise ValueError("EMERGENT_LLM_KEY not configured")
+    
+    sections = article.get("sections", [])
+    changed = [sections[i] for i in section_indices if 0 <= i < len(sections)]
+    context = _build_analyze_context(article)
+    
+    prompt = ANALYZE_SECTIONS_PROMPT.format(
+        topic=context["topic"],
+        primary_keyword=context["primary_keyword"],
+        secondary_keywords=context["secondary_keywords"],
+        seo_score=context["seo_score"],
+        word_count=context["word_count"],
+        sections_content=_truncate_html(_build_html_from_sections({"sections": changed}))
+    )
+    
+    session_id = f"seo-assistant-{article.get('id', 'unknown')}-{uuid.uuid4().hex[:6]}"
+    
+    chat = LlmChat(
+        api_key=api_key,
+        session_id=session_id,
+        system_message=SEO_ASSISTANT_SYSTEM_PROMPT
+    )
+    chat.with_model("openai", "gpt-5.2")
+    
+    response = await chat.send_message(UserMessage(text=prompt))
+    result = _clean_json_response(response)
+    
+    fresh = result.get("suggestions") or []
+    for s in fresh:
+        if "id" not in s or not s["id"]:
+            s["id"] = f"sug-{uuid.uuid4().hex[:8]}"
+    
+    changed_anchors = {s.get("anchor", "") for s in changed}
+    return {
+        "assistant_message": result.get("assistant_message") or "Analiza zmienionych sekcji zakonczona.",
+        "suggestions": _merge_incremental_suggestions(
+            (previous_result or {}).get("suggestions", []), fresh, article, changed_anchors
+        ),
+        "analyzed_sections": sorted(changed_anchors),
+    }
+
+
 async def chat_about_seo(article: dict, user_message: str, conversation_history: list) -> dict:
     """Interactive chat about SEO improvements for an article."""
     api_key = os.environ.get("EMERGENT_LLM_KEY")
@@ -210,8 +393,7 @@ async def chat_about_seo(article: dict, user_message: str, conversation_history:
     
     seo_score = article.get("seo_score", {})
     html_content = article.get("html_content") or _build_html_from_sections(article)
-    text = re.sub(r'<[^>]+>', ' ', html_content)
-    word_count = seo_score.get("word_count", len(text.split()))
+    word_count = seo_score.get("word_count") or get_derived(article)["word_count"]
     
     prompt = CHAT_PROMPT.format(
         topic=article.get("topic", ""),
@@ -10,6 +10,8 @@ import httpx
 from bs4 import BeautifulSoup
 from emergentintegrations.llm.chat import LlmChat, UserMessage
 
+from cpu_executor import run_cpu
+
 logger = logging.getLogger(__name__)
 
 AUDIT_PROMPT = """Przeprowadz kompleksowy audyt SEO ponizszej strony.
@@ -80,72 +82,77 @@ Odpowiedz WYLACZNIE JSON-em:
 }}"""
 
 
+def _extract_audit_data(html: str, url: str) -> dict:
+    """SEO-relevant data of a scraped page (blocking BeautifulSoup work)."""
+    soup = BeautifulSoup(html, "html.parser")
+
+    title = soup.find("title")
+    title_text = title.get_text(strip=True) if title else ""
+
+    meta_desc = ""
+    md_tag = soup.find("meta", attrs={"name": "description"})
+    if md_tag:
+        meta_desc = md_tag.get("content", "")
+
+    h1s = [h.get_text(strip=True) for h in soup.find_all("h1")]
+    h2s = [h.get_text(strip=True) for h in soup.find_all("h2")]
+
+    for tag in soup(["script", "style", "nav", "footer", "header", "aside"]):
+        tag.decompose()
+    text = soup.get_text(separator=" ", strip=True)
+    word_count = len(text.split())
+
+    imgs = soup.find_all("img")
+    imgs_with_alt = sum(1 for img in imgs if img.get("alt", "").strip())
+    imgs_without_alt = len(imgs) - imgs_with_alt
+
+    links = soup.find_all("a", href=True)
+    from urllib.parse import urlparse
+    base_domain = urlparse(url).netloc
+    internal = sum(1 for l in links if base_domain in (urlparse(l["href"]).netloc or base_domain))
+    external = len(links) - internal
+
+    canonical = ""
+    can_tag = soup.find("link", attrs={"rel": "canonical"})
+    if can_tag:
+        canonical = can_tag.get("href", "")
+
+    robots = ""
+    rob_tag = soup.find("meta", attrs={"name": "robots"})
+    if rob_tag:
+        robots = rob_tag.get("content", "")
+
+    has_schema = bool(soup.find("script", attrs={"type": "application/ld+json"}))
+    has_og = bool(soup.find("meta", attrs={"property": re.compile(r"^og:")}))
+
+    return {
+        "url": url,
+        "title": title_text,
+        "meta_desc": meta_desc,
+        "h1s": h1s[:5],
+        "h2s": h2s[:10],
+        "word_count": word_count,
+        "imgs_with_alt": imgs_with_alt,
+        "imgs_without_alt": imgs_without_alt,
+        "internal_links": internal,
+        "external_links": external,
+        "has_ssl": url.startswith("https"),
+        "canonical": canonical,
+        "robots": robots,
+        "has_schema": has_schema,
+        "has_og": has_og,
+        "content_sample": text[:2000]
+    }
+
+
 async def scrape_for_audit(url: str) -> dict:
     """Scrape a URL and extract SEO-relevant data."""
     async with httpx.AsyncClient(timeout=30.0, follow_redirects=True, verify=False) as client:
         headers = {"User-Agent": "Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36"}
         response = await client.get(url, headers=headers)
         response.raise_for_status()
-        html = response.text
-        soup = BeautifulSoup(html, "html.parser")
-
-        title = soup.find("title")
-        title_text = title.get_text(strip=True) if title else ""
-
-        meta_desc = ""
-        md_tag = soup.find("meta", attrs={"name": "description"})
-        if md_tag:
-            meta_desc = md_tag.get("content", "")
-
-        h1s = [h.get_text(strip=True) for h in soup.find_all("h1")]
-        h2s = [h.get_text(strip=True) for h in soup.find_all("h2")]
-
-        for tag in soup(["script", "style", "nav", "footer", "header", "aside"]):
-            tag.decompose()
-        text = soup.get_text(separator=" ", strip=True)
-        word_count = len(text.split())
-
-        imgs = soup.find_all("img")
-        imgs_with_alt = sum(1 for img in imgs if img.get("alt", "").strip())
-        imgs_without_alt = len(imgs) - imgs_with_alt
-
-        links = soup.find_all("a", href=True)
-        from urllib.parse import urlparse
-        base_domain = urlparse(url).netloc
-        internal = sum(1 for l in links if base_domain in (urlparse(l["href"]).netloc or base_domain))
-        external = len(links) - internal
-
-        canonical = ""
-        can_tag = soup.find("link", attrs={"rel": "canonical"})
-        if can_tag:
-            canonical = can_tag.get("href", "")
-
-        robots = ""
-        rob_tag = soup.find("meta", attrs={"name": "robots"})
-        if rob_tag:
-            robots = rob_tag.get("content", "")
-
-        has_schema = bool(soup.find("script", attrs={"type": "application/ld+json"}))
-        has_og = bool(soup.find("meta", attrs={"property": re.compile(r"^og:")}))
-
-        return {
-            "url": url,
-            "title": title_text,
-            "meta_desc": meta_desc,
-            "h1s": h1s[:5],
-            "h2s": h2s[:10],
-            "word_count": word_count,
-            "imgs_with_alt": imgs_with_alt,
-            "imgs_without_alt": imgs_without_alt,
-            "internal_links": internal,
-            "external_links": external,
-            "has_ssl": url.startswith("https"),
-            "canonical": canonical,
-            "robots": robots,
-            "has_schema": has_schema,
-            "has_og": has_og,
-            "content_sample": text[:2000]
-        }
+
+    return await run_cpu(_extract_audit_data, response.text, url)
 
 
 async def run_seo_audit(url: str, emergent_key: str) -> dict:
@@ -3,51 +3,33 @@ Advanced SEO Scoring Engine for Polish accounting articles.
 Scores articles on multiple dimensions and provides actionable recommendations.
 """
 
-import re
-from typing import Dict, List
+import hashlib
+import os
+import threading
+from collections import Counter, OrderedDict
+from itertools import chain
+import time
+from functools import cached_property, lru_cache
+from typing import Callable, Dict, Iterable, List, Optional
 
-# Polish stop words to ignore in keyword matching
-POLISH_STOP_WORDS = {
-    "w", "z", "i", "do", "na", "nie", "się", "o", "od", "za", "po", "ze",
-    "dla", "jak", "co", "to", "jest", "są", "lub", "oraz", "a", "czy",
-    "przy", "przez", "nad", "pod", "przed", "między", "bez", "ku",
-    "roku", "r", "r.", "nr", "poz", "art", "ust", "pkt"
-}
+from keyword_matcher import get_keyword_matcher, get_phrase_automaton, stem_tokens, word_stems
+from text_core import strip_tags, tokenize
+
+# The keyword must appear within the first N words of the body
+FIRST_WORDS_LIMIT = 150
+
+# Keyword distribution: heatmap slices of the body and cap on reported positions
+DISTRIBUTION_BINS = 20
+MAX_DISTRIBUTION_POSITIONS = 500
 
 
 def _extract_keyword_terms(keyword: str) -> list:
     """Extract significant terms from a keyword phrase, ignoring stop words."""
-    words = keyword.lower().split()
-    return [w for w in words if w not in POLISH_STOP_WORDS and len(w) > 2]
+    return get_keyword_matcher(keyword.lower().strip()).terms
 
 
-def _flexible_keyword_count(text: str, keyword: str) -> tuple:
-    """
-    Count keyword occurrences with flexible matching.
-    Returns (exact_count, flexible_count, matched_terms_ratio).
-    """
-    text_lower = text.lower()
-    kw_lower = keyword.lower().strip()
-    
-    if not kw_lower:
-        return (0, 0, 0.0)
-    
-    # 1. Exact match
-    exact_count = text_lower.count(kw_lower)
-    
-    # 2. Flexible match - count how many significant terms appear
-    terms = _extract_keyword_terms(kw_lower)
-    if not terms:
-        return (exact_count, exact_count, 1.0 if exact_count > 0 else 0.0)
-    
-    term_counts = {}
-    for term in terms:
-        # Match whole word boundaries to avoid partial matches
-        pattern = re.compile(r'\b' + re.escape(term) + r'\w{0,3}\b', re.IGNORECASE)
-        matches = pattern.findall(text_lower)
-        term_counts[term] = len(matches)
-    
-    # Count occurrences where most terms appear near each other (within ~50 chars)
+def _combine_keyword_counts(exact_count: int, term_counts: Dict[str, int], terms: list) -> tuple:
+    """Combine phrase and per-term counts into (exact_count, flexible_count, matched_terms_ratio)."""
     terms_present = sum(1 for t in terms if term_counts.get(t, 0) > 0)
     matched_ratio = terms_present / len(terms) if terms else 0.0
     
@@ -57,56 +39,441 @@ def _flexible_keyword_count(text: str, keyword: str) -> tuple:
     else:
         flexible_count = 0
     
-    # Combine: exact matches count fully, flexible matches count partially
+    # Combine: phrase matches count fully, scattered term matches count partially
     total_effective = exact_count + (flexible_count - exact_count) * 0.7 if flexible_count > exact_count else exact_count
     
     return (exact_count, max(int(total_effective), exact_count), matched_ratio)
 
 
-def _keyword_in_text(text: str, keyword: str) -> bool:
-    """Check if keyword (or its significant terms) appear in text."""
+def _flexible_keyword_count(text: str, keyword: str) -> tuple:
+    """
+    Count keyword occurrences with inflection-aware matching.
+    The phrase count includes inflected forms (podatku VAT for "podatek vat").
+    Returns (exact_count, flexible_count, matched_terms_ratio).
+    """
     text_lower = text.lower()
     kw_lower = keyword.lower().strip()
     
     if not kw_lower:
-        return False
+        return (0, 0, 0.0)
     
-    # Exact match
-    if kw_lower in text_lower:
-        return True
+    matcher = get_keyword_matcher(kw_lower)
+    if not matcher.terms:
+        exact_count = text_lower.count(kw_lower)
+        return (exact_count, exact_count, 1.0 if exact_count > 0 else 0.0)
     
-    # Flexible: check if most significant terms are present
-    terms = _extract_keyword_terms(kw_lower)
-    if not terms:
+    stems = stem_tokens(tokenize(text))
+    exact_count = matcher.count_phrases([stems])
+    term_counts = matcher.term_counts(Counter(stems))
+    return _combine_keyword_counts(exact_count, term_counts, matcher.terms)
+
+
+def _keyword_in_text(text: str, keyword: str) -> bool:
+    """Check if keyword (or most of its significant terms, in any inflected form) appear in text."""
+    kw_lower = keyword.lower().strip()
+    if not kw_lower:
         return False
-    
-    found = sum(1 for t in terms if t in text_lower)
-    return found >= len(terms) * 0.7  # At least 70% of terms present
+    text_lower = text.lower()
+    stems = set(stem_tokens(tokenize(text)))
+    return get_keyword_matcher(kw_lower).present_in(text_lower, stems)
 
 
-def compute_seo_score(article: dict, primary_keyword: str, secondary_keywords: list) -> dict:
-    """Compute advanced SEO score for an article."""
-    scores = {}
-    recommendations = []
+@lru_cache(maxsize=4096)
+def _heading_has_keyword(heading: str, keyword: str) -> bool:
+    """Cached keyword check for short heading strings."""
+    return _keyword_in_text(heading, keyword)
+
+
+class _TextPart:
+    """Plain-text statistics of one content fragment (section or subsection body)."""
+    
+    __slots__ = ("lower", "word_count", "head_words", "stems", "sentence_fragments", "phrase_hits")
+    
+    def __init__(self, html: str):
+        text = strip_tags(html)
+        words = text.split()
+        self.lower = text.lower()
+        self.word_count = len(words)
+        self.head_words = words[:FIRST_WORDS_LIMIT]
+        # Stems of the significant tokens, for inflection-aware keyword matching
+        self.stems = tuple(chain.from_iterable(map(word_stems, words)))
+        # Word count of every fragment between sentence terminators (empty ones included,
+        # so neighbouring parts can be stitched like one re.split over all text; runs of
+        # terminators only add empty fragments, which sentence_lengths() drops)
+        self.sentence_fragments = tuple(map(len, map(str.split, text.replace("!", ".").replace("?", ".").split("."))))
+        # (automaton, {phrase: end positions}) of the last keyword set scanned,
+        # reused while the keywords are unchanged
+        self.phrase_hits = None
+
+
+def section_content_hash(html: str) -> str:
+    """Content hash of a section body; the key of the per-section cache."""
+    return hashlib.blake2b(html.encode("utf-8"), digest_size=16).hexdigest()
+
+
+class UnknownSectionHash(LookupError):
+    """A section was referenced by content_hash but is no longer in the section cache."""
     
-    # Extract all text content
-    all_text = ""
-    for section in article.get("sections", []):
-        all_text += " " + re.sub(r'<[^>]+>', '', section.get("content", ""))
-        for sub in section.get("subsections", []):
-            all_text += " " + re.sub(r'<[^>]+>', '', sub.get("content", ""))
+    def __init__(self, content_hash: str):
+        super().__init__(content_hash)
+        self.content_hash = content_hash
+
+
+class _TextPartCache:
+    """Thread-safe LRU cache of _TextPart objects keyed by a hash of the fragment HTML."""
+    
+    def __init__(self, maxsize: int):
+        self.maxsize = maxsize
+        self._entries = OrderedDict()
+        self._lock = threading.Lock()
+        self.hits = 0
+        self.misses = 0
+    
+    def get(self, html: str) -> _TextPart:
+        key = section_content_hash(html)
+        with self._lock:
+            part = self._entries.get(key)
+            if part is not None:
+                self._entries.move_to_end(key)
+                self.hits += 1
+                return part
+            self.misses += 1
+        part = _TextPart(html)
+        with self._lock:
+            self._entries[key] = part
+            if len(self._entries) > self.maxsize:
+                self._entries.popitem(last=False)
+        return part
+    
+    def get_by_hash(self, key: str):
+        """Cached part for a content hash, or None if it was never scored or has been evicted."""
+        with self._lock:
+            part = self._entries.get(key)
+            if part is not None:
+                self._entries.move_to_end(key)
+                self.hits += 1
+            return part
+    
+    def clear(self):
+        with self._lock:
+            self._entries.clear()
+            self.hits = self.misses = 0
+    
+    def info(self) -> dict:
+        with self._lock:
+            return {"size": len(self._entries), "maxsize": self.maxsize, "hits": self.hits, "misses": self.misses}
+
+
+# Per-section statistics are reused across scoring runs while the section content is unchanged
+_part_cache = _TextPartCache(maxsize=int(os.environ.get("SEO_SECTION_CACHE_SIZE", "4096")))
+
+
+def get_section_cache_info() -> dict:
+    """Hit/miss statistics of the per-section scoring cache."""
+    return _part_cache.info()
+
+
+def clear_section_cache():
+    """Drop all cached per-section statistics."""
+    _part_cache.clear()
+
+
+class ArticleTextIndex:
+    """
+    Token index over the article body, built once per scoring run.
+    
+    Holds the lowercased text, word counts, the stems of the word tokens
+    and per-part offsets, so density, placement, secondary-keyword and first-150-words
+    checks never re-strip, re-lowercase or re-split the text. Per-part statistics
+    come from a content-hash cache, so only changed sections are re-processed.
+    Answers are identical to running the text helpers on the concatenated body,
+    except that keyword phrases never match across part boundaries.
+    """
     
-    # Also count FAQ text
-    faq_text = ""
-    for faq in article.get("faq", []):
-        faq_text += " " + faq.get("question", "") + " " + faq.get("answer", "")
+    def __init__(self, parts: List[_TextPart], part_keys: List[tuple]):
+        self.parts = parts
+        # (section_index, subsection_index or None) for each part
+        self.part_keys = part_keys
+        self.lower = "".join(" " + p.lower for p in parts)
+        
+        # Offsets of each part: (char offset in lower, word offset, stem offset)
+        self.part_offsets = []
+        char_offset = word_offset = stem_offset = 0
+        for p in parts:
+            self.part_offsets.append((char_offset + 1, word_offset, stem_offset))
+            char_offset += len(p.lower) + 1
+            word_offset += p.word_count
+            stem_offset += len(p.stems)
+        self.word_count = word_offset
+    
+    @cached_property
+    def stem_counts(self) -> Counter:
+        """Frequency of every stem over all parts."""
+        return Counter(chain.from_iterable(p.stems for p in self.parts))
+    
+    @classmethod
+    def from_article(cls, article: dict, use_cache: bool = True) -> "ArticleTextIndex":
+        """
+        Build the index from article sections. A section or subsection may carry
+        `content_hash` instead of `content` to reuse an already scored body
+        (raises UnknownSectionHash when it is not cached).
+        """
+        make_part = _part_cache.get if use_cache else _TextPart
+        
+        def resolve(fragment: dict) -> _TextPart:
+            if "content" not in fragment and fragment.get("content_hash"):
+                part = _part_cache.get_by_hash(fragment["content_hash"])
+                if part is None:
+                    raise UnknownSectionHash(fragment["content_hash"])
+                return part
+            return make_part(fragment.get("content", ""))
+        
+        parts = []
+        part_keys = []
+        for i, section in enumerate(article.get("sections", [])):
+            parts.append(resolve(section))
+            part_keys.append((i, None))
+            for j, sub in enumerate(section.get("subsections", [])):
+                parts.append(resolve(sub))
+                part_keys.append((i, j))
+        return cls(parts, part_keys)
+    
+    def first_words(self, limit: int = FIRST_WORDS_LIMIT) -> str:
+        """First `limit` (at most FIRST_WORDS_LIMIT) whitespace-separated words, joined with spaces."""
+        limit = min(limit, FIRST_WORDS_LIMIT)
+        words = []
+        for p in self.parts:
+            words.extend(p.head_words[:limit - len(words)])
+            if len(words) >= limit:
+                break
+        return " ".join(words)
+    
+    def phrase_hits(self, keywords) -> List[Dict[str, tuple]]:
+        """
+        Positions (stem indices) of all keywords (lowercased, stripped) in each part, found
+        in one pass over the stems with an Aho-Corasick automaton shared by every article
+        with the same keyword set. Per-part results are kept with the cached part, so
+        unchanged sections are not rescanned.
+        """
+        automaton = get_phrase_automaton(tuple(dict.fromkeys(k for k in keywords if k)))
+        hits = []
+        for p in self.parts:
+            cached = p.phrase_hits
+            if cached is None or cached[0] is not automaton:
+                cached = (automaton, automaton.find(p.stems))
+                p.phrase_hits = cached
+            hits.append(cached[1])
+        return hits
+    
+    def phrase_counts(self, keywords, hits: Optional[List[Dict[str, tuple]]] = None) -> Dict[str, int]:
+        """Phrase counts of all keywords, summed over parts (see phrase_hits)."""
+        totals = {}
+        for part_hits in (hits if hits is not None else self.phrase_hits(keywords)):
+            for phrase, ends in part_hits.items():
+                totals[phrase] = totals.get(phrase, 0) + len(ends)
+        return totals
+    
+    def keyword_positions(self, keyword: str, hits: List[Dict[str, tuple]]) -> List[tuple]:
+        """
+        (section_index, word_offset) of each keyword hit. Word offsets are interpolated from
+        stem positions within the part, since stop words are not part of the stem stream.
+        """
+        positions = []
+        for p, (section_idx, _), (_, word_offset, _), part_hits in zip(
+            self.parts, self.part_keys, self.part_offsets, hits
+        ):
+            ends = part_hits.get(keyword)
+            if not ends:
+                continue
+            scale = p.word_count / len(p.stems)
+            positions.extend((section_idx, word_offset + int(end * scale)) for end in ends)
+        return positions
+    
+    def keyword_count(self, keyword: str, phrase_count: Optional[int] = None) -> tuple:
+        """
+        Index-backed equivalent of _flexible_keyword_count(self.text, keyword).
+        `phrase_count` may be passed in from phrase_counts() to skip the scan.
+        """
+        kw_lower = keyword.lower().strip()
+        if not kw_lower:
+            return (0, 0, 0.0)
+        matcher = get_keyword_matcher(kw_lower)
+        if not matcher.terms:
+            exact_count = self.lower.count(kw_lower)
+            return (exact_count, exact_count, 1.0 if exact_count > 0 else 0.0)
+        if phrase_count is not None:
+            exact_count = phrase_count
+        else:
+            exact_count = matcher.count_phrases(p.stems for p in self.parts)
+        term_counts = matcher.term_counts(self.stem_counts)
+        return _combine_keyword_counts(exact_count, term_counts, matcher.terms)
+    
+    def contains_keyword(self, keyword: str) -> bool:
+        """Index-backed equivalent of _keyword_in_text(self.text, keyword)."""
+        kw_lower = keyword.lower().strip()
+        if not kw_lower:
+            return False
+        return get_keyword_matcher(kw_lower).present_in(self.lower, self.stem_counts)
+    
+    def sentence_lengths(self) -> List[int]:
+        """Word counts of non-empty sentences, as re.split(r'[.!?]+') over the full text."""
+        lengths = []
+        carry = 0
+        for p in self.parts:
+            fragments = p.sentence_fragments
+            carry += fragments[0]
+            if len(fragments) > 1:
+                lengths.append(carry)
+                lengths.extend(fragments[1:-1])
+                carry = fragments[-1]
+        lengths.append(carry)
+        return [n for n in lengths if n > 0]
+
+
+class ScoringContext:
+    """
+    Precomputed article data shared by all SEO rules. Expensive parts (the text
+    index, keyword phrase counts) are built lazily, so a subset of cheap rules
+    (e.g. title/meta while typing) never touches the body text.
+    """
     
-    total_text = all_text + faq_text
-    word_count = len(all_text.split())
-    total_word_count = len(total_text.split())
+    def __init__(self, article: dict, primary_keyword: str, secondary_keywords: list, use_cache: bool = True):
+        self.article = article
+        self.primary_keyword = primary_keyword
+        self.secondary_keywords = secondary_keywords
+        self.sections = article.get("sections", [])
+        self.links = article.get("internal_link_suggestions", [])
+        self.use_cache = use_cache
+        # Seconds spent building lazy shared data, reported separately from rule timings
+        self.prepare_seconds = 0.0
+    
+    @cached_property
+    def index(self) -> ArticleTextIndex:
+        started = time.perf_counter()
+        index = ArticleTextIndex.from_article(self.article, self.use_cache)
+        self.prepare_seconds += time.perf_counter() - started
+        return index
+    
+    @cached_property
+    def anchor_phrases(self) -> list:
+        return [l.get("anchor_text", "").lower().strip() for l in self.links if isinstance(l, dict)]
+    
+    @cached_property
+    def keyword_phrase_hits(self) -> List[Dict[str, tuple]]:
+        """Primary, secondary and link-anchor phrases, found together in one pass."""
+        index = self.index
+        started = time.perf_counter()
+        hits = index.phrase_hits(
+            [self.primary_keyword.lower().strip()]
+            + [sk.lower().strip() for sk in self.secondary_keywords]
+            + self.anchor_phrases
+        )
+        self.prepare_seconds += time.perf_counter() - started
+        return hits
+    
+    @cached_property
+    def keyword_phrase_counts(self) -> Dict[str, int]:
+        return self.index.phrase_counts(None, self.keyword_phrase_hits)
+    
+    @property
+    def word_count(self) -> int:
+        return self.index.word_count
+    
+    @cached_property
+    def total_word_count(self) -> int:
+        # Body plus FAQ text
+        faq_text = ""
+        for faq in self.article.get("faq", []):
+            faq_text += " " + faq.get("question", "") + " " + faq.get("answer", "")
+        return self.word_count + len(faq_text.split())
+
+
+def keyword_distribution(ctx: ScoringContext, bins: int = DISTRIBUTION_BINS) -> dict:
+    """
+    Positional report of the primary keyword as compact arrays for a heatmap: hits and
+    words per section, hits per equal slice of the body, gaps between occurrences and a
+    clustering coefficient (coefficient of variation of the gaps: ~0 evenly spread,
+    ~1 random, >1 clustered). Built from the same phrase scan as scoring.
+    """
+    index = ctx.index
+    hits = ctx.keyword_phrase_hits
+    keyword = ctx.primary_keyword.lower().strip()
+    n_sections = len(ctx.sections)
+    total_words = index.word_count
+    
+    section_words = [0] * n_sections
+    for p, (section_idx, _) in zip(index.parts, index.part_keys):
+        section_words[section_idx] += p.word_count
+    
+    def section_hits(phrase: str) -> List[int]:
+        counts = [0] * n_sections
+        for (section_idx, _), part_hits in zip(index.part_keys, hits):
+            counts[section_idx] += len(part_hits.get(phrase, ()))
+        return counts
+    
+    positions = [offset for _, offset in index.keyword_positions(keyword, hits)] if keyword else []
+    bin_counts = [0] * bins
+    for offset in positions:
+        bin_counts[min(bins - 1, offset * bins // max(total_words, 1))] += 1
+    
+    gaps = [b - a for a, b in zip(positions, positions[1:])]
+    # Largest stretch without the keyword, including the start and end of the body
+    edges = [0] + positions + [total_words]
+    largest_start, largest_words = 0, 0
+    for a, b in zip(edges, edges[1:]):
+        if b - a > largest_words:
+            largest_start, largest_words = a, b - a
+    
+    clustering = None
+    if len(gaps) >= 2:
+        mean_gap = sum(gaps) / len(gaps)
+        variance = sum((g - mean_gap) ** 2 for g in gaps) / len(gaps)
+        clustering = round(variance ** 0.5 / mean_gap, 2) if mean_gap else None
+    sorted_gaps = sorted(gaps)
     
-    # 1. Title analysis (max 15 pts)
-    title = article.get("title", "")
+    return {
+        "keyword": keyword,
+        "occurrences": len(positions),
+        "total_words": total_words,
+        "section_anchors": [s.get("anchor", "") for s in ctx.sections],
+        "section_words": section_words,
+        "section_hits": section_hits(keyword) if keyword else [0] * n_sections,
+        "secondary_section_hits": {
+            sk: section_hits(sk.lower().strip()) for sk in ctx.secondary_keywords if sk.strip()
+        },
+        "bins": bin_counts,
+        "positions": positions[:MAX_DISTRIBUTION_POSITIONS],
+        "gaps": {
+            "min": sorted_gaps[0] if gaps else None,
+            "median": sorted_gaps[len(gaps) // 2] if gaps else None,
+            "max": sorted_gaps[-1] if gaps else None,
+        },
+        "largest_gap": {"start": largest_start, "words": largest_words},
+        "clustering": clustering,
+    }
+
+
+# name -> rule(ctx, recommendations) returning the breakdown entry; run in registration order
+SEO_RULES: "OrderedDict[str, Callable[[ScoringContext, list], dict]]" = OrderedDict()
+
+
+def seo_rule(name: str):
+    """Register a scoring rule under `name` (the key of its entry in the score breakdown)."""
+    def decorator(fn):
+        SEO_RULES[name] = fn
+        return fn
+    return decorator
+
+
+def get_rule_names() -> List[str]:
+    """Names of all registered rules, in scoring order."""
+    return list(SEO_RULES)
+
+
+@seo_rule("title")
+def _rule_title(ctx: ScoringContext, recommendations: list) -> dict:
+    """Title analysis (max 15 pts)."""
+    title = ctx.article.get("title", "")
     title_score = 0
     if 30 <= len(title) <= 70:
         title_score += 5
@@ -115,16 +482,19 @@ def compute_seo_score(article: dict, primary_keyword: str, secondary_keywords: l
         recommendations.append(f"Tytuł powinien mieć 30-70 znaków (obecnie: {len(title)})")
     else:
         recommendations.append("Brak tytułu artykułu")
-    if _keyword_in_text(title, primary_keyword):
+    if _keyword_in_text(title, ctx.primary_keyword):
         title_score += 5
     else:
         recommendations.append("Tytuł nie zawiera słowa kluczowego głównego")
     if len(title) > 0:
         title_score += 5
-    scores["title"] = {"score": title_score, "max": 15, "label": "Tytuł artykułu"}
-    
-    # 2. Meta description (max 10 pts)
-    meta_desc = article.get("meta_description", "")
+    return {"score": title_score, "max": 15, "label": "Tytuł artykułu"}
+
+
+@seo_rule("meta_description")
+def _rule_meta_description(ctx: ScoringContext, recommendations: list) -> dict:
+    """Meta description (max 10 pts)."""
+    meta_desc = ctx.article.get("meta_description", "")
     meta_score = 0
     if 120 <= len(meta_desc) <= 160:
         meta_score += 5
@@ -136,13 +506,17 @@ def compute_seo_score(article: dict, primary_keyword: str, secondary_keywords: l
         recommendations.append(f"Meta opis za krótki lub za długi ({len(meta_desc)} znaków)")
     else:
         recommendations.append("Brak meta opisu")
-    if _keyword_in_text(meta_desc, primary_keyword):
+    if _keyword_in_text(meta_desc, ctx.primary_keyword):
         meta_score += 5
     else:
         recommendations.append("Meta opis nie zawiera słowa kluczowego głównego")
-    scores["meta_description"] = {"score": meta_score, "max": 10, "label": "Meta opis"}
-    
-    # 3. Content length (max 10 pts)
+    return {"score": meta_score, "max": 10, "label": "Meta opis"}
+
+
+@seo_rule("content_length")
+def _rule_content_length(ctx: ScoringContext, recommendations: list) -> dict:
+    """Content length (max 10 pts)."""
+    word_count = ctx.word_count
     length_score = 0
     if word_count >= 1500:
         length_score = 10
@@ -154,10 +528,13 @@ def compute_seo_score(article: dict, primary_keyword: str, secondary_keywords: l
         length_score = 2
     else:
         recommendations.append(f"Artykuł zbyt krótki ({word_count} słów, zalecane min 1000)")
-    scores["content_length"] = {"score": length_score, "max": 10, "label": f"Długość treści ({word_count} słów)"}
-    
-    # 4. Heading structure (max 15 pts)
-    sections = article.get("sections", [])
+    return {"score": length_score, "max": 10, "label": f"Długość treści ({word_count} słów)"}
+
+
+@seo_rule("headings")
+def _rule_headings(ctx: ScoringContext, recommendations: list) -> dict:
+    """Heading structure (max 15 pts)."""
+    sections = ctx.sections
     heading_score = 0
     h2_count = len(sections)
     h3_count = sum(len(s.get("subsections", [])) for s in sections)
@@ -179,18 +556,28 @@ def compute_seo_score(article: dict, primary_keyword: str, secondary_keywords: l
     else:
         recommendations.append(f"Za mało podsekcji H3 ({h3_count}, zalecane min 6)")
     
-    keyword_in_h2 = any(_keyword_in_text(s.get("heading", ""), primary_keyword) for s in sections)
+    keyword_in_h2 = any(_heading_has_keyword(s.get("heading", ""), ctx.primary_keyword) for s in sections)
     if keyword_in_h2:
         heading_score += 5
     else:
         recommendations.append("Słowo kluczowe nie występuje w żadnym nagłówku H2")
-    scores["headings"] = {"score": heading_score, "max": 15, "label": "Struktura nagłówków"}
+    return {"score": heading_score, "max": 15, "label": "Struktura nagłówków"}
+
+
+@seo_rule("keywords")
+def _rule_keywords(ctx: ScoringContext, recommendations: list) -> dict:
+    """Keyword density & placement (max 15 pts)."""
+    index = ctx.index
+    primary_keyword = ctx.primary_keyword
+    secondary_keywords = ctx.secondary_keywords
+    phrase_counts = ctx.keyword_phrase_counts
     
-    # 5. Keyword density & placement (max 15 pts)
     kw_score = 0
-    exact_count, flex_count, term_ratio = _flexible_keyword_count(all_text, primary_keyword)
+    exact_count, flex_count, term_ratio = index.keyword_count(
+        primary_keyword, phrase_counts.get(primary_keyword.lower().strip())
+    )
     effective_count = flex_count if flex_count > 0 else exact_count
-    density = (effective_count / max(word_count, 1)) * 100
+    density = (effective_count / max(index.word_count, 1)) * 100
     
     if 0.5 <= density <= 3.0:
         kw_score += 5
@@ -207,13 +594,16 @@ def compute_seo_score(article: dict, primary_keyword: str, secondary_keywords: l
     else:
         recommendations.append("Słowo kluczowe nie występuje w treści!")
     
-    first_words = " ".join(all_text.split()[:150]).lower()
+    first_words = index.first_words(FIRST_WORDS_LIMIT).lower()
     if _keyword_in_text(first_words, primary_keyword):
         kw_score += 5
     else:
         recommendations.append("Słowo kluczowe powinno pojawić się w pierwszych 150 słowach")
     
-    secondary_found = sum(1 for sk in secondary_keywords if _keyword_in_text(all_text, sk))
+    secondary_found = sum(
+        1 for sk in secondary_keywords
+        if phrase_counts.get(sk.lower().strip()) or index.contains_keyword(sk)
+    )
     if len(secondary_keywords) > 0:
         if secondary_found >= len(secondary_keywords) * 0.5:
             kw_score += 5
@@ -223,10 +613,13 @@ def compute_seo_score(article: dict, primary_keyword: str, secondary_keywords: l
             recommendations.append("Brak słów kluczowych dodatkowych w treści")
     else:
         kw_score += 3  # No secondary keywords defined - partial credit
-    scores["keywords"] = {"score": kw_score, "max": 15, "label": f"Słowa kluczowe (gęstość: {density:.1f}%)"}
-    
-    # 6. TOC & Anchors (max 10 pts)
-    toc = article.get("toc", [])
+    return {"score": kw_score, "max": 15, "label": f"Słowa kluczowe (gęstość: {density:.1f}%)"}
+
+
+@seo_rule("toc")
+def _rule_toc(ctx: ScoringContext, recommendations: list) -> dict:
+    """TOC & anchors (max 10 pts)."""
+    toc = ctx.article.get("toc", [])
     toc_score = 0
     if len(toc) >= 5:
         toc_score += 5
@@ -237,7 +630,7 @@ def compute_seo_score(article: dict, primary_keyword: str, secondary_keywords: l
     else:
         recommendations.append("Brak spisu treści")
     
-    section_anchors = set(s.get("anchor", "") for s in sections)
+    section_anchors = set(s.get("anchor", "") for s in ctx.sections)
     toc_anchors = set(t.get("anchor", "") for t in toc)
     if section_anchors and toc_anchors and len(section_anchors & toc_anchors) >= len(section_anchors) * 0.8:
         toc_score += 5
@@ -245,10 +638,13 @@ def compute_seo_score(article: dict, primary_keyword: str, secondary_keywords: l
         toc_score += 3
     else:
         recommendations.append("Anchory w spisie treści nie pasują do sekcji artykułu")
-    scores["toc"] = {"score": toc_score, "max": 10, "label": "Spis treści i anchory"}
-    
-    # 7. FAQ (max 10 pts)
-    faq = article.get("faq", [])
+    return {"score": toc_score, "max": 10, "label": "Spis treści i anchory"}
+
+
+@seo_rule("faq")
+def _rule_faq(ctx: ScoringContext, recommendations: list) -> dict:
+    """FAQ (max 10 pts)."""
+    faq = ctx.article.get("faq", [])
     faq_score = 0
     if len(faq) >= 6:
         faq_score += 5
@@ -267,10 +663,13 @@ def compute_seo_score(article: dict, primary_keyword: str, secondary_keywords: l
             faq_score += 3
         else:
             recommendations.append("Odpowiedzi w FAQ powinny być bardziej rozbudowane (min 25 słów)")
-    scores["faq"] = {"score": faq_score, "max": 10, "label": "Sekcja FAQ"}
-    
-    # 8. Internal links (max 5 pts)
-    links = article.get("internal_link_suggestions", [])
+    return {"score": faq_score, "max": 10, "label": "Sekcja FAQ"}
+
+
+@seo_rule("internal_links")
+def _rule_internal_links(ctx: ScoringContext, recommendations: list) -> dict:
+    """Internal links (max 5 pts)."""
+    links = ctx.links
     link_score = 0
     if len(links) >= 3:
         link_score += 5
@@ -278,33 +677,42 @@ def compute_seo_score(article: dict, primary_keyword: str, secondary_keywords: l
         link_score += 3
     else:
         recommendations.append("Brak sugestii linkowania wewnętrznego")
-    scores["internal_links"] = {"score": link_score, "max": 5, "label": "Linkowanie wewnętrzne"}
-    
-    # 9. Sources (max 5 pts)
-    sources = article.get("sources", [])
+    phrase_counts = ctx.keyword_phrase_counts
+    anchors_in_text = sum(1 for a in ctx.anchor_phrases if phrase_counts.get(a))
+    return {"score": link_score, "max": 5, "label": "Linkowanie wewnętrzne", "anchors_in_text": anchors_in_text}
+
+
+_CREDIBLE_DOMAINS = [".gov.pl", "sejm.gov.pl", "podatki.gov.pl", "isap.sejm.gov.pl",
+                     "pip.gov.pl", "zus.pl", "gus.gov.pl", "nbp.pl", "mf.gov.pl"]
+
+
+@seo_rule("sources")
+def _rule_sources(ctx: ScoringContext, recommendations: list) -> dict:
+    """Sources (max 5 pts)."""
+    sources = ctx.article.get("sources", [])
     source_score = 0
-    credible_domains = [".gov.pl", "sejm.gov.pl", "podatki.gov.pl", "isap.sejm.gov.pl",
-                        "pip.gov.pl", "zus.pl", "gus.gov.pl", "nbp.pl", "mf.gov.pl"]
     if len(sources) >= 3:
         source_score += 3
     elif len(sources) >= 1:
         source_score += 1
     else:
         recommendations.append("Brak źródeł - dodaj wiarygodne odniesienia")
-    credible_count = sum(1 for s in sources if any(d in s.get("url", "") for d in credible_domains))
+    credible_count = sum(1 for s in sources if any(d in s.get("url", "") for d in _CREDIBLE_DOMAINS))
     if credible_count >= 2:
         source_score += 2
     elif credible_count >= 1:
         source_score += 1
     else:
         recommendations.append("Dodaj źródła z oficjalnych stron rządowych (.gov.pl)")
-    scores["sources"] = {"score": source_score, "max": 5, "label": "Źródła"}
-    
-    # 10. Readability (max 5 pts)
-    sentences = re.split(r'[.!?]+', all_text)
-    sentences = [s.strip() for s in sentences if len(s.strip()) > 0]
-    if sentences:
-        avg_sentence_len = sum(len(s.split()) for s in sentences) / len(sentences)
+    return {"score": source_score, "max": 5, "label": "Źródła"}
+
+
+@seo_rule("readability")
+def _rule_readability(ctx: ScoringContext, recommendations: list) -> dict:
+    """Readability (max 5 pts)."""
+    sentence_lengths = ctx.index.sentence_lengths()
+    if sentence_lengths:
+        avg_sentence_len = sum(sentence_lengths) / len(sentence_lengths)
     else:
         avg_sentence_len = 0
     readability_score = 0
@@ -315,19 +723,60 @@ def compute_seo_score(article: dict, primary_keyword: str, secondary_keywords: l
     elif avg_sentence_len > 0:
         readability_score = 1
         recommendations.append(f"Średnia długość zdania: {avg_sentence_len:.0f} słów (zalecane 10-20)")
-    scores["readability"] = {"score": readability_score, "max": 5, "label": f"Czytelność (śr. {avg_sentence_len:.0f} słów/zdanie)"}
+    return {"score": readability_score, "max": 5, "label": f"Czytelność (śr. {avg_sentence_len:.0f} słów/zdanie)"}
+
+
+def compute_seo_score(article: dict, primary_keyword: str, secondary_keywords: list,
+                      rules: Optional[Iterable[str]] = None, timings: bool = False,
+                      use_cache: bool = True) -> dict:
+    """
+    Compute advanced SEO score for an article.
+    
+    `rules` limits scoring to a subset of registered rules (a partial check; totals
+    cover only those rules and word counts are included only if the body was indexed).
+    With `timings`, the result includes the time spent in each rule. One-shot scoring
+    (batch jobs) passes use_cache=False to skip the per-section cache entirely.
+    """
+    if rules is None:
+        selected = list(SEO_RULES)
+    else:
+        selected = list(dict.fromkeys(rules))
+        unknown = [name for name in selected if name not in SEO_RULES]
+        if unknown:
+            raise ValueError(f"Unknown SEO rules: {', '.join(unknown)}")
+    
+    ctx = ScoringContext(article, primary_keyword, secondary_keywords, use_cache)
+    scores = {}
+    recommendations = []
+    rule_timings = {}
+    for name in selected:
+        prepared = ctx.prepare_seconds
+        started = time.perf_counter()
+        scores[name] = SEO_RULES[name](ctx, recommendations)
+        # Shared data built on first use is reported under "prepare", not the rule
+        elapsed = time.perf_counter() - started - (ctx.prepare_seconds - prepared)
+        rule_timings[name] = round(elapsed * 1000, 3)
     
     # Total
     total_score = sum(s["score"] for s in scores.values())
     total_max = sum(s["max"] for s in scores.values())
     percentage = round((total_score / total_max) * 100) if total_max > 0 else 0
     
-    return {
+    result = {
         "total_score": total_score,
         "total_max": total_max,
         "percentage": percentage,
         "breakdown": scores,
         "recommendations": recommendations,
-        "word_count": word_count,
-        "total_word_count": total_word_count
     }
+    if rules is None or "index" in ctx.__dict__:
+        result["word_count"] = ctx.word_count
+        result["total_word_count"] = ctx.total_word_count
+    if "keywords" in selected:
+        result["keyword_distribution"] = keyword_distribution(ctx)
+    if rules is not None:
+        result["partial"] = True
+    if timings:
+        result["rule_timings_ms"] = rule_timings
+        result["prepare_ms"] = round(ctx.prepare_seconds * 1000, 3)
+    return result
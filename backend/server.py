@@ -1,8 +1,9 @@
 from fastapi import FastAPI, APIRouter, HTTPException, Depends, Header
-from fastapi.responses import Response
+from fastapi.responses import Response, StreamingResponse
 from dotenv import load_dotenv
 from starlette.middleware.cors import CORSMiddleware
 from motor.motor_asyncio import AsyncIOMotorClient
+from pymongo import ReturnDocument
 import os
 import logging
 from pathlib import Path
@@ -10,22 +11,25 @@ from pydantic import BaseModel, Field, ConfigDict
 from typing import List, Optional, Dict, Any
 import uuid
 from datetime import datetime, timezone
+from email.utils import formatdate, parsedate_to_datetime
 import json
 import asyncio
 import re
+import time
 
 from article_generator import generate_article, suggest_topics
-from seo_scorer import compute_seo_score
-from export_service import (
-    generate_facebook_post,
-    generate_google_business_post,
-    generate_full_html,
-    generate_pdf_bytes
-)
+from seo_scorer import compute_seo_score, get_rule_names, section_content_hash, UnknownSectionHash
 from image_generator import generate_image, generate_image_variant, get_all_image_styles
-from seo_assistant import analyze_article_seo, chat_about_seo
+from seo_assistant import (
+    analyze_article_seo,
+    analyze_article_sections,
+    chat_about_seo,
+    compute_analysis_fingerprint,
+    build_analysis_cache_entry,
+    find_changed_sections
+)
 from content_templates import get_all_templates
-from wordpress_service import publish_to_wordpress, generate_wordpress_plugin, build_styled_wordpress_content
+from wordpress_service import publish_to_wordpress, generate_wordpress_plugin
 from tpay_service import get_all_plans, get_plan, create_tpay_transaction, calculate_subscription_end
 from auth import (
     register_user, authenticate_user, get_user_by_id,
@@ -39,6 +43,24 @@ from seo_audit_service import run_seo_audit
 from competition_service import analyze_competition
 from auto_update_service import check_articles_for_updates
 from chat_assistant_service import chat_with_assistant, clear_chat_session
+from batch_rescore import rescore_articles, resolve_workers
+from readability import analyze_readability
+from html_sections import parse_html_to_sections, extract_h1_title
+from cpu_executor import run_cpu, start_cpu_executor, shutdown_cpu_executor, get_cpu_executor_metrics, configured_workers
+from pdf_engine import load_pdf_styles
+from html_templates import load_templates
+from export_cache import (
+    EXPORT_FORMATS, EXPORT_PROJECTION, export_fingerprint, export_etag,
+    get_or_render_export, cached_export_mtime, discard_exports,
+)
+from image_store import (
+    BLOB_BUCKET, store_image_blob, load_image_bytes, load_image_data, release_image_blob, migrate_image_documents,
+)
+from static_site import build_static_site
+from web_export import web_export_report, format_report_header
+from workspace_export import DEFAULT_WORKSPACE_FORMATS, parse_workspace_formats, stream_workspace_zip
+from article_derived import build_derived, derived_set_paths, PUBLIC_ARTICLE_PROJECTION
+from article_patch import apply_article_patch, PatchError, PATCHABLE_FIELDS
 
 ROOT_DIR = Path(__file__).parent
 load_dotenv(ROOT_DIR / '.env')
@@ -77,16 +99,36 @@ class ArticleUpdateRequest(BaseModel):
     sources: Optional[List[Dict[str, str]]] = None
     html_content: Optional[str] = None
 
+class ArticlePatchOperation(BaseModel):
+    op: str  # "add", "replace", "remove"
+    path: str  # JSON pointer, e.g. "/meta_description" or "/sections/2/content"
+    value: Any = None
+
 class ScoreRequest(BaseModel):
     primary_keyword: str
     secondary_keywords: List[str] = []
 
+class LiveScoreRequest(BaseModel):
+    primary_keyword: str
+    secondary_keywords: List[str] = []
+    html_content: Optional[str] = None
+    # Alternative to html_content; unchanged bodies may be sent as {"content_hash": ...}
+    sections: Optional[List[Dict[str, Any]]] = None
+    title: str = ""
+    meta_description: str = ""
+    faq: List[Dict[str, str]] = []
+    toc: List[Dict[str, str]] = []
+    internal_link_suggestions: List[Dict[str, str]] = []
+    sources: List[Dict[str, str]] = []
+    rules: Optional[List[str]] = None  # subset of scoring rules, e.g. ["title", "meta_description"]
+    timings: bool = False
+
 class TopicSuggestRequest(BaseModel):
     category: str = "ogólne"
     context: str = "aktualne tematy podatkowe i księgowe w Polsce"
 
 class ExportRequest(BaseModel):
-    format: str  # "facebook", "google_business", "html", "pdf"
+    format: str  # "facebook", "google_business", "html", "html_optimized", "wordpress", "pdf"
 
 class RegisterRequest(BaseModel):
     email: str
@@ -121,6 +163,15 @@ async def get_current_user(authorization: Optional[str] = Header(None)):
         raise HTTPException(status_code=401, detail="Wymagane logowanie")
     return user
 
+async def get_token_user_id(authorization: Optional[str] = Header(None)) -> str:
+    """User id from a valid token, without a database lookup (for stateless hot paths)."""
+    if not authorization or not authorization.startswith("Bearer "):
+        raise HTTPException(status_code=401, detail="Wymagane logowanie")
+    payload = decode_access_token(authorization.replace("Bearer ", ""))
+    if not payload or not payload.get("sub"):
+        raise HTTPException(status_code=401, detail="Wymagane logowanie")
+    return payload["sub"]
+
 
 # ============ Helper Functions ============
 
@@ -137,6 +188,56 @@ def serialize_doc(doc: dict) -> dict:
     return doc
 
 
+def article_write_filter(article_id: str, user: dict, allow_unowned: bool = True) -> dict:
+    """
+    Query matching the article only when `user` may write it, so ownership is checked
+    by the write itself. Admins match any article; with `allow_unowned` articles
+    without a user_id (created before accounts) match for everyone.
+    """
+    query = {"id": article_id}
+    if not user.get("is_admin"):
+        query["user_id"] = {"$in": [user["id"], None, ""]} if allow_unowned else user["id"]
+    return query
+
+
+def article_version_filter(version: int) -> dict:
+    """Query part matching an article version; documents written before versioning are version 0."""
+    return {"version": version} if version else {"version": {"$in": [0, None]}}
+
+
+def article_etag(version: Optional[int]) -> str:
+    """ETag of an article version."""
+    return f'"{version or 0}"'
+
+
+def parse_if_match(if_match: Optional[str]) -> Optional[int]:
+    """Article version an If-Match header asks for; None when absent or "*", -1 when unparseable."""
+    if not if_match or if_match.strip() == "*":
+        return None
+    value = if_match.strip()
+    if value.startswith("W/"):
+        value = value[2:]
+    value = value.strip('"')
+    return int(value) if value.isdigit() else -1
+
+
+async def raise_article_write_failure(article_id: str, user: dict, expected_version: Optional[int] = None,
+                                      not_found: str = "Article not found", allow_unowned: bool = True):
+    """
+    A filtered article write matched nothing: find out why with one small read and
+    raise 404 (no article), 403 (not the owner) or 412 (version changed).
+    """
+    current = await db.articles.find_one({"id": article_id}, {"_id": 0, "user_id": 1, "version": 1})
+    if not current:
+        raise HTTPException(status_code=404, detail=not_found)
+    owner = current.get("user_id")
+    if not user.get("is_admin") and owner != user["id"] and (owner or not allow_unowned):
+        raise HTTPException(status_code=403, detail="Brak dostepu")
+    if expected_version is not None and (current.get("version") or 0) != expected_version:
+        raise HTTPException(status_code=412, detail="Artykul zostal zmieniony w innej karcie - odswiez go przed zapisem")
+    raise HTTPException(status_code=409, detail="Artykul zostal zmieniony podczas zapisu - sprobuj ponownie")
+
+
 # ============ API Routes ============
 
 @api_router.get("/")
@@ -260,6 +361,136 @@ async def admin_delete_user(user_id: str, admin: dict = Depends(require_admin)):
     return {"message": "Uzytkownik dezaktywowany", "id": user_id}
 
 
+class AdminRescoreRequest(BaseModel):
+    user_id: Optional[str] = None  # limit to one user's articles
+    workers: Optional[int] = None
+    batch_size: int = 50
+    dry_run: bool = False
+
+class AdminJobs:
+    """
+    In-memory registry of one kind of admin background job (rescore, static site,
+    image migration): start returns a job_id at once, the job reports progress through
+    an on_progress(stats) callback, and a finished job is dropped after its status is read.
+    """
+
+    def __init__(self, name: str, progress_keys: tuple):
+        self.name = name
+        self.progress_keys = progress_keys
+        self.jobs: Dict[str, dict] = {}
+
+    def running(self) -> bool:
+        return any(job["status"] in ("queued", "running") for job in self.jobs.values())
+
+    def start(self, run, user_id: str) -> dict:
+        """Queue `run(on_progress)` (a coroutine function returning the result stats)."""
+        job_id = str(uuid.uuid4())
+        self.jobs[job_id] = {
+            "status": "queued",
+            "progress": dict.fromkeys(self.progress_keys, 0),
+            "result": None,
+            "error": None,
+            "user_id": user_id
+        }
+        asyncio.create_task(self._run(job_id, run))
+        return {"job_id": job_id, "status": "queued"}
+
+    async def _run(self, job_id: str, run):
+        job = self.jobs[job_id]
+
+        def on_progress(stats: dict):
+            job["progress"] = {key: stats[key] for key in self.progress_keys}
+
+        try:
+            job["status"] = "running"
+            job["result"] = await run(on_progress)
+            job["status"] = "completed"
+        except Exception as e:
+            logging.error(f"{self.name} error: {e}")
+            job["status"] = "failed"
+            job["error"] = str(e)
+
+    def status(self, job_id: str) -> dict:
+        """Status and progress; the result or error once finished (the job is then forgotten)."""
+        job = self.jobs.get(job_id)
+        if not job:
+            raise HTTPException(status_code=404, detail="Job nie znaleziony")
+
+        result = {"job_id": job_id, "status": job["status"], "progress": job["progress"]}
+
+        if job["status"] == "completed":
+            result["result"] = job["result"]
+            del self.jobs[job_id]
+        elif job["status"] == "failed":
+            result["error"] = job["error"]
+            del self.jobs[job_id]
+
+        return result
+
+_rescore_jobs = AdminJobs("Batch rescore", ("scanned", "rescored", "failed", "skipped"))
+
+@api_router.post("/admin/rescore")
+async def admin_rescore_articles(request: AdminRescoreRequest, admin: dict = Depends(require_admin)):
+    """Start batch rescoring of stored articles (admin only) - returns job_id for polling."""
+    if request.workers is not None and request.workers < 1:
+        raise HTTPException(status_code=400, detail="Liczba procesow musi wynosic co najmniej 1")
+    workers = resolve_workers(request.workers)
+    query = {"user_id": request.user_id} if request.user_id else {}
+    return _rescore_jobs.start(lambda on_progress: rescore_articles(
+        db, query, workers=workers, batch_size=request.batch_size, dry_run=request.dry_run, on_progress=on_progress
+    ), admin["id"])
+
+@api_router.get("/admin/rescore/status/{job_id}")
+async def admin_rescore_status(job_id: str, admin: dict = Depends(require_admin)):
+    """Poll batch rescoring job status (admin only)."""
+    return _rescore_jobs.status(job_id)
+
+class AdminStaticSiteRequest(BaseModel):
+    user_id: Optional[str] = None  # limit to one user's articles
+    base_url: Optional[str] = None  # public URL for sitemap/RSS (default: STATIC_SITE_URL)
+    full: bool = False  # re-render every article, ignoring the manifest
+
+_static_site_jobs = AdminJobs("Static site build", ("scanned", "rendered", "failed"))
+
+@api_router.post("/admin/static-site")
+async def admin_build_static_site(request: AdminStaticSiteRequest, admin: dict = Depends(require_admin)):
+    """Start an incremental static site build (admin only) - returns job_id for polling."""
+    if _static_site_jobs.running():
+        raise HTTPException(status_code=409, detail="Budowanie strony juz trwa")
+    query = {"user_id": request.user_id} if request.user_id else {}
+    return _static_site_jobs.start(lambda on_progress: build_static_site(
+        db, query=query, base_url=request.base_url, full=request.full, on_progress=on_progress
+    ), admin["id"])
+
+@api_router.get("/admin/static-site/status/{job_id}")
+async def admin_static_site_status(job_id: str, admin: dict = Depends(require_admin)):
+    """Poll static site build status (admin only)."""
+    return _static_site_jobs.status(job_id)
+
+class AdminImageMigrationRequest(BaseModel):
+    batch_size: int = 20
+    dry_run: bool = False
+
+_image_migration_jobs = AdminJobs("Image migration", ("scanned", "migrated", "failed"))
+
+@api_router.post("/admin/images/migrate")
+async def admin_migrate_images(request: AdminImageMigrationRequest, admin: dict = Depends(require_admin)):
+    """Start moving legacy image data into the blob store (admin only) - returns job_id for polling."""
+    return _image_migration_jobs.start(lambda on_progress: migrate_image_documents(
+        db, batch_size=request.batch_size, dry_run=request.dry_run, on_progress=on_progress
+    ), admin["id"])
+
+@api_router.get("/admin/images/migrate/status/{job_id}")
+async def admin_migrate_images_status(job_id: str, admin: dict = Depends(require_admin)):
+    """Poll image migration status (admin only)."""
+    return _image_migration_jobs.status(job_id)
+
+@api_router.get("/admin/cpu-executor")
+async def admin_cpu_executor_metrics(admin: dict = Depends(require_admin)):
+    """Queue depth and per-task wait/run times of the CPU offload pool (admin only)."""
+    return get_cpu_executor_metrics()
+
+
 @api_router.get("/health")
 async def health():
     return {"status": "healthy"}
@@ -292,7 +523,8 @@ async def _run_generation_job(job_id: str, request_data: dict, user: dict):
             {"$set": {"stage": 3}}
         )
         
-        seo_score = compute_seo_score(
+        seo_score = await run_cpu(
+            compute_seo_score,
             article_data,
             request_data["primary_keyword"],
             request_data["secondary_keywords"]
@@ -315,11 +547,13 @@ async def _run_generation_job(job_id: str, request_data: dict, user: dict):
             "meta_description": article_data.get("meta_description", ""),
             "toc": article_data.get("toc", []),
             "sections": article_data.get("sections", []),
+            "derived": build_derived(article_data.get("sections", [])),
             "faq": article_data.get("faq", []),
             "internal_link_suggestions": article_data.get("internal_link_suggestions", []),
             "sources": article_data.get("sources", []),
             "seo_score": seo_score,
             "status": "draft",
+            "version": 1,
             "created_at": datetime.now(timezone.utc).isoformat(),
             "updated_at": datetime.now(timezone.utc).isoformat()
         }
@@ -405,7 +639,7 @@ async def get_generation_status(job_id: str, user: dict = Depends(get_current_us
         result["article_id"] = job.get("article_id")
         # Load article from DB
         if job.get("article_id"):
-            article = await db.articles.find_one({"id": job["article_id"]}, {"_id": 0})
+            article = await db.articles.find_one({"id": job["article_id"]}, PUBLIC_ARTICLE_PROJECTION)
             if article:
                 result["article"] = serialize_doc(article)
         # Cleanup old job
@@ -465,214 +699,335 @@ async def check_updates(user: dict = Depends(get_current_user)):
 async def list_articles(user: dict = Depends(get_current_user)):
     """List articles scoped to user (admin sees all)."""
     query = {} if user.get("is_admin") else {"user_id": user["id"]}
-    articles = await db.articles.find(query, {"_id": 0}).sort("created_at", -1).to_list(100)
+    articles = await db.articles.find(query, PUBLIC_ARTICLE_PROJECTION).sort("created_at", -1).to_list(100)
     return [{**serialize_doc(a)} for a in articles]
 
 
 @api_router.get("/articles/{article_id}")
-async def get_article(article_id: str, user: dict = Depends(get_current_user)):
-    """Get a single article by ID (owner or admin)."""
-    article = await db.articles.find_one({"id": article_id}, {"_id": 0})
+async def get_article(article_id: str, response: Response, user: dict = Depends(get_current_user)):
+    """Get a single article by ID (owner or admin). The ETag carries the article version."""
+    article = await db.articles.find_one({"id": article_id}, PUBLIC_ARTICLE_PROJECTION)
     if not article:
         raise HTTPException(status_code=404, detail="Article not found")
     if not user.get("is_admin") and article.get("user_id") and article["user_id"] != user["id"]:
         raise HTTPException(status_code=403, detail="Brak dostepu")
+    response.headers["ETag"] = article_etag(article.get("version"))
     return serialize_doc(article)
 
 
-def _slugify(text: str) -> str:
-    """Create a URL-friendly slug from text."""
-    text = text.lower().strip()
-    text = re.sub(r'[ąàáâãäå]', 'a', text)
-    text = re.sub(r'[ćçč]', 'c', text)
-    text = re.sub(r'[ęèéêë]', 'e', text)
-    text = re.sub(r'[łl]', 'l', text)
-    text = re.sub(r'[ńñ]', 'n', text)
-    text = re.sub(r'[óòôõö]', 'o', text)
-    text = re.sub(r'[śšş]', 's', text)
-    text = re.sub(r'[żźž]', 'z', text)
-    text = re.sub(r'[^a-z0-9\s-]', '', text)
-    text = re.sub(r'[\s]+', '-', text)
-    text = re.sub(r'-+', '-', text)
-    return text[:80].strip('-')
-
-
-def _parse_html_to_sections(html: str) -> list:
-    """Parse HTML content from the visual editor back into structured sections."""
-    if not html or not html.strip():
-        return []
-    
-    # Split HTML by h2 tags to get sections
-    # Pattern: find all h2 and content between them
-    parts = re.split(r'(<h2[^>]*>.*?</h2>)', html, flags=re.IGNORECASE | re.DOTALL)
-    
-    sections = []
-    current_section = None
-    
-    for part in parts:
-        part = part.strip()
-        if not part:
-            continue
-        
-        # Check if this is an h2 heading
-        h2_match = re.match(r'<h2[^>]*(?:id="([^"]*)")?[^>]*>(.*?)</h2>', part, re.IGNORECASE | re.DOTALL)
-        if h2_match:
-            # Save previous section
-            if current_section:
-                sections.append(current_section)
-            
-            heading_text = re.sub(r'<[^>]+>', '', h2_match.group(2)).strip()
-            anchor = h2_match.group(1) or _slugify(heading_text)
-            current_section = {
-                "heading": heading_text,
-                "anchor": anchor,
-                "content": "",
-                "subsections": []
-            }
-        elif current_section is not None:
-            # Process content within current section - split by h3
-            h3_parts = re.split(r'(<h3[^>]*>.*?</h3>)', part, flags=re.IGNORECASE | re.DOTALL)
-            current_subsection = None
-            
-            for h3_part in h3_parts:
-                h3_part = h3_part.strip()
-                if not h3_part:
-                    continue
-                
-                h3_match = re.match(r'<h3[^>]*(?:id="([^"]*)")?[^>]*>(.*?)</h3>', h3_part, re.IGNORECASE | re.DOTALL)
-                if h3_match:
-                    if current_subsection:
-                        current_section["subsections"].append(current_subsection)
-                    
-                    sub_heading = re.sub(r'<[^>]+>', '', h3_match.group(2)).strip()
-                    sub_anchor = h3_match.group(1) or _slugify(sub_heading)
-                    current_subsection = {
-                        "heading": sub_heading,
-                        "anchor": sub_anchor,
-                        "content": ""
-                    }
-                elif current_subsection is not None:
-                    current_subsection["content"] += h3_part
-                else:
-                    current_section["content"] += h3_part
-            
-            if current_subsection:
-                current_section["subsections"].append(current_subsection)
-    
-    # Don't forget the last section
-    if current_section:
-        sections.append(current_section)
-    
-    # Clean up content - trim whitespace
-    for section in sections:
-        section["content"] = section["content"].strip()
-        for sub in section.get("subsections", []):
-            sub["content"] = sub["content"].strip()
-    
-    return sections
-
-
 @api_router.put("/articles/{article_id}")
-async def update_article(article_id: str, request: ArticleUpdateRequest, user: dict = Depends(get_current_user)):
-    """Update an existing article (owner or admin)."""
-    article = await db.articles.find_one({"id": article_id}, {"_id": 0})
-    if not article:
-        raise HTTPException(status_code=404, detail="Article not found")
-    if not user.get("is_admin") and article.get("user_id") and article["user_id"] != user["id"]:
-        raise HTTPException(status_code=403, detail="Brak dostepu")
-    
+async def update_article(article_id: str, request: ArticleUpdateRequest, response: Response,
+                         user: dict = Depends(get_current_user), if_match: Optional[str] = Header(None)):
+    """
+    Update an existing article (owner or admin) in a single find_one_and_update.
+    With If-Match the write only applies to that version; otherwise 412.
+    """
     update_data = {k: v for k, v in request.model_dump().items() if v is not None}
     
     # Sync html_content back to sections so SEO scorer has updated data
     html_to_parse = update_data.get("html_content", "")
     if html_to_parse:
         logging.info(f"Parsing html_content ({len(html_to_parse)} chars) to sections")
-        parsed_sections = _parse_html_to_sections(html_to_parse)
+        parsed_sections = await run_cpu(parse_html_to_sections, html_to_parse)
         logging.info(f"Parsed {len(parsed_sections)} sections from html_content")
         if parsed_sections:
             update_data["sections"] = parsed_sections
             # Also extract title from H1 if present
-            title_match = re.search(r'<h1[^>]*>(.*?)</h1>', html_to_parse, re.IGNORECASE | re.DOTALL)
-            if title_match:
-                new_title = re.sub(r'<[^>]+>', '', title_match.group(1)).strip()
-                if new_title:
-                    update_data["title"] = new_title
+            new_title = extract_h1_title(html_to_parse)
+            if new_title:
+                update_data["title"] = new_title
     
+    if "sections" in update_data:
+        update_data["derived"] = build_derived(update_data["sections"])
     update_data["updated_at"] = datetime.now(timezone.utc).isoformat()
     
-    await db.articles.update_one({"id": article_id}, {"$set": update_data})
-    article = await db.articles.find_one({"id": article_id}, {"_id": 0})
+    query = article_write_filter(article_id, user)
+    expected_version = parse_if_match(if_match)
+    if expected_version is not None:
+        query.update(article_version_filter(expected_version))
+    article = await db.articles.find_one_and_update(
+        query,
+        {"$set": update_data, "$inc": {"version": 1}},
+        projection={"_id": 0},
+        return_document=ReturnDocument.AFTER
+    )
+    if article is None:
+        await raise_article_write_failure(article_id, user, expected_version)
+    # Invalidate the cached SEO assistant analysis if its prompt inputs changed
+    await db.seo_analyses.update_one(
+        {"article_id": article_id, "fingerprint": {"$ne": compute_analysis_fingerprint(article)}},
+        {"$set": {"stale": True}}
+    )
+    response.headers["ETag"] = article_etag(article["version"])
+    article.pop("derived", None)
     return serialize_doc(article)
 
 
+@api_router.patch("/articles/{article_id}")
+async def patch_article(article_id: str, operations: List[ArticlePatchOperation], response: Response,
+                        user: dict = Depends(get_current_user), if_match: Optional[str] = Header(None)):
+    """
+    Apply JSON-patch operations to an article (owner or admin).
+    Only the changed paths are written with targeted $set; untouched sections are
+    neither re-parsed nor rewritten. The write is conditioned on the version the
+    patch was applied to, so a concurrent save is never overwritten: with If-Match
+    it is reported as 412, without it the patch is re-applied to the new version.
+    """
+    expected_version = parse_if_match(if_match)
+    query = article_write_filter(article_id, user)
+    if expected_version is not None:
+        query.update(article_version_filter(expected_version))
+    
+    for _ in range(3):
+        article = await db.articles.find_one(query, {"_id": 0})
+        if not article:
+            await raise_article_write_failure(article_id, user, expected_version)
+        version = article.get("version") or 0
+        
+        try:
+            update_data, sections = apply_article_patch(article, [o.model_dump() for o in operations])
+        except PatchError as e:
+            raise HTTPException(status_code=400, detail=str(e))
+        
+        changed_paths = sorted(update_data)
+        article.update({k: v for k, v in update_data.items() if k in PATCHABLE_FIELDS})
+        update = {}
+        if sections is not None:
+            derived = build_derived(sections, article.get("derived"))
+            update_data.update(derived_set_paths(article.get("derived"), derived))
+            article["sections"] = sections
+            article["derived"] = derived
+            # The stored editor HTML no longer matches the sections; readers fall back to sections
+            if "html_content" in article:
+                update["$unset"] = {"html_content": ""}
+                article.pop("html_content")
+        update_data["updated_at"] = datetime.now(timezone.utc).isoformat()
+        update["$set"] = update_data
+        update["$inc"] = {"version": 1}
+        
+        result = await db.articles.update_one({**query, **article_version_filter(version)}, update)
+        if result.matched_count:
+            break
+        if expected_version is not None:
+            await raise_article_write_failure(article_id, user, expected_version)
+    else:
+        await raise_article_write_failure(article_id, user)
+    
+    # Invalidate the cached SEO assistant analysis if its prompt inputs changed
+    await db.seo_analyses.update_one(
+        {"article_id": article_id, "fingerprint": {"$ne": compute_analysis_fingerprint(article)}},
+        {"$set": {"stale": True}}
+    )
+    response.headers["ETag"] = article_etag(version + 1)
+    return {"id": article_id, "updated_at": update_data["updated_at"], "changed_paths": changed_paths, "version": version + 1}
+
+
 @api_router.delete("/articles/{article_id}")
-async def delete_article(article_id: str, user: dict = Depends(get_current_user)):
-    """Delete an article (owner or admin)."""
-    article = await db.articles.find_one({"id": article_id})
-    if not article:
-        raise HTTPException(status_code=404, detail="Article not found")
-    if not user.get("is_admin") and article.get("user_id") and article["user_id"] != user["id"]:
-        raise HTTPException(status_code=403, detail="Brak dostepu")
-    await db.articles.delete_one({"id": article_id})
+async def delete_article(article_id: str, user: dict = Depends(get_current_user), if_match: Optional[str] = Header(None)):
+    """Delete an article (owner or admin); with If-Match only that version."""
+    query = article_write_filter(article_id, user)
+    expected_version = parse_if_match(if_match)
+    if expected_version is not None:
+        query.update(article_version_filter(expected_version))
+    result = await db.articles.delete_one(query)
+    if not result.deleted_count:
+        await raise_article_write_failure(article_id, user, expected_version)
+    await db.seo_analyses.delete_one({"article_id": article_id})
+    await run_cpu(discard_exports, article_id)
     return {"message": "Article deleted", "id": article_id}
 
 
 # --- SEO Scoring ---
 
 @api_router.post("/articles/{article_id}/score")
-async def score_article(article_id: str, request: ScoreRequest):
-    """Compute SEO score for an article."""
-    article = await db.articles.find_one({"id": article_id}, {"_id": 0})
-    if not article:
-        raise HTTPException(status_code=404, detail="Article not found")
+async def score_article(article_id: str, request: ScoreRequest, response: Response,
+                        user: dict = Depends(get_current_user), if_match: Optional[str] = Header(None)):
+    """
+    Compute and store the SEO score of an article (owner or admin).
+    The score is written with find_one_and_update conditioned on the version it was
+    computed from, so it never lands on newer content. Like batch rescoring it sets
+    seo_scored_at and leaves updated_at and version alone: scoring is not an edit.
+    """
+    expected_version = parse_if_match(if_match)
+    query = article_write_filter(article_id, user)
+    if expected_version is not None:
+        query.update(article_version_filter(expected_version))
+    
+    for _ in range(3):
+        article = await db.articles.find_one(query, {"_id": 0, "derived": 0})
+        if not article:
+            await raise_article_write_failure(article_id, user, expected_version)
+        version = article.get("version") or 0
+        
+        score = await run_cpu(compute_seo_score, article, request.primary_keyword, request.secondary_keywords)
+        
+        stored = await db.articles.find_one_and_update(
+            {**query, **article_version_filter(version)},
+            {"$set": {"seo_score": score, "seo_scored_at": datetime.now(timezone.utc).isoformat()}},
+            projection={"_id": 0, "version": 1}
+        )
+        if stored is not None:
+            break
+        if expected_version is not None:
+            await raise_article_write_failure(article_id, user, expected_version)
+    else:
+        await raise_article_write_failure(article_id, user)
     
-    score = compute_seo_score(article, request.primary_keyword, request.secondary_keywords)
+    response.headers["ETag"] = article_etag(version)
+    return score
+
+
+def _live_section_hashes(sections: list) -> list:
+    """Content hashes of section and subsection bodies, for referencing unchanged ones next time."""
+    def fragment_hash(fragment: dict) -> str:
+        if "content" not in fragment and fragment.get("content_hash"):
+            return fragment["content_hash"]
+        return section_content_hash(fragment.get("content", ""))
     
-    # Update score in DB
-    await db.articles.update_one(
-        {"id": article_id},
-        {"$set": {"seo_score": score, "updated_at": datetime.now(timezone.utc).isoformat()}}
-    )
+    return [
+        {
+            "content_hash": fragment_hash(section),
+            "subsections": [fragment_hash(sub) for sub in section.get("subsections", [])]
+        }
+        for section in sections
+    ]
+
+
+@api_router.get("/score/rules")
+async def list_score_rules():
+    """Names of the SEO scoring rules, usable as `rules` in live scoring."""
+    return {"rules": get_rule_names()}
+
+
+@api_router.post("/score/live")
+async def live_score(request: LiveScoreRequest, user_id: str = Depends(get_token_user_id)):
+    """
+    Score unsaved editor content. Stateless: no database reads or writes, so the
+    editor can rescore on every debounced keystroke.
+    """
+    started = time.perf_counter()
+    article = request.model_dump(exclude={"html_content", "primary_keyword", "secondary_keywords"})
+    if request.html_content is not None:
+        article["sections"] = await run_cpu(parse_html_to_sections, request.html_content)
+        if not article["title"]:
+            article["title"] = extract_h1_title(request.html_content)
+    article["sections"] = article.get("sections") or []
+    
+    try:
+        score = await run_cpu(
+            compute_seo_score, article, request.primary_keyword, request.secondary_keywords,
+            rules=request.rules, timings=request.timings
+        )
+    except UnknownSectionHash as e:
+        raise HTTPException(status_code=409, detail=f"Nieznany hash sekcji {e.content_hash} - wyslij pelna tresc")
+    except ValueError as e:
+        raise HTTPException(status_code=400, detail=str(e))
     
+    score["section_hashes"] = _live_section_hashes(article["sections"])
+    score["elapsed_ms"] = round((time.perf_counter() - started) * 1000, 2)
     return score
 
 
 # --- Export ---
 
-@api_router.post("/articles/{article_id}/export")
-async def export_article(article_id: str, request: ExportRequest):
-    """Export article in various formats."""
-    article = await db.articles.find_one({"id": article_id}, {"_id": 0})
+def _export_not_modified(etag: str, mtime: Optional[float], if_none_match: Optional[str], if_modified_since: Optional[str]) -> bool:
+    """Conditional request check: If-None-Match (weak comparison) wins over If-Modified-Since."""
+    if if_none_match:
+        tags = [t.strip() for t in if_none_match.split(",")]
+        return "*" in tags or any(t.removeprefix("W/") == etag.removeprefix("W/") for t in tags)
+    if if_modified_since and mtime:
+        try:
+            return int(mtime) <= parsedate_to_datetime(if_modified_since).timestamp()
+        except (TypeError, ValueError):
+            return False
+    return False
+
+
+async def _load_export_article(article_id: str, fmt: str) -> dict:
+    if fmt not in EXPORT_FORMATS:
+        raise HTTPException(status_code=400, detail=f"Unknown format: {fmt}")
+    article = await db.articles.find_one({"id": article_id}, {**EXPORT_PROJECTION, "user_id": 1})
     if not article:
         raise HTTPException(status_code=404, detail="Article not found")
+    return article
+
+
+@api_router.post("/articles/{article_id}/export")
+async def export_article(article_id: str, request: ExportRequest, response: Response):
+    """Export article in various formats (rendered once per article content, then served from the export cache)."""
+    article = await _load_export_article(article_id, request.format)
+    fingerprint = export_fingerprint(article, request.format)
+    content, _ = await run_cpu(get_or_render_export, article, article_id, request.format, fingerprint)
     
-    if request.format == "facebook":
-        content = generate_facebook_post(article)
-        return {"format": "facebook", "content": content}
-    
-    elif request.format == "google_business":
-        content = generate_google_business_post(article)
-        return {"format": "google_business", "content": content}
-    
-    elif request.format == "html":
-        html = generate_full_html(article)
-        return {"format": "html", "content": html}
-    
-    elif request.format == "wordpress":
-        styled_content = build_styled_wordpress_content(article)
-        return {"format": "wordpress", "content": styled_content}
-    
-    elif request.format == "pdf":
-        pdf_bytes = generate_pdf_bytes(article)
+    if request.format == "pdf":
         return Response(
-            content=pdf_bytes,
+            content=content,
             media_type="application/pdf",
-            headers={"Content-Disposition": f"attachment; filename={article.get('slug', 'article')}.pdf"}
+            headers={
+                "Content-Disposition": f"attachment; filename={article.get('slug', 'article')}.pdf",
+                "ETag": export_etag(fingerprint)
+            }
         )
-    
-    else:
-        raise HTTPException(status_code=400, detail=f"Unknown format: {request.format}")
+    response.headers["ETag"] = export_etag(fingerprint)
+    result = {"format": request.format, "content": content.decode("utf-8")}
+    if request.format == "html_optimized":
+        result["budget"] = await run_cpu(web_export_report, content)
+    return result
+
 
+@api_router.get("/articles/{article_id}/export/{fmt}")
+async def download_export(article_id: str, fmt: str, user: dict = Depends(get_current_user),
+                          if_none_match: Optional[str] = Header(None), if_modified_since: Optional[str] = Header(None)):
+    """
+    Download a rendered export (facebook, google_business, html, html_optimized, wordpress, pdf) as a file.
+    ETag / Last-Modified identify the article content, so repeat downloads get 304.
+    html_optimized downloads carry their byte sizes and budget overruns in X-Export-Budget.
+    """
+    article = await _load_export_article(article_id, fmt)
+    if not user.get("is_admin") and article.get("user_id") and article["user_id"] != user["id"]:
+        raise HTTPException(status_code=403, detail="Brak dostepu")
+    
+    fingerprint = export_fingerprint(article, fmt)
+    etag = export_etag(fingerprint)
+    headers = {"ETag": etag, "Cache-Control": "private, no-cache"}
+    if if_none_match or if_modified_since:
+        mtime = None if if_none_match else await run_cpu(cached_export_mtime, article_id, fmt, fingerprint)
+        if _export_not_modified(etag, mtime, if_none_match, if_modified_since):
+            return Response(status_code=304, headers=headers)
+    
+    content, mtime = await run_cpu(get_or_render_export, article, article_id, fmt, fingerprint)
+    if mtime:
+        headers["Last-Modified"] = formatdate(mtime, usegmt=True)
+    export_format = EXPORT_FORMATS[fmt]
+    if fmt in ("pdf", "html", "html_optimized"):
+        headers["Content-Disposition"] = f"attachment; filename={article.get('slug') or 'article'}.{export_format.extension}"
+    if fmt == "html_optimized":
+        headers["X-Export-Budget"] = format_report_header(await run_cpu(web_export_report, content))
+    return Response(content=content, media_type=export_format.media_type, headers=headers)
+
+
+
+@api_router.get("/export/workspace")
+async def export_workspace(formats: str = ",".join(DEFAULT_WORKSPACE_FORMATS), user: dict = Depends(get_current_user)):
+    """
+    Export every article of the workspace (admin: all articles) as one ZIP, streamed
+    while it is built. `formats`: comma-separated html, html_optimized, pdf, json, wordpress, facebook,
+    google_business.
+    """
+    try:
+        selected = parse_workspace_formats(formats)
+    except ValueError as e:
+        raise HTTPException(status_code=400, detail=str(e))
+    
+    query = {} if user.get("is_admin") else {"user_id": user["id"]}
+    projection = {"_id": 0} if "json" in selected else {**EXPORT_PROJECTION, "id": 1}
+    cursor = db.articles.find(query, projection).sort("created_at", -1).batch_size(20)
+    filename = f"workspace-{datetime.now(timezone.utc):%Y%m%d-%H%M}.zip"
+    return StreamingResponse(
+        stream_workspace_zip(cursor, selected, window=max(2, configured_workers())),
+        media_type="application/zip",
+        headers={"Content-Disposition": f"attachment; filename={filename}"}
+    )
 
 
 # --- Regeneration ---
@@ -791,6 +1146,15 @@ async def get_stats(user: dict = Depends(get_current_user)):
     }
 
 
+@api_router.get("/stats/readability")
+async def get_readability_stats(outlier_limit: int = 50, user: dict = Depends(get_current_user)):
+    """Readability distributions and outlier paragraphs across the workspace (admin sees all)."""
+    query = {} if user.get("is_admin") else {"user_id": user["id"]}
+    articles = await db.articles.find(query, {"_id": 0, "id": 1, "title": 1, "sections": 1}).to_list(None)
+    # Tokenising holds the GIL (pure Python); the worker thread only keeps the event loop responsive
+    return await run_cpu(analyze_readability, articles, max(0, min(outlier_limit, 500)))
+
+
 # --- Image Generation ---
 
 class ReferenceImageData(BaseModel):
@@ -871,7 +1235,7 @@ async def generate_image_endpoint(request: ImageGenerateRequest, user: dict = De
             "article_id": request.article_id,
             "variation_type": request.variation_type,
             "mime_type": result["mime_type"],
-            "data": result["data"],
+            **await store_image_blob(db, result["data"], result["mime_type"]),
             "has_reference": ref_images_data is not None,
             "num_references": len(ref_images_list),
             "created_at": datetime.now(timezone.utc).isoformat()
@@ -895,9 +1259,13 @@ async def generate_image_endpoint(request: ImageGenerateRequest, user: dict = De
         raise HTTPException(status_code=500, detail=str(e))
 
 
+def image_raw_url(image_id: str) -> str:
+    return f"/api/images/{image_id}/raw"
+
+
 @api_router.get("/images/{image_id}")
 async def get_image(image_id: str):
-    """Get a single image by ID."""
+    """Get a single image by ID (base64 payload loaded from the blob store)."""
     image = await db.images.find_one({"id": image_id}, {"_id": 0})
     if not image:
         raise HTTPException(status_code=404, detail="Image not found")
@@ -906,12 +1274,35 @@ async def get_image(image_id: str):
         "prompt": image.get("prompt", ""),
         "style": image.get("style", ""),
         "mime_type": image.get("mime_type", ""),
-        "data": image.get("data", ""),
+        "data": await load_image_data(db, image),
+        "url": image_raw_url(image["id"]),
+        "width": image.get("width"),
+        "height": image.get("height"),
         "article_id": image.get("article_id"),
         "created_at": image.get("created_at")
     }
 
 
+@api_router.get("/images/{image_id}/raw")
+async def get_image_raw(image_id: str, if_none_match: Optional[str] = Header(None)):
+    """
+    Image binary for <img src>. Images never change after creation (edits are new images),
+    so the response is cached for a year and revalidated by the content hash.
+    """
+    image = await db.images.find_one({"id": image_id}, {"_id": 0})
+    if not image:
+        raise HTTPException(status_code=404, detail="Image not found")
+    headers = {"Cache-Control": "public, max-age=31536000, immutable"}
+    if image.get("blob_sha256"):
+        headers["ETag"] = f'"{image["blob_sha256"]}"'
+        if if_none_match and _export_not_modified(headers["ETag"], None, if_none_match, None):
+            return Response(status_code=304, headers=headers)
+    content = await load_image_bytes(db, image)
+    if content is None:
+        raise HTTPException(status_code=404, detail="Brak danych obrazu")
+    return Response(content=content, media_type=image.get("mime_type") or "application/octet-stream", headers=headers)
+
+
 @api_router.get("/articles/{article_id}/images")
 async def get_article_images(article_id: str):
     """Get all images for a specific article."""
@@ -919,15 +1310,18 @@ async def get_article_images(article_id: str):
         {"article_id": article_id}, 
         {"_id": 0, "data": 0}
     ).sort("created_at", -1).to_list(50)
+    for img in images:
+        img["url"] = image_raw_url(img["id"])
     return images
 
 
 @api_router.delete("/images/{image_id}")
 async def delete_image(image_id: str):
-    """Delete an image."""
-    result = await db.images.delete_one({"id": image_id})
-    if result.deleted_count == 0:
+    """Delete an image (and its blob, when no other image has the same content)."""
+    image = await db.images.find_one_and_delete({"id": image_id}, {"_id": 0, "blob_sha256": 1})
+    if image is None:
         raise HTTPException(status_code=404, detail="Image not found")
+    await release_image_blob(db, image.get("blob_sha256"))
     return {"message": "Image deleted", "id": image_id}
 
 
@@ -958,15 +1352,21 @@ async def library_list_images(
     # Get total count
     total = await db.images.count_documents(query)
     
-    # Fetch images - include data for thumbnails
+    # Metadata only - thumbnails are loaded from the raw URL (browser-cached)
     images = await db.images.find(
         query,
-        {"_id": 0}
+        {"_id": 0, "data": 0}
     ).sort("created_at", -1).skip(offset).limit(limit).to_list(limit)
     
-    # Mark all as having data
+    # Data is the stored blob, or legacy base64 not yet migrated (checked without loading it)
+    legacy_ids = [img["id"] for img in images if not img.get("blob_sha256")]
+    legacy_with_data = set()
+    if legacy_ids:
+        async for doc in db.images.find({"id": {"$in": legacy_ids}, "data": {"$nin": [None, ""]}}, {"_id": 0, "id": 1}):
+            legacy_with_data.add(doc["id"])
     for img in images:
-        img["has_data"] = bool(img.get("data"))
+        img["has_data"] = bool(img.get("blob_sha256")) or img["id"] in legacy_with_data
+        img["url"] = image_raw_url(img["id"])
     
     return {
         "images": images,
@@ -982,7 +1382,7 @@ class ImageTagsRequest(BaseModel):
 @api_router.put("/images/{image_id}/tags")
 async def update_image_tags(image_id: str, request: ImageTagsRequest, user: dict = Depends(get_current_user)):
     """Update tags on an image."""
-    image = await db.images.find_one({"id": image_id})
+    image = await db.images.find_one({"id": image_id}, {"_id": 0, "user_id": 1})
     if not image:
         raise HTTPException(status_code=404, detail="Image not found")
     if not user.get("is_admin") and image.get("user_id") != user["id"]:
@@ -1027,10 +1427,10 @@ async def edit_image_endpoint(request: ImageEditRequest, user: dict = Depends(ge
         # Get source image
         source_data = None
         if request.image_id:
-            img_doc = await db.images.find_one({"id": request.image_id})
+            img_doc = await db.images.find_one({"id": request.image_id}, {"_id": 0})
             if not img_doc:
                 raise HTTPException(status_code=404, detail="Obraz zrodlowy nie znaleziony")
-            source_data = {"data": img_doc["data"], "mime_type": img_doc["mime_type"]}
+            source_data = {"data": await load_image_data(db, img_doc), "mime_type": img_doc["mime_type"]}
         elif request.source_image:
             source_data = {"data": request.source_image.data, "mime_type": request.source_image.mime_type}
         
@@ -1065,7 +1465,7 @@ async def edit_image_endpoint(request: ImageEditRequest, user: dict = Depends(ge
             "edit_mode": request.mode,
             "source_image_id": request.image_id,
             "mime_type": result["mime_type"],
-            "data": result["data"],
+            **await store_image_blob(db, result["data"], result["mime_type"]),
             "tags": [request.mode, "edycja"],
             "created_at": datetime.now(timezone.utc).isoformat()
         }
@@ -1160,7 +1560,7 @@ async def generate_batch_endpoint(request: MultiVariantRequest, user: dict = Dep
                 "article_id": request.article_id,
                 "variation_type": f"batch_{i}",
                 "mime_type": result["mime_type"],
-                "data": result["data"],
+                **await store_image_blob(db, result["data"], result["mime_type"]),
                 "tags": ["batch"],
                 "created_at": datetime.now(timezone.utc).isoformat()
             }
@@ -1343,9 +1743,10 @@ async def list_series(user: dict = Depends(get_current_user)):
 # --- SEO Assistant ---
 
 class SEOAssistantRequest(BaseModel):
-    mode: str = "analyze"  # "analyze" or "chat"
+    mode: str = "analyze"  # "analyze", "analyze_sections" or "chat"
     message: Optional[str] = None
     history: Optional[List[Dict[str, str]]] = None
+    force: bool = False  # skip the analysis cache and run a full analysis
 
 @api_router.post("/articles/{article_id}/seo-assistant")
 async def seo_assistant_endpoint(article_id: str, request: SEOAssistantRequest):
@@ -1361,9 +1762,40 @@ async def seo_assistant_endpoint(article_id: str, request: SEOAssistantRequest):
                 user_message=request.message,
                 conversation_history=request.history or []
             )
+            return result
+        
+        cached = await db.seo_analyses.find_one({"article_id": article_id}, {"_id": 0})
+        
+        # Identical prompt inputs -> reuse the stored analysis
+        if (cached and not request.force and not cached.get("stale")
+                and cached.get("fingerprint") == compute_analysis_fingerprint(article)):
+            return {**cached["result"], "cached": True}
+        
+        changed = None if request.force else find_changed_sections(cached, article)
+        changed_anchors = [article["sections"][i].get("anchor", "") for i in changed] if changed else []
+        
+        if changed and request.mode == "analyze_sections":
+            result = await analyze_article_sections(article, changed, cached["result"])
+        elif changed:
+            # Only a few sections changed - offer an incremental re-analysis instead of a full LLM call
+            return {
+                **cached["result"],
+                "cached": True,
+                "stale": True,
+                "incremental_available": True,
+                "changed_sections": changed_anchors
+            }
         else:
             result = await analyze_article_seo(article=article)
         
+        cache_entry = build_analysis_cache_entry(article, result)
+        cache_entry["updated_at"] = datetime.now(timezone.utc).isoformat()
+        await db.seo_analyses.update_one(
+            {"article_id": article_id},
+            {"$set": cache_entry},
+            upsert=True
+        )
+        
         return result
         
     except json.JSONDecodeError as e:
@@ -1506,18 +1938,21 @@ async def import_article_from_url(request: ImportUrlRequest, user: dict = Depend
         "meta_title": optimized.get("meta_title", ""),
         "meta_description": optimized.get("meta_description", ""),
         "sections": optimized.get("sections", []),
+        "derived": build_derived(optimized.get("sections", [])),
         "faq": optimized.get("faq", []),
         "toc": optimized.get("toc", []),
         "sources": optimized.get("sources", []),
         "internal_link_suggestions": optimized.get("internal_link_suggestions", []),
         "source_url": request.url,
         "imported": True,
+        "version": 1,
         "created_at": datetime.now(timezone.utc).isoformat(),
         "seo_score": {"percentage": 0}
     }
     
     await db.articles.insert_one(article_doc)
     article_doc.pop("_id", None)
+    article_doc.pop("derived", None)
     
     return article_doc
 
@@ -1559,7 +1994,7 @@ async def suggest_internal_links(article_id: str, user: dict = Depends(get_curre
     # Get all user's articles
     all_articles = await db.articles.find(
         {"user_id": user["id"]},
-        {"_id": 0, "id": 1, "title": 1, "primary_keyword": 1, "sections": 1}
+        {"_id": 0, "id": 1, "title": 1, "primary_keyword": 1}
     ).to_list(50)
     
     if len(all_articles) < 2:
@@ -1626,21 +2061,16 @@ class SchedulePublishRequest(BaseModel):
 @api_router.post("/articles/{article_id}/schedule")
 async def schedule_article_publish(article_id: str, request: SchedulePublishRequest, user: dict = Depends(get_current_user)):
     """Schedule an article for future WordPress publishing."""
-    article = await db.articles.find_one({"id": article_id}, {"_id": 0})
-    if not article:
-        raise HTTPException(status_code=404, detail="Artykul nie znaleziony")
-    
-    if not user.get("is_admin") and article.get("user_id") != user["id"]:
-        raise HTTPException(status_code=403, detail="Brak dostepu")
-    
-    await db.articles.update_one(
-        {"id": article_id},
+    result = await db.articles.update_one(
+        article_write_filter(article_id, user, allow_unowned=False),
         {"$set": {
             "scheduled_at": request.scheduled_at,
             "scheduled_wp": request.publish_to_wordpress,
             "schedule_status": "scheduled"
         }}
     )
+    if not result.matched_count:
+        await raise_article_write_failure(article_id, user, not_found="Artykul nie znaleziony", allow_unowned=False)
     
     return {
         "message": f"Artykul zaplanowany na {request.scheduled_at}",
@@ -1652,10 +2082,12 @@ async def schedule_article_publish(article_id: str, request: SchedulePublishRequ
 @api_router.delete("/articles/{article_id}/schedule")
 async def cancel_scheduled_publish(article_id: str, user: dict = Depends(get_current_user)):
     """Cancel a scheduled publication."""
-    await db.articles.update_one(
-        {"id": article_id},
+    result = await db.articles.update_one(
+        article_write_filter(article_id, user, allow_unowned=False),
         {"$unset": {"scheduled_at": "", "scheduled_wp": "", "schedule_status": ""}}
     )
+    if not result.matched_count:
+        await raise_article_write_failure(article_id, user, not_found="Artykul nie znaleziony", allow_unowned=False)
     return {"message": "Planowana publikacja anulowana"}
 
 
@@ -1988,6 +2420,9 @@ class NewsletterRequest(BaseModel):
     article_ids: List[str] = []
     style: str = "informacyjny"
 
+# Only the fields the newsletter prompt reads
+NEWSLETTER_PROJECTION = {"_id": 0, "id": 1, "title": 1, "meta_description": 1, "seo_score.percentage": 1}
+
 @api_router.post("/newsletter/generate")
 async def generate_newsletter(request: NewsletterRequest, user: dict = Depends(get_current_user)):
     """Generate newsletter from selected articles."""
@@ -1997,9 +2432,9 @@ async def generate_newsletter(request: NewsletterRequest, user: dict = Depends(g
     
     # Get articles
     if request.article_ids:
-        articles = await db.articles.find({"id": {"$in": request.article_ids}, "user_id": user["id"]}, {"_id": 0}).to_list(20)
+        articles = await db.articles.find({"id": {"$in": request.article_ids}, "user_id": user["id"]}, NEWSLETTER_PROJECTION).to_list(20)
     else:
-        articles = await db.articles.find({"user_id": user["id"]}, {"_id": 0}).sort("created_at", -1).limit(5).to_list(5)
+        articles = await db.articles.find({"user_id": user["id"]}, NEWSLETTER_PROJECTION).sort("created_at", -1).limit(5).to_list(5)
     
     if not articles:
         raise HTTPException(status_code=400, detail="Brak artykułów do newslettera")
@@ -2205,6 +2640,7 @@ app.add_middleware(
     allow_origins=os.environ.get('CORS_ORIGINS', '*').split(','),
     allow_methods=["*"],
     allow_headers=["*"],
+    expose_headers=["ETag", "X-Export-Budget"],
 )
 
 # Configure logging
@@ -2226,7 +2662,7 @@ async def seed_admin_user():
         admin_doc = {
             "id": str(uuid.uuid4()),
             "email": admin_email,
-            "password_hash": hash_password(admin_password),
+            "password_hash": await run_cpu(hash_password, admin_password),
             "full_name": "Monika Gawkowska",
             "workspace_id": str(uuid.uuid4()),
             "is_admin": True,
@@ -2244,6 +2680,35 @@ async def seed_admin_user():
             )
             logger.info(f"Admin user flags updated: {admin_email}")
 
+@app.on_event("startup")
+async def start_cpu_offload():
+    """Thread pool for blocking work (PDF, scoring, parsing, bcrypt) - sized by CPU_EXECUTOR_WORKERS."""
+    start_cpu_executor()
+
+@app.on_event("startup")
+async def load_pdf_engine():
+    """Register PDF fonts and build the paragraph styles once, before the first export."""
+    await run_cpu(load_pdf_styles)
+
+@app.on_event("startup")
+async def load_html_templates():
+    """Compile the HTML export templates once, before the first export."""
+    await run_cpu(load_templates)
+
+@app.on_event("startup")
+async def ensure_image_indexes():
+    """
+    Indexes for blob reference checks (deleting an image), the legacy-data migration and
+    the released-blob purge, and the unique content hash that keeps one blob per image.
+    """
+    await db.images.create_index("blob_sha256")
+    await db[f"{BLOB_BUCKET}.files"].create_index("metadata.released_at", sparse=True)
+    await db[f"{BLOB_BUCKET}.files"].create_index("filename", unique=True)
+
 @app.on_event("shutdown")
 async def shutdown_db_client():
     client.close()
+
+@app.on_event("shutdown")
+async def shutdown_cpu_offload():
+    shutdown_cpu_executor()
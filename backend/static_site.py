@@ -0,0 +1,313 @@
+"""
+Incremental static site generator
+Renders workspace articles into a directory that can be served by any static host:
+one page per article (generate_full_html), an index, one page per keyword tag,
+sitemap.xml and rss.xml. A manifest.json in the output directory stores the content
+hash of every built article page, so a rebuild only renders the articles whose
+exported fields changed and removes the pages of deleted articles. Usable from the
+admin API and from the command line:
+
+    python static_site.py --output ./site [--user-id ID] [--base-url https://example.com] [--full]
+"""
+
+import asyncio
+import json
+import logging
+import os
+import tempfile
+import time
+from datetime import datetime, timezone
+from email.utils import format_datetime
+from pathlib import Path
+from typing import Callable, Dict, List, Optional
+from xml.sax.saxutils import escape as xml_escape
+
+from cpu_executor import run_cpu
+from export_cache import EXPORT_PROJECTION, export_fingerprint, get_or_render_export
+from html_templates import render_template
+from text_core import slugify
+
+logger = logging.getLogger(__name__)
+
+STATIC_SITE_DIR = Path(os.environ.get("STATIC_SITE_DIR") or os.path.join(tempfile.gettempdir(), "seo-static-site"))
+STATIC_SITE_URL = os.environ.get("STATIC_SITE_URL", "")
+
+# Bump when the page layout changes, so the next build re-renders every article
+SITE_VERSION = 1
+MANIFEST_NAME = "manifest.json"
+
+SITE_PROJECTION = {
+    **EXPORT_PROJECTION, "id": 1, "primary_keyword": 1, "secondary_keywords": 1,
+    "created_at": 1, "updated_at": 1
+}
+
+DEFAULT_WINDOW = 8
+
+
+def _write_if_changed(path: Path, content: bytes) -> bool:
+    """Atomically write `content` unless the file already holds exactly that. True when written."""
+    try:
+        if path.read_bytes() == content:
+            return False
+    except OSError:
+        pass
+    path.parent.mkdir(parents=True, exist_ok=True)
+    fd, tmp = tempfile.mkstemp(dir=path.parent, prefix=".tmp-")
+    with os.fdopen(fd, "wb") as f:
+        f.write(content)
+    os.replace(tmp, path)
+    return True
+
+
+def _load_manifest(output_dir: Path) -> dict:
+    try:
+        manifest = json.loads((output_dir / MANIFEST_NAME).read_text(encoding="utf-8"))
+    except (OSError, ValueError):
+        return {}
+    return manifest if manifest.get("version") == SITE_VERSION else {}
+
+
+def _article_tags(article: dict) -> List[str]:
+    keywords = [article.get("primary_keyword") or "", *(article.get("secondary_keywords") or [])]
+    return list(dict.fromkeys(k.strip().lower() for k in keywords if k and k.strip()))
+
+
+def _page_entry(article: dict, content_hash: str) -> dict:
+    """Manifest entry: everything the index, tag pages and feeds need, without the content."""
+    article_id = article["id"]
+    return {
+        "hash": content_hash,
+        "path": f"articles/{slugify(article.get('slug') or article.get('title') or '') or 'artykul'}-{article_id[:8]}.html",
+        "title": article.get("title", ""),
+        "description": article.get("meta_description", ""),
+        "tags": _article_tags(article),
+        "created_at": article.get("created_at") or "",
+        "updated_at": article.get("updated_at") or article.get("created_at") or "",
+    }
+
+
+def _render_article_page(article: dict, output_dir: Path, path: str, content_hash: str) -> bool:
+    """Render (through the export cache) and write one article page. Blocking - runs on the CPU executor."""
+    content, _ = get_or_render_export(article, article["id"], "html", content_hash)
+    return _write_if_changed(output_dir / path, content)
+
+
+# ---------------------------------------------------------------------------
+# Index, tag pages and feeds
+# ---------------------------------------------------------------------------
+
+def _tag_path(tag: str) -> str:
+    return f"tags/{slugify(tag) or 'tag'}.html"
+
+
+def _list_page(title: str, entries: List[dict], root: str, tags: Optional[list] = None) -> bytes:
+    page = render_template("site_list.html", title=title, entries=entries, root=root, tags=tags or [])
+    return page.encode("utf-8")
+
+
+_EPOCH = datetime(1970, 1, 1, tzinfo=timezone.utc)
+
+
+def _parse_date(value: str) -> datetime:
+    # Missing dates map to a fixed value, so unchanged listings stay byte-identical
+    try:
+        parsed = datetime.fromisoformat(str(value).replace("Z", "+00:00"))
+    except ValueError:
+        return _EPOCH
+    return parsed if parsed.tzinfo else parsed.replace(tzinfo=timezone.utc)
+
+
+def _sitemap(entries: List[dict], tags: Dict[str, List[dict]], base_url: str) -> bytes:
+    urls = [f"<url><loc>{xml_escape(base_url)}/index.html</loc></url>"]
+    for e in entries:
+        lastmod = _parse_date(e["updated_at"]).date().isoformat()
+        loc = xml_escape(f"{base_url}/{e['path']}")
+        urls.append(f"<url><loc>{loc}</loc><lastmod>{lastmod}</lastmod></url>")
+    for tag in tags:
+        urls.append(f"<url><loc>{xml_escape(base_url + '/' + _tag_path(tag))}</loc></url>")
+    return (
+        '<?xml version="1.0" encoding="UTF-8"?>\n'
+        '<urlset xmlns="http://www.sitemaps.org/schemas/sitemap/0.9">\n'
+        + "\n".join(urls) + "\n</urlset>\n"
+    ).encode("utf-8")
+
+
+def _rss(entries: List[dict], base_url: str, limit: int = 50) -> bytes:
+    items = []
+    for e in entries[:limit]:
+        link = xml_escape(f"{base_url}/{e['path']}")
+        items.append(
+            f"<item><title>{xml_escape(e['title'])}</title><link>{link}</link><guid>{link}</guid>"
+            f"<description>{xml_escape(e['description'])}</description>"
+            f"<pubDate>{format_datetime(_parse_date(e['created_at']))}</pubDate></item>"
+        )
+    last_build = format_datetime(max((_parse_date(e["updated_at"]) for e in entries), default=_EPOCH))
+    return (
+        '<?xml version="1.0" encoding="UTF-8"?>\n<rss version="2.0"><channel>'
+        f"<title>Artykuły</title><link>{xml_escape(base_url)}/index.html</link>"
+        f"<description>Najnowsze artykuły</description><lastBuildDate>{last_build}</lastBuildDate>"
+        + "".join(items) + "</channel></rss>\n"
+    ).encode("utf-8")
+
+
+def _write_listings(output_dir: Path, entries: List[dict], base_url: str, stale_tag_paths: set) -> int:
+    """Index, tag pages, sitemap and RSS; only files whose bytes changed are rewritten. Returns the count written."""
+    tags: Dict[str, List[dict]] = {}
+    for e in entries:
+        for tag in e["tags"]:
+            tags.setdefault(tag, []).append(e)
+
+    files = {
+        "index.html": _list_page("Wszystkie artykuły", entries, "", [(_tag_path(t), t) for t in sorted(tags)]),
+        "sitemap.xml": _sitemap(entries, tags, base_url),
+        "rss.xml": _rss(entries, base_url),
+    }
+    for tag, tagged in tags.items():
+        files[_tag_path(tag)] = _list_page(f"Tag: {tag}", tagged, "../")
+
+    written = sum(_write_if_changed(output_dir / path, content) for path, content in files.items())
+    for path in stale_tag_paths - set(files):
+        (output_dir / path).unlink(missing_ok=True)
+    return written
+
+
+# ---------------------------------------------------------------------------
+# Build
+# ---------------------------------------------------------------------------
+
+async def build_static_site(
+    db,
+    output_dir: Optional[Path] = None,
+    query: Optional[dict] = None,
+    base_url: Optional[str] = None,
+    full: bool = False,
+    window: int = DEFAULT_WINDOW,
+    on_progress: Optional[Callable[[dict], None]] = None
+) -> dict:
+    """
+    Build or update the static site for every article matching `query`.
+    Article pages whose content hash matches the manifest (and whose file exists) are
+    skipped; `full` re-renders everything the query matches. Pages of articles outside
+    the query stay on the site. Listings are regenerated from the manifest entries,
+    which is cheap, and only rewritten when their bytes change.
+    """
+    output_dir = Path(output_dir or STATIC_SITE_DIR)
+    base_url = (base_url if base_url is not None else STATIC_SITE_URL).rstrip("/")
+    output_dir.mkdir(parents=True, exist_ok=True)
+
+    # Loaded for `full` too: entries outside the query are carried over, not dropped
+    previous = _load_manifest(output_dir).get("articles", {})
+    stale_tag_paths = {str(p.relative_to(output_dir)) for p in (output_dir / "tags").glob("*.html")}
+    current: Dict[str, dict] = {}
+    stats = {"scanned": 0, "rendered": 0, "unchanged": 0, "removed": 0, "failed": 0, "errors": []}
+    started = time.perf_counter()
+    pending = []
+
+    async def flush():
+        results = await asyncio.gather(*(task for _, task in pending), return_exceptions=True)
+        for (article_id, _), result in zip(pending, results):
+            if isinstance(result, Exception):
+                stats["failed"] += 1
+                # Keep serving the last good page, if there is one
+                old = previous.get(article_id)
+                if old and (output_dir / old["path"]).exists():
+                    current[article_id] = old
+                else:
+                    current.pop(article_id, None)
+                if len(stats["errors"]) < 20:
+                    stats["errors"].append({"id": article_id, "error": str(result)})
+            else:
+                stats["rendered"] += 1
+        pending.clear()
+        if on_progress:
+            on_progress(stats)
+
+    cursor = db.articles.find(query or {}, SITE_PROJECTION).sort("created_at", -1).batch_size(50)
+    async for article in cursor:
+        stats["scanned"] += 1
+        article_id = article["id"]
+        entry = _page_entry(article, export_fingerprint(article, "html"))
+        current[article_id] = entry
+
+        old = previous.get(article_id)
+        if (not full and old and old["hash"] == entry["hash"] and old["path"] == entry["path"]
+                and (output_dir / entry["path"]).exists()):
+            stats["unchanged"] += 1
+            continue
+        if old and old["path"] != entry["path"]:
+            (output_dir / old["path"]).unlink(missing_ok=True)
+        task = asyncio.ensure_future(run_cpu(_render_article_page, article, output_dir, entry["path"], entry["hash"]))
+        pending.append((article_id, task))
+        if len(pending) >= window:
+            await flush()
+    if pending:
+        await flush()
+
+    # A scoped build (e.g. one user's articles) shares the site with the rest: pages of
+    # articles outside the query are kept, only those of deleted articles are removed
+    missing = [article_id for article_id in previous if article_id not in current]
+    out_of_scope = set()
+    if missing and query:
+        out_of_scope = {a["id"] async for a in db.articles.find({"id": {"$in": missing}}, {"_id": 0, "id": 1})}
+    for article_id in missing:
+        old = previous[article_id]
+        if article_id in out_of_scope:
+            current[article_id] = old
+        else:
+            (output_dir / old["path"]).unlink(missing_ok=True)
+            stats["removed"] += 1
+
+    entries = sorted(current.values(), key=lambda e: _parse_date(e["created_at"]), reverse=True)
+    stats["pages"] = len(entries)
+    stats["listings_written"] = await run_cpu(_write_listings, output_dir, entries, base_url, stale_tag_paths)
+
+    manifest = {
+        "version": SITE_VERSION,
+        "built_at": datetime.now(timezone.utc).isoformat(),
+        "articles": current,
+    }
+    _write_if_changed(output_dir / MANIFEST_NAME, json.dumps(manifest, ensure_ascii=False, indent=1).encode("utf-8"))
+
+    stats["elapsed_seconds"] = round(time.perf_counter() - started, 3)
+    stats["output_dir"] = str(output_dir)
+    logger.info(
+        f"Static site: {stats['rendered']} rendered, {stats['unchanged']} unchanged, "
+        f"{stats['removed']} removed, {stats['failed']} failed in {stats['elapsed_seconds']}s"
+    )
+    return stats
+
+
+async def _main():
+    import argparse
+    from dotenv import load_dotenv
+    from motor.motor_asyncio import AsyncIOMotorClient
+
+    parser = argparse.ArgumentParser(description="Build the static site of workspace articles.")
+    parser.add_argument("--output", default=None, help=f"output directory (default: {STATIC_SITE_DIR})")
+    parser.add_argument("--user-id", help="only articles of this user")
+    parser.add_argument("--base-url", default=None, help="public URL of the site, used in sitemap.xml and rss.xml")
+    parser.add_argument("--full", action="store_true", help="re-render every article, ignoring the manifest")
+    args = parser.parse_args()
+
+    load_dotenv(Path(__file__).parent / '.env')
+    client = AsyncIOMotorClient(os.environ['MONGO_URL'])
+    db = client[os.environ.get('DB_NAME', 'seo_article_writer')]
+
+    query = {"user_id": args.user_id} if args.user_id else {}
+    try:
+        stats = await build_static_site(db, args.output, query, args.base_url, args.full)
+    finally:
+        client.close()
+
+    print(
+        f"Scanned {stats['scanned']}, rendered {stats['rendered']}, unchanged {stats['unchanged']}, "
+        f"removed {stats['removed']}, failed {stats['failed']} in {stats['elapsed_seconds']}s -> "
+        f"{stats['output_dir']} ({stats['pages']} pages)"
+    )
+    for err in stats["errors"]:
+        print(f"  {err['id']}: {err['error']}")
+
+
+if __name__ == "__main__":
+    logging.basicConfig(level=logging.INFO, format='%(asctime)s - %(name)s - %(levelname)s - %(message)s')
+    asyncio.run(_main())
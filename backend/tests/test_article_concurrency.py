@@ -0,0 +1,132 @@
+"""
+Test Article Versions (ETag / If-Match):
+- GET /api/articles/{id} returns the article version as ETag
+- PATCH and PUT with the current If-Match succeed and return the next ETag
+- PATCH, PUT and DELETE with a stale If-Match return 412 and change nothing
+- Writes without If-Match keep working
+- POST /api/articles/{id}/score needs auth, keeps the version and honours If-Match
+"""
+import pytest
+import requests
+import os
+
+BASE_URL = os.environ.get('REACT_APP_BACKEND_URL', '').rstrip('/')
+
+# Test credentials
+ADMIN_EMAIL = "monika.gawkowska@kurdynowski.pl"
+ADMIN_PASSWORD = "MonZuz8180!"
+
+
+@pytest.fixture(scope="module")
+def auth_headers():
+    """Headers with auth token for admin user."""
+    response = requests.post(f"{BASE_URL}/api/auth/login", json={
+        "email": ADMIN_EMAIL,
+        "password": ADMIN_PASSWORD
+    })
+    if response.status_code != 200:
+        pytest.skip(f"Authentication failed - status {response.status_code}")
+    return {"Authorization": f"Bearer {response.json().get('token')}", "Content-Type": "application/json"}
+
+
+@pytest.fixture(scope="module")
+def article(auth_headers):
+    """First article; its meta description is restored after the tests."""
+    response = requests.get(f"{BASE_URL}/api/articles", headers=auth_headers)
+    assert response.status_code == 200
+    if not response.json():
+        pytest.skip("No articles")
+    original = response.json()[0]
+    yield original
+    requests.patch(f"{BASE_URL}/api/articles/{original['id']}", json=[
+        {"op": "replace", "path": "/meta_description", "value": original.get("meta_description", "")}
+    ], headers=auth_headers)
+
+
+def _etag(article_id, headers):
+    response = requests.get(f"{BASE_URL}/api/articles/{article_id}", headers=headers)
+    assert response.status_code == 200
+    return response.headers.get("ETag")
+
+
+class TestArticleConcurrency:
+    """Optimistic concurrency for editor saves."""
+
+    def test_get_returns_etag(self, auth_headers, article):
+        """GET exposes the version as a quoted ETag."""
+        etag = _etag(article["id"], auth_headers)
+        assert etag and etag.startswith('"') and etag.strip('"').isdigit()
+        print(f"✓ GET returns ETag {etag}")
+
+    def test_patch_with_current_etag(self, auth_headers, article):
+        """PATCH with the current If-Match succeeds and bumps the version."""
+        etag = _etag(article["id"], auth_headers)
+        response = requests.patch(f"{BASE_URL}/api/articles/{article['id']}", json=[
+            {"op": "replace", "path": "/meta_description", "value": "Opis z testu wersji."}
+        ], headers={**auth_headers, "If-Match": etag})
+        assert response.status_code == 200
+        new_etag = response.headers.get("ETag")
+        assert int(new_etag.strip('"')) == int(etag.strip('"')) + 1
+        assert _etag(article["id"], auth_headers) == new_etag
+        print("✓ PATCH with current If-Match bumps the version")
+
+    def test_stale_etag_rejected(self, auth_headers, article):
+        """A save from a tab holding an older version returns 412 and is not applied."""
+        stale = _etag(article["id"], auth_headers)
+        response = requests.patch(f"{BASE_URL}/api/articles/{article['id']}", json=[
+            {"op": "replace", "path": "/meta_description", "value": "Zapis z pierwszej karty."}
+        ], headers={**auth_headers, "If-Match": stale})
+        assert response.status_code == 200
+
+        for method, body in (("patch", [{"op": "replace", "path": "/meta_description", "value": "Zapis z drugiej karty."}]),
+                             ("put", {"meta_description": "Zapis z drugiej karty."})):
+            response = requests.request(method, f"{BASE_URL}/api/articles/{article['id']}", json=body,
+                                        headers={**auth_headers, "If-Match": stale})
+            assert response.status_code == 412, method
+        response = requests.delete(f"{BASE_URL}/api/articles/{article['id']}", headers={**auth_headers, "If-Match": stale})
+        assert response.status_code == 412
+
+        stored = requests.get(f"{BASE_URL}/api/articles/{article['id']}", headers=auth_headers).json()
+        assert stored["meta_description"] == "Zapis z pierwszej karty."
+        print("✓ Stale If-Match returns 412 for PATCH, PUT and DELETE")
+
+    def test_put_without_if_match(self, auth_headers, article):
+        """PUT without If-Match still saves and returns the new ETag."""
+        etag = _etag(article["id"], auth_headers)
+        response = requests.put(f"{BASE_URL}/api/articles/{article['id']}", json={
+            "meta_description": "Opis bez If-Match."
+        }, headers=auth_headers)
+        assert response.status_code == 200
+        assert response.json()["version"] == int(etag.strip('"')) + 1
+        assert response.headers.get("ETag") == f'"{response.json()["version"]}"'
+        print("✓ PUT without If-Match saves and returns ETag")
+
+    def test_score_keeps_version(self, auth_headers, article):
+        """Scoring stores seo_score without bumping the version; a stale If-Match returns 412."""
+        body = {"primary_keyword": article.get("primary_keyword") or "test", "secondary_keywords": []}
+        response = requests.post(f"{BASE_URL}/api/articles/{article['id']}/score", json=body)
+        assert response.status_code == 401
+
+        etag = _etag(article["id"], auth_headers)
+        response = requests.post(f"{BASE_URL}/api/articles/{article['id']}/score", json=body,
+                                 headers={**auth_headers, "If-Match": etag})
+        assert response.status_code == 200
+        assert "percentage" in response.json()
+        assert response.headers.get("ETag") == etag
+        stored = requests.get(f"{BASE_URL}/api/articles/{article['id']}", headers=auth_headers)
+        assert stored.headers.get("ETag") == etag
+        assert stored.json().get("seo_scored_at")
+
+        other = int(etag.strip('"')) + 1
+        response = requests.post(f"{BASE_URL}/api/articles/{article['id']}/score", json=body,
+                                 headers={**auth_headers, "If-Match": f'"{other}"'})
+        assert response.status_code == 412
+        print("✓ Score requires auth, keeps the version and rejects a stale If-Match")
+
+    def test_missing_article(self, auth_headers):
+        """Writes to an unknown article return 404."""
+        response = requests.put(f"{BASE_URL}/api/articles/nie-istnieje", json={"title": "x"}, headers=auth_headers)
+        assert response.status_code == 404
+        response = requests.delete(f"{BASE_URL}/api/articles/nie-istnieje", headers=auth_headers)
+        assert response.status_code == 404
+        print("✓ Unknown article returns 404")
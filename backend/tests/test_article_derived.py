@@ -0,0 +1,72 @@
+"""
+Test Derived Article Representation:
+- PUT /api/articles/{id} with sections stores the derived representation
+- GET /api/articles and /api/articles/{id} do not expose it
+- Exports read the section text from it (Facebook intro = first section text)
+"""
+import re
+import pytest
+import requests
+import os
+
+BASE_URL = os.environ.get('REACT_APP_BACKEND_URL', '').rstrip('/')
+
+# Test credentials
+ADMIN_EMAIL = "monika.gawkowska@kurdynowski.pl"
+ADMIN_PASSWORD = "MonZuz8180!"
+
+
+@pytest.fixture(scope="module")
+def auth_headers():
+    """Headers with auth token for admin user."""
+    response = requests.post(f"{BASE_URL}/api/auth/login", json={
+        "email": ADMIN_EMAIL,
+        "password": ADMIN_PASSWORD
+    })
+    if response.status_code != 200:
+        pytest.skip(f"Authentication failed - status {response.status_code}")
+    return {"Authorization": f"Bearer {response.json().get('token')}", "Content-Type": "application/json"}
+
+
+@pytest.fixture(scope="module")
+def article(auth_headers):
+    """First article that has sections."""
+    response = requests.get(f"{BASE_URL}/api/articles", headers=auth_headers)
+    assert response.status_code == 200
+    for a in response.json():
+        if a.get("sections"):
+            return a
+    pytest.skip("No article with sections")
+
+
+class TestArticleDerived:
+    """Derived text/outline is stored on write and kept out of API responses."""
+
+    def test_update_hides_derived(self, auth_headers, article):
+        """Saving the (unchanged) sections returns the article without the derived field."""
+        response = requests.put(f"{BASE_URL}/api/articles/{article['id']}", json={
+            "sections": article["sections"]
+        }, headers=auth_headers)
+        assert response.status_code == 200
+        data = response.json()
+        assert "derived" not in data
+        assert data["sections"] == article["sections"]
+        print("✓ PUT response does not expose derived")
+
+    def test_get_hides_derived(self, auth_headers, article):
+        """Single and list reads do not expose the derived field."""
+        single = requests.get(f"{BASE_URL}/api/articles/{article['id']}", headers=auth_headers).json()
+        assert "derived" not in single
+        listed = requests.get(f"{BASE_URL}/api/articles", headers=auth_headers).json()
+        assert all("derived" not in a for a in listed)
+        print("✓ GET responses do not expose derived")
+
+    def test_facebook_export_uses_section_text(self, auth_headers, article):
+        """Facebook post intro is the plain text of the first section."""
+        response = requests.post(f"{BASE_URL}/api/articles/{article['id']}/export", json={
+            "format": "facebook"
+        }, headers=auth_headers)
+        assert response.status_code == 200
+        intro = re.sub(r'<[^>]+>', '', article["sections"][0].get("content", "")).strip()[:150]
+        assert intro in response.json()["content"]
+        print("✓ Facebook export intro comes from the first section text")
@@ -0,0 +1,95 @@
+"""
+Test Delta Article Updates (PATCH /api/articles/{id}):
+- JSON-patch operations replace single fields and single section bodies
+- Only the changed paths are reported and written; other sections stay untouched
+- Invalid operations, paths, indices and values return 400
+- Requires authentication
+"""
+import pytest
+import requests
+import os
+
+BASE_URL = os.environ.get('REACT_APP_BACKEND_URL', '').rstrip('/')
+
+# Test credentials
+ADMIN_EMAIL = "monika.gawkowska@kurdynowski.pl"
+ADMIN_PASSWORD = "MonZuz8180!"
+
+
+@pytest.fixture(scope="module")
+def auth_headers():
+    """Headers with auth token for admin user."""
+    response = requests.post(f"{BASE_URL}/api/auth/login", json={
+        "email": ADMIN_EMAIL,
+        "password": ADMIN_PASSWORD
+    })
+    if response.status_code != 200:
+        pytest.skip(f"Authentication failed - status {response.status_code}")
+    return {"Authorization": f"Bearer {response.json().get('token')}", "Content-Type": "application/json"}
+
+
+@pytest.fixture(scope="module")
+def article(auth_headers):
+    """First article with at least two sections; restored after the tests."""
+    response = requests.get(f"{BASE_URL}/api/articles", headers=auth_headers)
+    assert response.status_code == 200
+    candidates = [a for a in response.json() if len(a.get("sections", [])) >= 2]
+    if not candidates:
+        pytest.skip("No article with two sections")
+    original = candidates[0]
+    yield original
+    requests.patch(f"{BASE_URL}/api/articles/{original['id']}", json=[
+        {"op": "replace", "path": "/meta_description", "value": original.get("meta_description", "")},
+        {"op": "replace", "path": "/sections", "value": original["sections"]},
+    ], headers=auth_headers)
+
+
+def _get(article_id, headers):
+    return requests.get(f"{BASE_URL}/api/articles/{article_id}", headers=headers).json()
+
+
+class TestArticlePatch:
+    """JSON-patch style partial saves."""
+
+    def test_patch_requires_auth(self, article):
+        """PATCH without token returns 401."""
+        response = requests.patch(f"{BASE_URL}/api/articles/{article['id']}", json=[])
+        assert response.status_code == 401
+        print("✓ PATCH requires authentication (401)")
+
+    def test_patch_field(self, auth_headers, article):
+        """Replacing meta_description changes only that field."""
+        response = requests.patch(f"{BASE_URL}/api/articles/{article['id']}", json=[
+            {"op": "replace", "path": "/meta_description", "value": "Nowy opis z testu patch."}
+        ], headers=auth_headers)
+        assert response.status_code == 200
+        assert response.json()["changed_paths"] == ["meta_description"]
+        stored = _get(article["id"], auth_headers)
+        assert stored["meta_description"] == "Nowy opis z testu patch."
+        assert stored["sections"] == article["sections"]
+        print("✓ Single field patched")
+
+    def test_patch_section_content(self, auth_headers, article):
+        """Replacing one section body writes sections.N.content only."""
+        new_content = "<p>Zmieniona tresc sekcji z testu patch.</p>"
+        response = requests.patch(f"{BASE_URL}/api/articles/{article['id']}", json=[
+            {"op": "replace", "path": "/sections/1/content", "value": new_content}
+        ], headers=auth_headers)
+        assert response.status_code == 200
+        assert response.json()["changed_paths"] == ["sections.1.content"]
+        stored = _get(article["id"], auth_headers)
+        assert stored["sections"][1]["content"] == new_content
+        assert stored["sections"][0] == article["sections"][0]
+        print("✓ Single section body patched")
+
+    def test_patch_invalid(self, auth_headers, article):
+        """Unsupported op, unknown path, out-of-range index and wrong value type return 400."""
+        for ops in (
+            [{"op": "move", "path": "/title", "value": "x"}],
+            [{"op": "replace", "path": "/user_id", "value": "x"}],
+            [{"op": "replace", "path": "/sections/999/content", "value": "x"}],
+            [{"op": "replace", "path": "/sections/0/content", "value": 5}],
+        ):
+            response = requests.patch(f"{BASE_URL}/api/articles/{article['id']}", json=ops, headers=auth_headers)
+            assert response.status_code == 400, ops
+        print("✓ Invalid patches return 400")
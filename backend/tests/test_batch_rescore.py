@@ -0,0 +1,110 @@
+"""
+Test Batch SEO Rescoring (admin):
+- POST /api/admin/rescore requires admin and returns job_id immediately
+- GET /api/admin/rescore/status/{job_id} reports progress and final throughput stats
+- Dry run does not write any scores
+- Non-existent job_id returns 404
+"""
+import pytest
+import requests
+import os
+import time
+import uuid
+
+BASE_URL = os.environ.get('REACT_APP_BACKEND_URL', '').rstrip('/')
+
+# Test credentials
+ADMIN_EMAIL = "monika.gawkowska@kurdynowski.pl"
+ADMIN_PASSWORD = "MonZuz8180!"
+
+
+@pytest.fixture(scope="module")
+def auth_token():
+    """Get authentication token for admin user."""
+    response = requests.post(f"{BASE_URL}/api/auth/login", json={
+        "email": ADMIN_EMAIL,
+        "password": ADMIN_PASSWORD
+    })
+    if response.status_code == 200:
+        return response.json().get("token")
+    pytest.skip(f"Authentication failed - status {response.status_code}")
+
+
+@pytest.fixture(scope="module")
+def auth_headers(auth_token):
+    """Headers with auth token."""
+    return {"Authorization": f"Bearer {auth_token}", "Content-Type": "application/json"}
+
+
+def _wait_for_job(job_id, headers, timeout=120):
+    """Poll the rescore job until it completes or fails."""
+    deadline = time.time() + timeout
+    while time.time() < deadline:
+        response = requests.get(f"{BASE_URL}/api/admin/rescore/status/{job_id}", headers=headers)
+        assert response.status_code == 200, f"Status poll failed: {response.text}"
+        data = response.json()
+        if data["status"] in ("completed", "failed"):
+            return data
+        assert "progress" in data
+        time.sleep(1)
+    pytest.fail("Rescore job did not finish in time")
+
+
+class TestBatchRescore:
+    """Admin batch rescoring - async pattern with job_id polling."""
+
+    def test_rescore_requires_auth(self):
+        """POST /api/admin/rescore without token returns 401."""
+        response = requests.post(f"{BASE_URL}/api/admin/rescore", json={})
+        assert response.status_code == 401
+        print("✓ Batch rescore requires authentication (401)")
+
+    def test_rescore_dry_run(self, auth_headers):
+        """Dry run scores articles and reports throughput without writing."""
+        response = requests.post(f"{BASE_URL}/api/admin/rescore", json={"dry_run": True, "workers": 2}, headers=auth_headers)
+        assert response.status_code == 200
+        data = response.json()
+        assert data.get("status") == "queued"
+
+        result = _wait_for_job(data["job_id"], auth_headers)
+        assert result["status"] == "completed", f"Job failed: {result.get('error')}"
+        stats = result["result"]
+        assert stats["dry_run"] is True
+        assert stats["written"] == 0 and stats["skipped"] == 0
+        assert stats["rescored"] + stats["failed"] == stats["scanned"]
+        assert "articles_per_second" in stats and "elapsed_seconds" in stats
+        print(f"✓ Dry run scanned {stats['scanned']} articles ({stats['articles_per_second']} art/s)")
+
+    def test_rescore_worker_bounds(self, auth_headers):
+        """workers below 1 is rejected; a huge value is capped at the CPU count."""
+        response = requests.post(f"{BASE_URL}/api/admin/rescore", json={"dry_run": True, "workers": 0}, headers=auth_headers)
+        assert response.status_code == 400
+
+        response = requests.post(f"{BASE_URL}/api/admin/rescore", json={"dry_run": True, "workers": 10000}, headers=auth_headers)
+        assert response.status_code == 200
+        result = _wait_for_job(response.json()["job_id"], auth_headers)
+        assert result["status"] == "completed", f"Job failed: {result.get('error')}"
+        assert 1 <= result["result"]["workers"] < 10000
+        print(f"✓ workers=0 rejected, workers=10000 capped at {result['result']['workers']}")
+
+    def test_rescore_writes_scores(self, auth_headers):
+        """Full run stores seo_score on the user's articles."""
+        me = requests.get(f"{BASE_URL}/api/auth/me", headers=auth_headers).json()
+        response = requests.post(f"{BASE_URL}/api/admin/rescore", json={"user_id": me["id"]}, headers=auth_headers)
+        assert response.status_code == 200
+
+        result = _wait_for_job(response.json()["job_id"], auth_headers)
+        assert result["status"] == "completed", f"Job failed: {result.get('error')}"
+
+        articles = requests.get(f"{BASE_URL}/api/articles", headers=auth_headers).json()
+        own = [a for a in articles if a.get("user_id") == me["id"]]
+        if own:
+            assert "percentage" in own[0]["seo_score"]
+            assert own[0].get("seo_scored_at")
+        print(f"✓ Rescored {result['result']['rescored']} articles")
+
+    def test_status_unknown_job(self, auth_headers):
+        """Non-existent job_id returns 404."""
+        response = requests.get(f"{BASE_URL}/api/admin/rescore/status/{uuid.uuid4()}", headers=auth_headers)
+        assert response.status_code == 404
+        print("✓ Unknown rescore job returns 404")
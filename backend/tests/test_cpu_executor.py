@@ -0,0 +1,72 @@
+"""
+Test CPU Offload Executor (GET /api/admin/cpu-executor):
+- Admin only
+- Reports pool size, queue depth and per-task statistics
+- Login (bcrypt) and scoring are routed through the pool
+"""
+import pytest
+import requests
+import os
+
+BASE_URL = os.environ.get('REACT_APP_BACKEND_URL', '').rstrip('/')
+
+# Test credentials
+ADMIN_EMAIL = "monika.gawkowska@kurdynowski.pl"
+ADMIN_PASSWORD = "MonZuz8180!"
+
+
+@pytest.fixture(scope="module")
+def auth_headers():
+    """Headers with auth token for admin user."""
+    response = requests.post(f"{BASE_URL}/api/auth/login", json={
+        "email": ADMIN_EMAIL,
+        "password": ADMIN_PASSWORD
+    })
+    if response.status_code != 200:
+        pytest.skip(f"Authentication failed - status {response.status_code}")
+    return {"Authorization": f"Bearer {response.json().get('token')}", "Content-Type": "application/json"}
+
+
+def _metrics(headers):
+    response = requests.get(f"{BASE_URL}/api/admin/cpu-executor", headers=headers)
+    assert response.status_code == 200
+    return response.json()
+
+
+class TestCpuExecutor:
+    """Blocking work runs on the offload pool and is visible in its metrics."""
+
+    def test_requires_admin(self):
+        """Metrics without token return 401."""
+        response = requests.get(f"{BASE_URL}/api/admin/cpu-executor")
+        assert response.status_code == 401
+        print("✓ CPU executor metrics require authentication")
+
+    def test_metrics_shape(self, auth_headers):
+        """Pool size and queue counters are reported."""
+        data = _metrics(auth_headers)
+        assert data["started"] is True
+        assert data["max_workers"] >= 1
+        assert data["queued"] >= 0 and data["running"] >= 0
+        print(f"✓ Pool with {data['max_workers']} workers, max queued {data['max_queued']}")
+
+    def test_login_uses_pool(self, auth_headers):
+        """Password verification is counted as a pool task."""
+        before = _metrics(auth_headers)["tasks"].get("verify_password", {}).get("completed", 0)
+        requests.post(f"{BASE_URL}/api/auth/login", json={"email": ADMIN_EMAIL, "password": ADMIN_PASSWORD})
+        task = _metrics(auth_headers)["tasks"]["verify_password"]
+        assert task["completed"] == before + 1
+        assert task["avg_run_ms"] > 0
+        print(f"✓ verify_password ran on the pool (avg {task['avg_run_ms']} ms)")
+
+    def test_live_score_uses_pool(self, auth_headers):
+        """Live scoring parses and scores on the pool."""
+        response = requests.post(f"{BASE_URL}/api/score/live", json={
+            "primary_keyword": "podatek vat",
+            "html_content": "<h1>Podatek VAT</h1><h2>Stawki</h2><p>Podatek VAT w Polsce.</p>"
+        }, headers=auth_headers)
+        assert response.status_code == 200
+        tasks = _metrics(auth_headers)["tasks"]
+        assert tasks["parse_html_to_sections"]["completed"] >= 1
+        assert tasks["compute_seo_score"]["completed"] >= 1
+        print("✓ Live score ran on the pool")
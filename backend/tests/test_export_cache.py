@@ -0,0 +1,106 @@
+"""
+Test Export Artifact Cache (GET /api/articles/{id}/export/{format}):
+- Returns the rendered file with ETag and Last-Modified
+- If-None-Match / If-Modified-Since with the current values return 304
+- Changing the article changes the ETag
+- Unknown format returns 400, authentication is required
+"""
+import pytest
+import requests
+import os
+
+BASE_URL = os.environ.get('REACT_APP_BACKEND_URL', '').rstrip('/')
+
+# Test credentials
+ADMIN_EMAIL = "monika.gawkowska@kurdynowski.pl"
+ADMIN_PASSWORD = "MonZuz8180!"
+
+
+@pytest.fixture(scope="module")
+def auth_headers():
+    """Headers with auth token for admin user."""
+    response = requests.post(f"{BASE_URL}/api/auth/login", json={
+        "email": ADMIN_EMAIL,
+        "password": ADMIN_PASSWORD
+    })
+    if response.status_code != 200:
+        pytest.skip(f"Authentication failed - status {response.status_code}")
+    return {"Authorization": f"Bearer {response.json().get('token')}"}
+
+
+@pytest.fixture(scope="module")
+def article(auth_headers):
+    """First article with sections; its meta description is restored after the tests."""
+    response = requests.get(f"{BASE_URL}/api/articles", headers=auth_headers)
+    assert response.status_code == 200
+    candidates = [a for a in response.json() if a.get("sections")]
+    if not candidates:
+        pytest.skip("No article with sections")
+    original = candidates[0]
+    yield original
+    requests.patch(f"{BASE_URL}/api/articles/{original['id']}", json=[
+        {"op": "replace", "path": "/meta_description", "value": original.get("meta_description", "")}
+    ], headers=auth_headers)
+
+
+class TestExportCache:
+    """Cached export downloads with conditional requests."""
+
+    def test_requires_auth(self, article):
+        """Download without token returns 401."""
+        response = requests.get(f"{BASE_URL}/api/articles/{article['id']}/export/html")
+        assert response.status_code == 401
+        print("✓ Export download requires authentication")
+
+    def test_unknown_format(self, auth_headers, article):
+        """Unknown format returns 400."""
+        response = requests.get(f"{BASE_URL}/api/articles/{article['id']}/export/docx", headers=auth_headers)
+        assert response.status_code == 400
+        print("✓ Unknown export format returns 400")
+
+    @pytest.mark.parametrize("fmt,content_type", [
+        ("pdf", "application/pdf"),
+        ("html", "text/html; charset=utf-8"),
+        ("wordpress", "text/html; charset=utf-8"),
+    ])
+    def test_download_and_304(self, auth_headers, article, fmt, content_type):
+        """Second download with the ETag or Last-Modified is answered with 304 and no body."""
+        url = f"{BASE_URL}/api/articles/{article['id']}/export/{fmt}"
+        first = requests.get(url, headers=auth_headers)
+        assert first.status_code == 200
+        assert first.headers["content-type"] == content_type
+        etag = first.headers.get("ETag")
+        last_modified = first.headers.get("Last-Modified")
+        assert etag and last_modified
+
+        again = requests.get(url, headers={**auth_headers, "If-None-Match": etag})
+        assert again.status_code == 304
+        assert again.content == b""
+        assert again.headers.get("ETag") == etag
+
+        since = requests.get(url, headers={**auth_headers, "If-Modified-Since": last_modified})
+        assert since.status_code == 304
+        print(f"✓ {fmt}: 200 then 304 for ETag {etag}")
+
+    def test_post_export_matches_download(self, auth_headers, article):
+        """POST export returns the same WordPress content and ETag as the download."""
+        download = requests.get(f"{BASE_URL}/api/articles/{article['id']}/export/wordpress", headers=auth_headers)
+        response = requests.post(f"{BASE_URL}/api/articles/{article['id']}/export", json={"format": "wordpress"},
+                                 headers=auth_headers)
+        assert response.status_code == 200
+        assert response.json()["content"] == download.text
+        assert response.headers.get("ETag") == download.headers.get("ETag")
+        print("✓ POST export served from the same cache")
+
+    def test_change_invalidates(self, auth_headers, article):
+        """Editing the article gives a new ETag, so the old one no longer yields 304."""
+        url = f"{BASE_URL}/api/articles/{article['id']}/export/html"
+        etag = requests.get(url, headers=auth_headers).headers["ETag"]
+        requests.patch(f"{BASE_URL}/api/articles/{article['id']}", json=[
+            {"op": "replace", "path": "/meta_description", "value": "Opis z testu eksportu."}
+        ], headers=auth_headers)
+        response = requests.get(url, headers={**auth_headers, "If-None-Match": etag})
+        assert response.status_code == 200
+        assert response.headers["ETag"] != etag
+        assert "Opis z testu eksportu." in response.text
+        print("✓ Article change invalidates the cached export")
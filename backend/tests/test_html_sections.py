@@ -0,0 +1,60 @@
+"""
+Test HTML-to-sections parsing (html_sections, no server needed):
+- Nested headings, comments, <script> bodies and ">" inside attribute values
+- Unclosed headings stay content; headings completed inside them still count
+"""
+import sys
+from pathlib import Path
+
+sys.path.insert(0, str(Path(__file__).resolve().parent.parent))
+
+from html_sections import parse_html_to_sections  # noqa: E402
+
+
+def _outline(html: str) -> list:
+    return [
+        (s["heading"], s["content"], [(sub["heading"], sub["content"]) for sub in s["subsections"]])
+        for s in parse_html_to_sections(html)
+    ]
+
+
+class TestHtmlSections:
+    """Heading detection follows HTML tokenisation rules."""
+
+    def test_nested_heading_is_heading_text(self):
+        """An <h3> inside a closed <h2> belongs to the <h2> text."""
+        assert _outline("<h2>A<h3>x</h3></h2><p>body</p><h3>S</h3><p>s</p>") == [
+            ("Ax", "<p>body</p>", [("S", "<p>s</p>")])
+        ]
+        print("✓ Nested <h3> kept in the <h2> heading")
+
+    def test_gt_inside_attribute(self):
+        """A quoted attribute value may contain '>'."""
+        sections = parse_html_to_sections('<h2 data-x="a>b" id="one">Title</h2><p>b</p>')
+        assert [(s["heading"], s["anchor"], s["content"]) for s in sections] == [("Title", "one", "<p>b</p>")]
+        print("✓ '>' in attribute value does not end the tag")
+
+    def test_comment_and_script_are_not_headings(self):
+        """<h2> inside a comment or a <script> body stays content."""
+        html = "<h2>Real</h2><p>a</p><!-- <h2>Fake</h2> --><script>var s = '<h2>Fake</h2>';</script><p>b</p>"
+        assert _outline(html) == [
+            ("Real", "<p>a</p><!-- <h2>Fake</h2> --><script>var s = '<h2>Fake</h2>';</script><p>b</p>", [])
+        ]
+        assert len(parse_html_to_sections("<h2>A</h2><p>a</p><!-- <h2>B</h2>")) == 1
+        print("✓ Comments and script bodies skipped")
+
+    def test_unclosed_heading_stays_content(self):
+        """An unclosed heading is body text; a subsection completed inside it is kept."""
+        html = "<h2>Intro</h2><p>i</p><h2>Open <h3>Sub</h3><p>t</p><h2>Next</h2><p>n</p>"
+        assert _outline(html) == [
+            ("Intro", "<p>i</p><h2>Open", [("Sub", "<p>t</p>")]),
+            ("Next", "<p>n</p>", []),
+        ]
+        print("✓ Unclosed <h2> left as content")
+
+    def test_case_insensitive_tags(self):
+        """Upper-case tags and unquoted ids are recognised."""
+        sections = parse_html_to_sections("<H2 ID=up>Up</H2><P>x</P><H3>s</H3>y")
+        assert sections[0]["anchor"] == "up"
+        assert sections[0]["subsections"][0]["content"] == "y"
+        print("✓ Upper-case headings parsed")
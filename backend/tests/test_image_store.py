@@ -0,0 +1,113 @@
+"""
+Test Image Blob Store:
+- Library and article image lists carry a url instead of base64 data
+- GET /api/images/{id}/raw serves the binary with an immutable cache and ETag/304
+- GET /api/images/{id} still returns the base64 payload
+- POST /api/admin/images/migrate runs as a job and a repeat run finds nothing to move
+"""
+import pytest
+import requests
+import os
+import time
+import uuid
+
+BASE_URL = os.environ.get('REACT_APP_BACKEND_URL', '').rstrip('/')
+
+# Test credentials
+ADMIN_EMAIL = "monika.gawkowska@kurdynowski.pl"
+ADMIN_PASSWORD = "MonZuz8180!"
+
+
+@pytest.fixture(scope="module")
+def auth_headers():
+    """Headers with auth token for admin user."""
+    response = requests.post(f"{BASE_URL}/api/auth/login", json={
+        "email": ADMIN_EMAIL,
+        "password": ADMIN_PASSWORD
+    })
+    if response.status_code != 200:
+        pytest.skip(f"Authentication failed - status {response.status_code}")
+    return {"Authorization": f"Bearer {response.json().get('token')}"}
+
+
+def _migrate(headers, **options):
+    """Start a migration and poll it until it completes or fails."""
+    response = requests.post(f"{BASE_URL}/api/admin/images/migrate", json=options, headers=headers)
+    assert response.status_code == 200, response.text
+    job_id = response.json()["job_id"]
+    deadline = time.time() + 300
+    while time.time() < deadline:
+        data = requests.get(f"{BASE_URL}/api/admin/images/migrate/status/{job_id}", headers=headers).json()
+        if data["status"] in ("completed", "failed"):
+            assert data["status"] == "completed", f"Migration failed: {data.get('error')}"
+            return data["result"]
+        time.sleep(1)
+    pytest.fail("Image migration did not finish in time")
+
+
+@pytest.fixture(scope="module")
+def library_image(auth_headers):
+    """First image in the library."""
+    response = requests.get(f"{BASE_URL}/api/library/images", headers=auth_headers)
+    assert response.status_code == 200
+    images = response.json()["images"]
+    if not images:
+        pytest.skip("No images in library")
+    return images[0]
+
+
+class TestImageStore:
+    """Image binaries served from the blob store."""
+
+    def test_migration_requires_auth(self):
+        """POST /api/admin/images/migrate without token returns 401."""
+        response = requests.post(f"{BASE_URL}/api/admin/images/migrate", json={})
+        assert response.status_code == 401
+        print("✓ Image migration requires authentication (401)")
+
+    def test_migrate_is_idempotent(self, auth_headers):
+        """After one migration a second one has nothing left to scan."""
+        first = _migrate(auth_headers, batch_size=10)
+        assert first["migrated"] + first["failed"] == first["scanned"]
+
+        again = _migrate(auth_headers, batch_size=10)
+        assert again["migrated"] == 0
+        assert again["scanned"] == first["failed"]
+        print(f"✓ Migrated {first['migrated']} images ({first['deduplicated']} duplicates) "
+              f"in {first['elapsed_seconds']}s")
+
+    def test_library_has_no_data(self, library_image):
+        """Library entries link to the raw endpoint instead of embedding base64."""
+        assert "data" not in library_image
+        assert library_image["url"] == f"/api/images/{library_image['id']}/raw"
+        print("✓ Library list carries image urls only")
+
+    def test_raw_image_cached(self, library_image):
+        """Raw endpoint returns the bytes with an immutable cache; ETag revalidates to 304."""
+        response = requests.get(f"{BASE_URL}{library_image['url']}")
+        assert response.status_code == 200
+        assert response.headers["content-type"].startswith("image/")
+        assert "immutable" in response.headers["cache-control"]
+        etag = response.headers.get("ETag")
+        if not etag:
+            pytest.skip("Image not migrated (legacy document)")
+
+        cached = requests.get(f"{BASE_URL}{library_image['url']}", headers={"If-None-Match": etag})
+        assert cached.status_code == 304
+        print(f"✓ Raw image {len(response.content)} B, revalidated with {etag[:12]}...")
+
+    def test_single_image_keeps_base64(self, library_image):
+        """GET /api/images/{id} still returns the payload as base64."""
+        response = requests.get(f"{BASE_URL}/api/images/{library_image['id']}")
+        assert response.status_code == 200
+        data = response.json()
+        assert data["data"]
+        raw = requests.get(f"{BASE_URL}{data['url']}")
+        assert len(raw.content) == len(data["data"]) * 3 // 4 - data["data"][-2:].count("=")
+        print("✓ Single image endpoint returns base64 matching the raw bytes")
+
+    def test_raw_unknown_image(self):
+        """Non-existent image returns 404."""
+        response = requests.get(f"{BASE_URL}/api/images/{uuid.uuid4()}/raw")
+        assert response.status_code == 404
+        print("✓ Unknown image returns 404")
@@ -0,0 +1,63 @@
+"""
+Test Polish keyword matching (keyword_matcher, no server needed):
+- Every inflected form of a noun family shares one stem
+- Keyword counts and presence checks find the inflected forms
+"""
+import sys
+from pathlib import Path
+
+import pytest
+
+sys.path.insert(0, str(Path(__file__).resolve().parent.parent))
+
+from keyword_matcher import stem  # noqa: E402
+from seo_scorer import _flexible_keyword_count, _keyword_in_text  # noqa: E402
+
+FAMILIES = {
+    "pracownik": "pracownik pracownika pracownikowi pracownikiem pracowniku pracownicy pracowników "
+                 "pracownikom pracownikami pracownikach",
+    "podatnik": "podatnik podatnika podatnikowi podatnikiem podatniku podatnicy podatników podatnikom "
+                "podatnikami podatnikach",
+    "płatnik": "płatnik płatnika płatnikowi płatnikiem płatniku płatnicy płatników płatnikami",
+    "wspólnik": "wspólnik wspólnika wspólnikowi wspólnikiem wspólniku wspólnicy wspólników wspólnikami",
+    "spółka": "spółka spółki spółce spółkę spółką spółek spółkom spółkami spółkach",
+    "składka": "składka składki składce składkę składką składek składkami składkach",
+    "podatek": "podatek podatku podatkiem podatki podatków podatkami podatkach",
+    "faktura": "faktura faktury fakturze fakturę fakturą faktur fakturami fakturach",
+    "koszt": "koszt kosztu kosztem koszty kosztów kosztami kosztach",
+    "zwrot": "zwrot zwrotu zwrotem zwroty zwrotów zwrotami zwrotach",
+    "dochód": "dochód dochodu dochodem dochody dochodów dochodami",
+    "rozliczenie": "rozliczenie rozliczenia rozliczeniu rozliczeniem rozliczeniami rozliczeniach",
+}
+
+
+class TestKeywordMatcher:
+    """Inflection-aware stemming and keyword counting."""
+
+    @pytest.mark.parametrize("lemma", list(FAMILIES))
+    def test_family_shares_stem(self, lemma):
+        """Nominative and oblique forms stem alike."""
+        stems = {form: stem(form) for form in FAMILIES[lemma].split()}
+        assert len(set(stems.values())) == 1, stems
+        print(f"✓ {lemma}: {stem(lemma)}")
+
+    def test_counts_inflected_forms(self):
+        """Each inflected occurrence counts as a keyword hit."""
+        text = ("Pracownik ma urlop. Pracownika chroni kodeks. Pracowników jest wielu. "
+                "Z pracownikiem rozmawiamy. Podatnik płaci. Podatnika dotyczy ulga. "
+                "Podatników jest dużo. Podatnikiem jest spółka.")
+        assert _flexible_keyword_count(text, "pracownik")[0] == 4
+        assert _flexible_keyword_count(text, "podatnik")[0] == 4
+        print("✓ Inflected forms counted")
+
+    def test_presence_in_oblique_case(self):
+        """A keyword in the nominative is found in an oblique form."""
+        assert _keyword_in_text("Rozmowa z pracownikiem", "pracownik")
+        assert _keyword_in_text("Umowa w spółce cywilnej", "spółka cywilna")
+        assert _keyword_in_text("Liczy się przed zwrotem", "zwrot")
+        print("✓ Keyword present in oblique forms")
+
+    def test_short_term_not_inside_word(self):
+        """Short terms match whole words only."""
+        assert _flexible_keyword_count("Kapitał zakładowy spółki", "pit")[0] == 0
+        print("✓ 'pit' does not match 'kapitał'")
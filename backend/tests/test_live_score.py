@@ -0,0 +1,145 @@
+"""
+Test Live SEO Scoring:
+- POST /api/score/live requires a token and scores unsaved html_content without saving
+- Response includes section_hashes; unchanged sections can be sent as content_hash
+- Unknown content_hash returns 409 so the client resends full content
+- `rules` runs a subset of scoring rules; `timings` reports per-rule time
+- Section anchors come from heading id attributes, wherever they appear among the attributes
+"""
+import pytest
+import requests
+import os
+
+BASE_URL = os.environ.get('REACT_APP_BACKEND_URL', '').rstrip('/')
+
+# Test credentials
+ADMIN_EMAIL = "monika.gawkowska@kurdynowski.pl"
+ADMIN_PASSWORD = "MonZuz8180!"
+
+SAMPLE_HTML = (
+    "<h1>Podatek VAT w 2026 roku</h1>"
+    "<h2 id=\"czym-jest-vat\">Czym jest podatek VAT</h2>"
+    "<p>Podatek VAT to podatek od towarów i usług. Stawki podatku VAT zależą od rodzaju sprzedaży.</p>"
+    "<h3 id=\"stawki\">Stawki VAT</h3><p>Podstawowa stawka wynosi 23%. Obniżone stawki to 8% i 5%.</p>"
+    "<h2 id=\"rozliczenie\">Rozliczenie podatku VAT</h2>"
+    "<p>Rozliczenie podatku VAT odbywa się w pliku JPK_V7. Termin to 25. dzień miesiąca.</p>"
+)
+
+
+@pytest.fixture(scope="module")
+def auth_token():
+    """Get authentication token for admin user."""
+    response = requests.post(f"{BASE_URL}/api/auth/login", json={
+        "email": ADMIN_EMAIL,
+        "password": ADMIN_PASSWORD
+    })
+    if response.status_code == 200:
+        return response.json().get("token")
+    pytest.skip(f"Authentication failed - status {response.status_code}")
+
+
+@pytest.fixture(scope="module")
+def auth_headers(auth_token):
+    """Headers with auth token."""
+    return {"Authorization": f"Bearer {auth_token}", "Content-Type": "application/json"}
+
+
+class TestLiveScore:
+    """Stateless scoring of unsaved editor content."""
+
+    def test_live_score_requires_auth(self):
+        """POST /api/score/live without token returns 401."""
+        response = requests.post(f"{BASE_URL}/api/score/live", json={"primary_keyword": "podatek vat"})
+        assert response.status_code == 401
+        print("✓ Live score requires authentication (401)")
+
+    def test_live_score_html_content(self, auth_headers):
+        """Scores html_content and returns the usual breakdown plus section hashes."""
+        response = requests.post(f"{BASE_URL}/api/score/live", json={
+            "primary_keyword": "podatek vat",
+            "secondary_keywords": ["stawki vat"],
+            "html_content": SAMPLE_HTML,
+            "meta_description": "Wszystko o podatku VAT: stawki i rozliczenie."
+        }, headers=auth_headers)
+        assert response.status_code == 200
+        data = response.json()
+        for key in ("total_score", "total_max", "percentage", "breakdown", "recommendations", "word_count"):
+            assert key in data
+        assert len(data["section_hashes"]) == 2
+        assert len(data["section_hashes"][0]["subsections"]) == 1
+        assert "elapsed_ms" in data
+        print(f"✓ Live score {data['percentage']}% in {data['elapsed_ms']} ms")
+
+    def test_live_score_section_hashes(self, auth_headers):
+        """Unchanged sections sent as content_hash give the same score as full content."""
+        full = requests.post(f"{BASE_URL}/api/score/live", json={
+            "primary_keyword": "podatek vat", "html_content": SAMPLE_HTML
+        }, headers=auth_headers).json()
+        sections = [
+            {
+                "heading": f"Sekcja {i}",
+                "anchor": f"sekcja-{i}",
+                "content_hash": h["content_hash"],
+                "subsections": [{"heading": "Pod", "anchor": "pod", "content_hash": sub} for sub in h["subsections"]]
+            }
+            for i, h in enumerate(full["section_hashes"])
+        ]
+        response = requests.post(f"{BASE_URL}/api/score/live", json={
+            "primary_keyword": "podatek vat", "sections": sections, "title": "Podatek VAT w 2026 roku"
+        }, headers=auth_headers)
+        assert response.status_code == 200
+        data = response.json()
+        assert data["word_count"] == full["word_count"]
+        assert data["section_hashes"] == full["section_hashes"]
+        print("✓ Sections referenced by hash are reused")
+
+    def test_live_score_heading_ids(self, auth_headers):
+        """Anchors are read from the id attribute even after other attributes or with nested markup."""
+        response = requests.post(f"{BASE_URL}/api/score/live", json={
+            "primary_keyword": "podatek vat",
+            "html_content": (
+                "<h2 class=\"lead\" id=\"co-to-vat\">Czym jest <em>podatek VAT</em></h2><p>Podatek VAT to podatek.</p>"
+                "<h2 data-level='2' id='terminy'>Terminy</h2><div><p>Podatek VAT rozlicza się co miesiąc.</p></div>"
+                "<h2>Podsumowanie</h2><p>Podatek VAT dotyczy większości firm.</p>"
+            )
+        }, headers=auth_headers)
+        assert response.status_code == 200
+        data = response.json()
+        assert data["keyword_distribution"]["section_anchors"] == ["co-to-vat", "terminy", "podsumowanie"]
+        print("✓ Heading id attributes are used as anchors")
+
+    def test_live_score_unknown_hash(self, auth_headers):
+        """Unknown content_hash returns 409."""
+        response = requests.post(f"{BASE_URL}/api/score/live", json={
+            "primary_keyword": "podatek vat",
+            "sections": [{"heading": "X", "anchor": "x", "content_hash": "0" * 32}]
+        }, headers=auth_headers)
+        assert response.status_code == 409
+        print("✓ Unknown section hash returns 409")
+
+    def test_live_score_rule_subset(self, auth_headers):
+        """Only the requested rules are scored, with per-rule timings."""
+        rules = requests.get(f"{BASE_URL}/api/score/rules").json()["rules"]
+        assert "title" in rules and "meta_description" in rules
+        response = requests.post(f"{BASE_URL}/api/score/live", json={
+            "primary_keyword": "podatek vat",
+            "title": "Podatek VAT w 2026 roku - kompletny przewodnik",
+            "meta_description": "Wszystko o podatku VAT.",
+            "rules": ["title", "meta_description"],
+            "timings": True
+        }, headers=auth_headers)
+        assert response.status_code == 200
+        data = response.json()
+        assert set(data["breakdown"]) == {"title", "meta_description"}
+        assert data["partial"] is True
+        assert data["total_max"] == 25
+        assert set(data["rule_timings_ms"]) == {"title", "meta_description"}
+        print(f"✓ Partial score {data['percentage']}% ({data['rule_timings_ms']})")
+
+    def test_live_score_unknown_rule(self, auth_headers):
+        """Unknown rule name returns 400."""
+        response = requests.post(f"{BASE_URL}/api/score/live", json={
+            "primary_keyword": "podatek vat", "rules": ["no_such_rule"]
+        }, headers=auth_headers)
+        assert response.status_code == 400
+        print("✓ Unknown rule returns 400")
@@ -0,0 +1,51 @@
+"""
+Test Workspace Readability Stats:
+- GET /api/stats/readability requires auth
+- Returns workspace summary, per-article/per-section statistics and outlier paragraphs
+"""
+import pytest
+import requests
+import os
+
+BASE_URL = os.environ.get('REACT_APP_BACKEND_URL', '').rstrip('/')
+
+# Test credentials
+ADMIN_EMAIL = "monika.gawkowska@kurdynowski.pl"
+ADMIN_PASSWORD = "MonZuz8180!"
+
+
+@pytest.fixture(scope="module")
+def auth_headers():
+    """Headers with auth token for admin user."""
+    response = requests.post(f"{BASE_URL}/api/auth/login", json={
+        "email": ADMIN_EMAIL,
+        "password": ADMIN_PASSWORD
+    })
+    if response.status_code != 200:
+        pytest.skip(f"Authentication failed - status {response.status_code}")
+    return {"Authorization": f"Bearer {response.json().get('token')}"}
+
+
+class TestReadabilityStats:
+    """Vectorised readability analytics across the workspace."""
+
+    def test_readability_requires_auth(self):
+        """GET /api/stats/readability without token returns 401."""
+        response = requests.get(f"{BASE_URL}/api/stats/readability")
+        assert response.status_code == 401
+        print("✓ Readability stats require authentication (401)")
+
+    def test_readability_structure(self, auth_headers):
+        """Summary, per-article distributions and outliers are returned."""
+        response = requests.get(f"{BASE_URL}/api/stats/readability", params={"outlier_limit": 5}, headers=auth_headers)
+        assert response.status_code == 200
+        data = response.json()
+        summary = data["summary"]
+        for key in ("articles", "sentences", "words", "avg_sentence_length", "long_word_ratio", "fog_index", "sentence_length"):
+            assert key in summary
+        assert summary["articles"] == len(data["articles"])
+        assert len(data["outliers"]) <= 5
+        if data["articles"]:
+            article = data["articles"][0]
+            assert {"id", "fog_index", "sentence_length", "sections"} <= set(article)
+        print(f"✓ Readability of {summary['articles']} articles, FOG {summary['fog_index']}")
@@ -0,0 +1,92 @@
+"""
+Test Incremental Static Site Build (admin):
+- POST /api/admin/static-site requires admin and returns job_id immediately
+- GET /api/admin/static-site/status/{job_id} reports progress and build stats
+- A second build without changes re-renders nothing
+- A build scoped to one user keeps the pages of other users' articles
+- Non-existent job_id returns 404
+"""
+import pytest
+import requests
+import os
+import time
+import uuid
+
+BASE_URL = os.environ.get('REACT_APP_BACKEND_URL', '').rstrip('/')
+
+# Test credentials
+ADMIN_EMAIL = "monika.gawkowska@kurdynowski.pl"
+ADMIN_PASSWORD = "MonZuz8180!"
+
+
+@pytest.fixture(scope="module")
+def auth_headers():
+    """Headers with auth token for admin user."""
+    response = requests.post(f"{BASE_URL}/api/auth/login", json={
+        "email": ADMIN_EMAIL,
+        "password": ADMIN_PASSWORD
+    })
+    if response.status_code != 200:
+        pytest.skip(f"Authentication failed - status {response.status_code}")
+    return {"Authorization": f"Bearer {response.json().get('token')}"}
+
+
+def _build(headers, **options):
+    """Start a build and poll it until it completes or fails."""
+    response = requests.post(f"{BASE_URL}/api/admin/static-site", json=options, headers=headers)
+    assert response.status_code == 200, response.text
+    job_id = response.json()["job_id"]
+    deadline = time.time() + 180
+    while time.time() < deadline:
+        data = requests.get(f"{BASE_URL}/api/admin/static-site/status/{job_id}", headers=headers).json()
+        if data["status"] in ("completed", "failed"):
+            assert data["status"] == "completed", f"Build failed: {data.get('error')}"
+            return data["result"]
+        time.sleep(1)
+    pytest.fail("Static site build did not finish in time")
+
+
+class TestStaticSite:
+    """Admin static site build - async pattern with job_id polling."""
+
+    def test_requires_auth(self):
+        """POST /api/admin/static-site without token returns 401."""
+        response = requests.post(f"{BASE_URL}/api/admin/static-site", json={})
+        assert response.status_code == 401
+        print("✓ Static site build requires authentication (401)")
+
+    def test_full_then_incremental(self, auth_headers):
+        """Full build renders every article; the next build only checks hashes."""
+        full = _build(auth_headers, full=True, base_url="https://example.com")
+        assert full["rendered"] + full["failed"] == full["scanned"]
+        assert full["unchanged"] == 0
+
+        again = _build(auth_headers, base_url="https://example.com")
+        # Other tests may edit articles meanwhile; nearly everything must be skipped
+        assert again["rendered"] <= max(2, full["scanned"] // 10)
+        print(f"✓ Full build {full['elapsed_seconds']}s, incremental {again['elapsed_seconds']}s "
+              f"({again['unchanged']} unchanged)")
+
+    def test_scoped_builds_keep_other_users(self, auth_headers):
+        """Building for user A, then for user B, keeps A's pages on the site."""
+        users = requests.get(f"{BASE_URL}/api/admin/users", headers=auth_headers).json()
+        with_articles = [u for u in users if u.get("article_count")]
+        if len(with_articles) < 2:
+            pytest.skip("Need two users with articles")
+        user_a, user_b = with_articles[:2]
+
+        first = _build(auth_headers, user_id=user_a["id"])
+        second = _build(auth_headers, user_id=user_b["id"])
+        assert second["removed"] == 0
+        assert second["pages"] >= first["scanned"] + second["scanned"] - first["failed"] - second["failed"]
+        # A's pages are still on disk and in the manifest, so nothing needs re-rendering
+        again = _build(auth_headers, user_id=user_a["id"])
+        assert again["removed"] == 0
+        assert again["rendered"] <= max(2, again["scanned"] // 10)
+        print(f"✓ Scoped builds keep {second['pages']} pages ({user_a['email']}, {user_b['email']})")
+
+    def test_status_unknown_job(self, auth_headers):
+        """Non-existent job_id returns 404."""
+        response = requests.get(f"{BASE_URL}/api/admin/static-site/status/{uuid.uuid4()}", headers=auth_headers)
+        assert response.status_code == 404
+        print("✓ Unknown static site job returns 404")
@@ -0,0 +1,77 @@
+"""
+Test Page-Speed HTML Export (format "html_optimized"):
+- POST export returns the page together with its byte-size budget report
+- GET download carries the report in X-Export-Budget
+- The page loads no web fonts and inlines a single minified style block
+"""
+import pytest
+import requests
+import os
+
+BASE_URL = os.environ.get('REACT_APP_BACKEND_URL', '').rstrip('/')
+
+# Test credentials
+ADMIN_EMAIL = "monika.gawkowska@kurdynowski.pl"
+ADMIN_PASSWORD = "MonZuz8180!"
+
+
+@pytest.fixture(scope="module")
+def auth_headers():
+    """Headers with auth token for admin user."""
+    response = requests.post(f"{BASE_URL}/api/auth/login", json={
+        "email": ADMIN_EMAIL,
+        "password": ADMIN_PASSWORD
+    })
+    if response.status_code != 200:
+        pytest.skip(f"Authentication failed - status {response.status_code}")
+    return {"Authorization": f"Bearer {response.json().get('token')}"}
+
+
+@pytest.fixture(scope="module")
+def article_id(auth_headers):
+    """First article with sections."""
+    response = requests.get(f"{BASE_URL}/api/articles", headers=auth_headers)
+    assert response.status_code == 200
+    candidates = [a for a in response.json() if a.get("sections")]
+    if not candidates:
+        pytest.skip("No article with sections")
+    return candidates[0]["id"]
+
+
+class TestWebExport:
+    """Optimised HTML export with a byte budget."""
+
+    def test_post_reports_budget(self, auth_headers, article_id):
+        """POST export returns content and a budget report that matches it."""
+        response = requests.post(f"{BASE_URL}/api/articles/{article_id}/export", json={"format": "html_optimized"},
+                                 headers=auth_headers)
+        assert response.status_code == 200
+        data = response.json()
+        report = data["budget"]
+        assert report["bytes"]["total"] == len(data["content"].encode("utf-8"))
+        assert report["within_budget"] == (not report["over_budget"])
+        assert set(report["budget"]) == {"html", "css", "images"}
+
+        html = data["content"]
+        assert "fonts.googleapis.com" not in html
+        assert html.count("<style>") == 1
+        assert "\n    <" not in html.split("<pre")[0]
+        print(f"✓ Optimised HTML {report['bytes']['total']} B, gzip {report['bytes']['html_gzip']} B")
+
+    def test_download_header(self, auth_headers, article_id):
+        """GET download has the X-Export-Budget header and the same body as POST."""
+        response = requests.get(f"{BASE_URL}/api/articles/{article_id}/export/html_optimized", headers=auth_headers)
+        assert response.status_code == 200
+        assert response.headers["content-type"] == "text/html; charset=utf-8"
+        header = response.headers.get("X-Export-Budget", "")
+        fields = dict(part.strip().split("=") for part in header.split(";"))
+        assert int(fields["total"]) == len(response.content)
+        assert "over" in fields
+        print(f"✓ X-Export-Budget: {header}")
+
+    def test_images_have_hints(self, auth_headers, article_id):
+        """Every image in the page is async-decoded."""
+        html = requests.get(f"{BASE_URL}/api/articles/{article_id}/export/html_optimized", headers=auth_headers).text
+        images = html.split("<img")[1:]
+        assert all('decoding="async"' in img.split(">")[0] for img in images)
+        print(f"✓ {len(images)} images with loading hints")
@@ -0,0 +1,71 @@
+"""
+Test Workspace Export (GET /api/export/workspace):
+- Streams a valid ZIP with one entry per article and requested format
+- JSON entries contain the article without the derived representation
+- Unknown formats return 400, authentication is required
+"""
+import io
+import json
+import zipfile
+
+import pytest
+import requests
+import os
+
+BASE_URL = os.environ.get('REACT_APP_BACKEND_URL', '').rstrip('/')
+
+# Test credentials
+ADMIN_EMAIL = "monika.gawkowska@kurdynowski.pl"
+ADMIN_PASSWORD = "MonZuz8180!"
+
+
+@pytest.fixture(scope="module")
+def auth_headers():
+    """Headers with auth token for admin user."""
+    response = requests.post(f"{BASE_URL}/api/auth/login", json={
+        "email": ADMIN_EMAIL,
+        "password": ADMIN_PASSWORD
+    })
+    if response.status_code != 200:
+        pytest.skip(f"Authentication failed - status {response.status_code}")
+    return {"Authorization": f"Bearer {response.json().get('token')}"}
+
+
+class TestWorkspaceExport:
+    """Bulk export of all articles as a streamed ZIP."""
+
+    def test_requires_auth(self):
+        """Export without token returns 401."""
+        response = requests.get(f"{BASE_URL}/api/export/workspace")
+        assert response.status_code == 401
+        print("✓ Workspace export requires authentication")
+
+    def test_unknown_format(self, auth_headers):
+        """Unknown format returns 400."""
+        response = requests.get(f"{BASE_URL}/api/export/workspace", params={"formats": "html,docx"}, headers=auth_headers)
+        assert response.status_code == 400
+        print("✓ Unknown workspace export format returns 400")
+
+    def test_zip_contents(self, auth_headers):
+        """Every article appears once per requested format."""
+        articles = requests.get(f"{BASE_URL}/api/articles", headers=auth_headers).json()
+        response = requests.get(f"{BASE_URL}/api/export/workspace", params={"formats": "html,json"},
+                                headers=auth_headers, stream=True)
+        assert response.status_code == 200
+        assert response.headers["content-type"] == "application/zip"
+        data = b"".join(response.iter_content(chunk_size=65536))
+
+        archive = zipfile.ZipFile(io.BytesIO(data))
+        assert archive.testzip() is None
+        names = archive.namelist()
+        html_files = [n for n in names if n.startswith("html/")]
+        json_files = [n for n in names if n.startswith("json/")]
+        failed = json.loads(archive.read("errors.json")) if "errors.json" in names else []
+        # The article list is capped at 100; the export covers the whole workspace
+        assert len(json_files) + len(failed) >= len(articles)
+        assert len(html_files) == len(json_files)
+
+        if json_files:
+            exported = json.loads(archive.read(json_files[0]))
+            assert "id" in exported and "derived" not in exported
+        print(f"✓ Workspace ZIP with {len(json_files)} articles")
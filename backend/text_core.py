@@ -0,0 +1,92 @@
+"""
+Shared Polish text processing.
+Precompiled patterns and the small primitives that the scorer, the parsers and the
+export/publishing services all need: tag stripping, diacritic folding, slugs,
+word tokens, sentence splitting and stop words.
+"""
+
+import re
+from functools import lru_cache
+from typing import List
+
+TAG_RE = re.compile(r'<[^>]+>')
+WORD_RE = re.compile(r'\w+')
+WHITESPACE_RE = re.compile(r'\s+')
+# Crude sentence breaks used by the SEO scorer (runs of terminators)
+SENTENCE_BREAK_RE = re.compile(r'[.!?]+')
+# Sentence end: terminator(s) followed by whitespace and an uppercase letter, digit or quote
+SENTENCE_END_RE = re.compile(r'(?<=[.!?…])\s+(?=[A-ZĄĆĘŁŃÓŚŹŻ0-9„"(])')
+
+_SLUG_DROP_RE = re.compile(r'[^a-z0-9\s-]')
+_SLUG_DASH_RE = re.compile(r'[\s-]+')
+
+# Polish stop words to ignore in keyword matching
+POLISH_STOP_WORDS = {
+    "w", "z", "i", "do", "na", "nie", "się", "o", "od", "za", "po", "ze",
+    "dla", "jak", "co", "to", "jest", "są", "lub", "oraz", "a", "czy",
+    "przy", "przez", "nad", "pod", "przed", "między", "bez", "ku",
+    "roku", "r", "r.", "nr", "poz", "art", "ust", "pkt"
+}
+
+# Abbreviations that end with a dot but do not end a sentence
+POLISH_ABBREVIATIONS = (
+    "np", "tzn", "tj", "m.in", "itd", "itp", "ok", "art", "ust", "pkt", "poz", "nr", "r", "zł", "gr",
+    "godz", "min", "tys", "mln", "mld", "ul", "al", "dr", "prof", "inż", "mgr", "pn", "ds", "wg", "zob", "por",
+)
+_ABBREVIATIONS = frozenset(POLISH_ABBREVIATIONS)
+
+# Lowercase Polish (and common Latin-1) diacritics to their ASCII base letter
+_DIACRITIC_FOLD = str.maketrans({
+    **dict.fromkeys("ąàáâãäå", "a"),
+    **dict.fromkeys("ćçč", "c"),
+    **dict.fromkeys("ęèéêë", "e"),
+    "ł": "l",
+    **dict.fromkeys("ńñ", "n"),
+    **dict.fromkeys("óòôõö", "o"),
+    **dict.fromkeys("śšş", "s"),
+    **dict.fromkeys("żźž", "z"),
+})
+
+
+def strip_tags(html: str, replacement: str = "") -> str:
+    """Remove HTML tags (not entities); `replacement` is put where each tag was."""
+    if not html:
+        return ""
+    if "<" not in html:
+        return html
+    return TAG_RE.sub(replacement, html)
+
+
+def plain_text(html: str) -> str:
+    """Strip tags and collapse whitespace."""
+    return " ".join(strip_tags(html, " ").split())
+
+
+def fold_diacritics(text: str) -> str:
+    """Lowercase text with Polish diacritics folded to ASCII (ą -> a, ł -> l, ż -> z)."""
+    return text.lower().translate(_DIACRITIC_FOLD)
+
+
+def slugify(text: str) -> str:
+    """Create a URL-friendly slug from text."""
+    text = fold_diacritics(text.strip())
+    text = _SLUG_DROP_RE.sub('', text)
+    text = _SLUG_DASH_RE.sub('-', text)
+    return text[:80].strip('-')
+
+
+@lru_cache(maxsize=4096)
+def tokenize(text: str) -> tuple:
+    """Lowercase word tokens of a text (cached: titles, keywords and meta texts repeat a lot)."""
+    return tuple(WORD_RE.findall(text.lower()))
+
+
+def split_sentences(text: str) -> List[str]:
+    """Polish sentence tokenisation that keeps common abbreviations (np., art., m.in.) intact."""
+    sentences = []
+    for piece in SENTENCE_END_RE.split(text):
+        if sentences and sentences[-1].rsplit(None, 1)[-1].rstrip(".").lower() in _ABBREVIATIONS:
+            sentences[-1] += " " + piece
+        else:
+            sentences.append(piece)
+    return [s.strip() for s in sentences if s.strip()]
@@ -0,0 +1,225 @@
+"""
+Web-performance HTML export ("html_optimized").
+The standalone page of generate_full_html rebuilt for page speed:
+- only the CSS rules for elements and classes that occur in the article are inlined, minified
+- system font stacks instead of the Google Fonts stylesheet (no render-blocking request)
+- images get decoding="async", width/height (read from embedded data URIs) and
+  loading="lazy"; the first image stays eager with fetchpriority="high" and, when it is
+  a URL, a preload hint
+- whitespace between block tags is dropped and other runs collapsed (not inside pre/textarea)
+web_export_report() measures a rendered page against the byte budgets.
+"""
+
+import base64
+import binascii
+import gzip
+import os
+import re
+import struct
+from typing import Optional, Tuple
+
+from html_templates import render_template
+from image_info import image_size
+
+# Byte budgets of the optimised page; "html" is the document without inline image data
+WEB_EXPORT_BUDGETS = {
+    "html": int(os.environ.get("WEB_EXPORT_HTML_BUDGET", 100_000)),
+    "css": int(os.environ.get("WEB_EXPORT_CSS_BUDGET", 14_000)),
+    "images": int(os.environ.get("WEB_EXPORT_IMAGES_BUDGET", 500_000)),
+}
+
+_SANS = "system-ui,-apple-system,'Segoe UI',Roboto,'Helvetica Neue',Arial,sans-serif"
+_SERIF = "Georgia,'Times New Roman',serif"
+
+# (tags/classes that need the rule, rule); None = always included
+_CSS_RULES = (
+    (None, "*{box-sizing:border-box;margin:0;padding:0}"),
+    (None, f"body{{font-family:{_SANS};line-height:1.8;max-width:800px;margin:0 auto;padding:40px 24px;"
+           "color:hsl(222,47%,20%);background:#fff}"),
+    (("h1",), f"h1{{font-family:{_SERIF};color:hsl(222,47%,11%);font-size:2.2em;font-weight:400;"
+              "margin-bottom:.6em;line-height:1.2}"),
+    (("h2",), f"h2{{font-family:{_SERIF};color:#04389E;font-size:1.6em;font-weight:400;margin-top:2em;"
+              "margin-bottom:.6em;padding-bottom:8px;border-bottom:2px solid hsl(34,90%,88%)}"),
+    (("h3",), f"h3{{font-family:{_SERIF};color:hsl(220,95%,28%);font-size:1.2em;font-weight:400;"
+              "margin-top:1.5em;margin-bottom:.5em}"),
+    (("p",), "p{margin-bottom:1em}"),
+    (("ul", "ol"), "ul,ol{margin-bottom:1em;padding-left:24px}"),
+    (("li",), "li{margin-bottom:4px}"),
+    (("strong",), "strong{color:hsl(222,47%,11%)}"),
+    (("a",), "a{color:#04389E;text-decoration:underline;text-underline-offset:3px}"),
+    (("toc",), ".toc{background:hsl(35,35%,97%);padding:20px 28px;border-radius:12px;margin:24px 0;"
+               "border:1px solid hsl(214,18%,88%)}.toc h2{margin-top:0;border:none;font-size:1.2em;padding-bottom:0}"
+               ".toc ol{padding-left:20px}.toc a{text-decoration:none}.toc a:hover{text-decoration:underline}"),
+    (("faq",), ".faq{background:hsl(35,35%,97%);padding:24px;border-radius:12px;margin-top:2em;"
+               "border:1px solid hsl(214,18%,88%)}.faq h3{color:#04389E}"),
+    (("sources",), ".sources{margin-top:2em;padding-top:1.5em;border-top:2px solid hsl(34,90%,88%)}"),
+    (("table",), "table{width:100%;border-collapse:collapse;margin:20px 0;border-radius:8px;overflow:hidden;"
+                 "border:1px solid hsl(214,18%,88%)}"),
+    (("thead",), "thead{background:hsl(220,95%,96%)}"),
+    (("th",), "th{padding:10px 14px;text-align:left;font-weight:600;font-size:13px;color:#04389E;"
+              "border-bottom:2px solid hsl(214,18%,85%)}"),
+    (("td",), "td{padding:10px 14px;border-bottom:1px solid hsl(214,18%,93%)}tr:last-child td{border-bottom:none}"),
+    (("callout",), ".callout{border-radius:10px;padding:16px 18px;margin:16px 0;border-left:4px solid;line-height:1.6}"),
+    (("callout-tip",), ".callout-tip{background:hsl(158,55%,95%);border-left-color:hsl(158,55%,34%)}"),
+    (("callout-warning",), ".callout-warning{background:hsl(34,90%,95%);border-left-color:#F28C28}"),
+    (("callout-info",), ".callout-info{background:hsl(220,95%,96%);border-left-color:#04389E}"),
+    (("blockquote",), "blockquote{border-left:4px solid #04389E;padding:12px 16px;margin:16px 0;"
+                      "background:hsl(220,95%,98%);font-style:italic}"),
+    (("img",), "img{max-width:100%;height:auto;border-radius:8px;margin:16px 0}"),
+    (None, "@media print{body{padding:0}.toc{break-after:page}}"),
+)
+
+_TAG_NAME_RE = re.compile(r'<([a-zA-Z][a-zA-Z0-9]*)')
+_CLASS_RE = re.compile(r'\sclass="([^"]*)"')
+
+
+def critical_css(body: str) -> str:
+    """The rules of _CSS_RULES whose tags or classes occur in `body`, concatenated."""
+    used = {tag.lower() for tag in _TAG_NAME_RE.findall(body)}
+    for classes in _CLASS_RE.findall(body):
+        used.update(classes.split())
+    return "".join(rule for keys, rule in _CSS_RULES if keys is None or used.intersection(keys))
+
+
+# ---------------------------------------------------------------------------
+# Images
+# ---------------------------------------------------------------------------
+
+_IMG_RE = re.compile(r'<img\b([^>]*?)\s*/?>', re.IGNORECASE)
+_ATTR_RE = re.compile(r'([a-zA-Z-]+)\s*=\s*"([^"]*)"')
+_DATA_URI_RE = re.compile(r'^data:image/[a-zA-Z0-9.+-]+;base64,', re.IGNORECASE)
+# Enough of the base64 payload for the header of PNG, GIF, WebP and most JPEGs (EXIF before SOF)
+_HEADER_CHARS = 262_144
+
+
+def _data_uri_size(src: str) -> Optional[Tuple[int, int]]:
+    match = _DATA_URI_RE.match(src)
+    if not match:
+        return None
+    payload = src[match.end():match.end() + _HEADER_CHARS]
+    payload = payload[:len(payload) // 4 * 4]
+    try:
+        return image_size(base64.b64decode(payload))
+    except (binascii.Error, struct.error, ValueError):
+        return None
+
+
+def optimize_images(body: str) -> Tuple[str, Optional[str]]:
+    """
+    Add loading/decoding/fetchpriority and width/height to every <img>.
+    Returns (body, src of the first image when it is a URL worth preloading).
+    """
+    first = {"seen": False, "preload": None}
+
+    def rewrite(match) -> str:
+        attrs_text = match.group(1)
+        attrs = {name.lower(): value for name, value in _ATTR_RE.findall(attrs_text)}
+        extra = []
+        if not first["seen"]:
+            first["seen"] = True
+            if "loading" not in attrs:
+                extra.append('fetchpriority="high"')
+            if attrs.get("src", "").startswith(("http://", "https://")):
+                first["preload"] = attrs["src"]
+        elif "loading" not in attrs:
+            extra.append('loading="lazy"')
+        if "decoding" not in attrs:
+            extra.append('decoding="async"')
+        if "width" not in attrs and "height" not in attrs:
+            size = _data_uri_size(attrs.get("src", ""))
+            if size:
+                extra.append(f'width="{size[0]}" height="{size[1]}"')
+        return f'<img{attrs_text} {" ".join(extra)}>' if extra else f'<img{attrs_text}>'
+
+    body = _IMG_RE.sub(rewrite, body)
+    return body, first["preload"]
+
+
+# ---------------------------------------------------------------------------
+# Minification
+# ---------------------------------------------------------------------------
+
+_BLOCK_TAGS = (
+    "article|section|nav|header|footer|main|aside|div|p|h[1-6]|ul|ol|li|dl|dt|dd|table|thead|tbody|"
+    "tfoot|tr|td|th|caption|figure|figcaption|blockquote|hr|br|html|head|body|meta|title|link|style"
+)
+_SPACE_AFTER_BLOCK_RE = re.compile(r'(</?(?:' + _BLOCK_TAGS + r')\b[^>]*>)\s+', re.IGNORECASE)
+_SPACE_BEFORE_BLOCK_RE = re.compile(r'\s+(</?(?:' + _BLOCK_TAGS + r')\b)', re.IGNORECASE)
+_COMMENT_RE = re.compile(r'<!--(?!\[if).*?-->', re.DOTALL)
+_PRESERVE_RE = re.compile(r'(<(pre|textarea)\b.*?</\2>)', re.IGNORECASE | re.DOTALL)
+_WHITESPACE_RE = re.compile(r'\s+')
+
+
+def minify_html(html: str) -> str:
+    """Whitespace-safe minification: collapse runs, drop them around block tags, remove comments."""
+    parts = _PRESERVE_RE.split(html)
+    out = []
+    # split() with two groups yields: text, whole match, tag name, text, ...
+    for i in range(0, len(parts), 3):
+        text = _COMMENT_RE.sub("", parts[i])
+        text = _WHITESPACE_RE.sub(" ", text)
+        text = _SPACE_AFTER_BLOCK_RE.sub(r"\1", text)
+        text = _SPACE_BEFORE_BLOCK_RE.sub(r"\1", text)
+        out.append(text)
+        if i + 1 < len(parts):
+            out.append(parts[i + 1])
+    return "".join(out).strip()
+
+
+# ---------------------------------------------------------------------------
+# Page and report
+# ---------------------------------------------------------------------------
+
+def generate_optimized_html(article: dict) -> str:
+    """Standalone HTML page of the article optimised for page speed (see module docstring)."""
+    title = article.get("title", "")
+    body = render_template(
+        "article_body.html",
+        title=title,
+        toc=article.get("toc", []),
+        sections=article.get("sections", []),
+        faqs=article.get("faq", []),
+        sources=article.get("sources", []),
+    )
+    body, preload = optimize_images(minify_html(body))
+    hints = f'<link rel="preload" as="image" href="{preload}" fetchpriority="high">' if preload else ""
+    return render_template(
+        "article_web.html",
+        meta_title=article.get("meta_title", title),
+        meta_desc=article.get("meta_description", ""),
+        hints=hints,
+        css=critical_css(body),
+        body=body,
+    )
+
+
+_STYLE_BLOCK_RE = re.compile(rb'<style>(.*?)</style>', re.DOTALL)
+_DATA_URI_PAYLOAD_RE = re.compile(rb'data:image/[a-zA-Z0-9.+-]+;base64,[A-Za-z0-9+/=]+')
+
+
+def web_export_report(content: bytes) -> dict:
+    """Byte sizes of a rendered page against WEB_EXPORT_BUDGETS."""
+    images = sum(len(m) for m in _DATA_URI_PAYLOAD_RE.findall(content))
+    document = _DATA_URI_PAYLOAD_RE.sub(b"", content)
+    sizes = {
+        "html": len(document),
+        "css": sum(len(m) for m in _STYLE_BLOCK_RE.findall(content)),
+        "images": images,
+    }
+    over = [name for name, limit in WEB_EXPORT_BUDGETS.items() if sizes[name] > limit]
+    return {
+        "bytes": {**sizes, "total": len(content), "html_gzip": len(gzip.compress(document, compresslevel=6, mtime=0))},
+        "budget": dict(WEB_EXPORT_BUDGETS),
+        "over_budget": over,
+        "within_budget": not over,
+    }
+
+
+def format_report_header(report: dict) -> str:
+    """Compact report for the X-Export-Budget response header."""
+    sizes = report["bytes"]
+    return (
+        f"total={sizes['total']}; html={sizes['html']}; html_gzip={sizes['html_gzip']}; "
+        f"css={sizes['css']}; images={sizes['images']}; "
+        f"over={','.join(report['over_budget']) or 'none'}"
+    )
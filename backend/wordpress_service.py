@@ -9,6 +9,10 @@ import httpx
 import base64
 import logging
 import re
+from functools import lru_cache
+
+from cpu_executor import run_cpu
+from text_core import strip_tags
 
 logger = logging.getLogger(__name__)
 
@@ -99,114 +103,68 @@ STYLE_CALLOUT_WARNING = STYLE_CALLOUT_BASE + ' background: hsl(34, 90%, 95%); bo
 STYLE_CALLOUT_INFO = STYLE_CALLOUT_BASE + ' background: hsl(220, 95%, 96%); border-left-color: #04389E; color: hsl(220, 50%, 20%);'
 
 
+# Inline style per tag name for content fragments (divs are styled only as callouts)
+_TAG_STYLES = {
+    "h2": STYLE_H2,
+    "h3": STYLE_H3,
+    "p": STYLE_P,
+    "ul": STYLE_UL,
+    "ol": STYLE_OL,
+    "li": STYLE_LI,
+    "strong": STYLE_STRONG,
+    "a": STYLE_A,
+    "blockquote": STYLE_BLOCKQUOTE,
+    "hr": STYLE_HR,
+    "img": STYLE_IMG,
+    "table": STYLE_TABLE,
+    "th": STYLE_TH,
+    "td": STYLE_TD,
+}
+
+# Callout class -> style; the first listed class wins when a div has several
+_CALLOUT_STYLES = (
+    ("callout-tip", STYLE_CALLOUT_TIP),
+    ("callout-warning", STYLE_CALLOUT_WARNING),
+    ("callout-info", STYLE_CALLOUT_INFO),
+)
+
+# Opening tags of the styled elements only; the name must end at whitespace, "/" or ">"
+# so <pre>, <abbr>, <thead> or <link> are left alone
+_STYLED_TAG_RE = re.compile(
+    r'<(' + '|'.join(sorted(_TAG_STYLES, key=len, reverse=True)) + r'|div)(?=[\s/>])([^>]*)>',
+    re.IGNORECASE
+)
+_CLASS_ATTR_RE = re.compile(r'class="([^"]*)"')
+
+
+def _style_tag(match) -> str:
+    tag, attrs = match.group(1), match.group(2)
+    style = _TAG_STYLES.get(tag.lower())
+    if style is None:
+        class_attr = _CLASS_ATTR_RE.search(attrs)
+        if not class_attr:
+            return match.group(0)
+        style = next((s for name, s in _CALLOUT_STYLES if name in class_attr.group(1)), None)
+        if style is None:
+            return match.group(0)
+    if attrs.endswith("/"):
+        return f'<{tag}{attrs[:-1].rstrip()} style="{style}" />'
+    return f'<{tag}{attrs} style="{style}">'
+
+
+@lru_cache(maxsize=2048)
 def _apply_inline_styles(html_fragment: str) -> str:
-    """Apply inline styles to HTML elements within a content fragment."""
-    # h2 (skip ones already inside styled containers)
-    html_fragment = re.sub(
-        r'<h2([^>]*)>',
-        lambda m: f'<h2{m.group(1)} style="{STYLE_H2}">',
-        html_fragment
-    )
-    # h3
-    html_fragment = re.sub(
-        r'<h3([^>]*)>',
-        lambda m: f'<h3{m.group(1)} style="{STYLE_H3}">',
-        html_fragment
-    )
-    # p
-    html_fragment = re.sub(
-        r'<p([^>]*)>',
-        lambda m: f'<p{m.group(1)} style="{STYLE_P}">',
-        html_fragment
-    )
-    # ul
-    html_fragment = re.sub(
-        r'<ul([^>]*)>',
-        lambda m: f'<ul{m.group(1)} style="{STYLE_UL}">',
-        html_fragment
-    )
-    # ol
-    html_fragment = re.sub(
-        r'<ol([^>]*)>',
-        lambda m: f'<ol{m.group(1)} style="{STYLE_OL}">',
-        html_fragment
-    )
-    # li
-    html_fragment = re.sub(
-        r'<li([^>]*)>',
-        lambda m: f'<li{m.group(1)} style="{STYLE_LI}">',
-        html_fragment
-    )
-    # strong
-    html_fragment = re.sub(
-        r'<strong([^>]*)>',
-        lambda m: f'<strong{m.group(1)} style="{STYLE_STRONG}">',
-        html_fragment
-    )
-    # a
-    html_fragment = re.sub(
-        r'<a([^>]*)>',
-        lambda m: f'<a{m.group(1)} style="{STYLE_A}">',
-        html_fragment
-    )
-    # blockquote
-    html_fragment = re.sub(
-        r'<blockquote([^>]*)>',
-        lambda m: f'<blockquote{m.group(1)} style="{STYLE_BLOCKQUOTE}">',
-        html_fragment
-    )
-    # hr
-    html_fragment = re.sub(
-        r'<hr([^>]*)(/?)>',
-        lambda m: f'<hr{m.group(1)} style="{STYLE_HR}"{m.group(2)}>',
-        html_fragment
-    )
-    # img
-    html_fragment = re.sub(
-        r'<img([^>]*)>',
-        lambda m: f'<img{m.group(1)} style="{STYLE_IMG}">',
-        html_fragment
-    )
-    # table
-    html_fragment = re.sub(
-        r'<table([^>]*)>',
-        lambda m: f'<table{m.group(1)} style="{STYLE_TABLE}">',
-        html_fragment
-    )
-    # th
-    html_fragment = re.sub(
-        r'<th([^>]*)>',
-        lambda m: f'<th{m.group(1)} style="{STYLE_TH}">',
-        html_fragment
-    )
-    # td
-    html_fragment = re.sub(
-        r'<td([^>]*)>',
-        lambda m: f'<td{m.group(1)} style="{STYLE_TD}">',
-        html_fragment
-    )
-    # callout divs
-    html_fragment = re.sub(
-        r'<div([^>]*class="[^"]*callout-tip[^"]*"[^>]*)>',
-        lambda m: f'<div{m.group(1)} style="{STYLE_CALLOUT_TIP}">',
-        html_fragment
-    )
-    html_fragment = re.sub(
-        r'<div([^>]*class="[^"]*callout-warning[^"]*"[^>]*)>',
-        lambda m: f'<div{m.group(1)} style="{STYLE_CALLOUT_WARNING}">',
-        html_fragment
-    )
-    html_fragment = re.sub(
-        r'<div([^>]*class="[^"]*callout-info[^"]*"[^>]*)>',
-        lambda m: f'<div{m.group(1)} style="{STYLE_CALLOUT_INFO}">',
-        html_fragment
-    )
-    return html_fragment
+    """
+    Apply inline styles to HTML elements within a content fragment.
+    One scan over the opening tags; results are cached per fragment content,
+    so sections that did not change since the last publish/export are not restyled.
+    """
+    return _STYLED_TAG_RE.sub(_style_tag, html_fragment)
 
 
 def strip_html_tags(html: str) -> str:
     """Strip HTML tags for excerpt."""
-    return re.sub(r'<[^>]+>', '', html).strip()
+    return strip_tags(html).strip()
 
 
 def _build_styled_content(article: dict) -> str:
@@ -351,17 +309,21 @@ async def _discover_wp_api_url(client, wp_url: str, extra_headers: dict = None)
     )
 
 
-async def publish_to_wordpress(wp_url: str, wp_user: str, wp_app_password: str, article: dict) -> dict:
-    """Publish an article to WordPress via REST API."""
-    clean_url = _normalize_wp_url(wp_url)
-
-    content_html = _build_styled_content(article)
-
+def _build_post_content(article: dict) -> tuple:
+    """(styled content HTML, excerpt) of a post. Blocking regex work - runs on the CPU executor."""
     excerpt = article.get("meta_description", "")
     if not excerpt:
         sections = article.get("sections", [])
         if sections:
             excerpt = strip_html_tags(sections[0].get("content", ""))[:300]
+    return _build_styled_content(article), excerpt
+
+
+async def publish_to_wordpress(wp_url: str, wp_user: str, wp_app_password: str, article: dict) -> dict:
+    """Publish an article to WordPress via REST API."""
+    clean_url = _normalize_wp_url(wp_url)
+
+    content_html, excerpt = await run_cpu(_build_post_content, article)
 
     post_data = {
         "title": article.get("title", "Bez tytułu"),
@@ -759,13 +721,16 @@ function kurdynowski_ajax_import_article() {
     
     $api_url = rtrim(get_option('kurdynowski_api_url', ''), '/');
     
-    // Get full article with styled export (inline styles for WordPress)
-    $response = wp_remote_post($api_url . '/articles/' . $article_id . '/export', array(
-        'headers' => array(
-            'Authorization' => 'Bearer ' . $token,
-            'Content-Type' => 'application/json'
-        ),
-        'body' => json_encode(array('format' => 'wordpress')),
+    // Get full article with styled export (inline styles for WordPress).
+    // The last download is kept with its ETag; an unchanged article answers 304.
+    $cache_key = 'kurdynowski_export_' . md5($article_id);
+    $cached = get_transient($cache_key);
+    $headers = array('Authorization' => 'Bearer ' . $token);
+    if (is_array($cached) && !empty($cached['etag'])) {
+        $headers['If-None-Match'] = $cached['etag'];
+    }
+    $response = wp_remote_get($api_url . '/articles/' . $article_id . '/export/wordpress', array(
+        'headers' => $headers,
         'timeout' => 30
     ));
     
@@ -773,8 +738,18 @@ function kurdynowski_ajax_import_article() {
         wp_send_json_error($response->get_error_message());
     }
     
-    $export = json_decode(wp_remote_retrieve_body($response), true);
-    $html_content = $export['content'] ?? '';
+    $code = wp_remote_retrieve_response_code($response);
+    if ($code === 304 && is_array($cached)) {
+        $html_content = $cached['content'];
+    } elseif ($code === 200) {
+        $html_content = wp_remote_retrieve_body($response);
+        $etag = wp_remote_retrieve_header($response, 'etag');
+        if ($etag) {
+            set_transient($cache_key, array('etag' => $etag, 'content' => $html_content), DAY_IN_SECONDS);
+        }
+    } else {
+        wp_send_json_error('Blad pobierania eksportu (HTTP ' . $code . ')');
+    }
     
     // Get article metadata
     $meta_response = wp_remote_get($api_url . '/articles/' . $article_id, array(
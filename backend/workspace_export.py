@@ -0,0 +1,142 @@
+"""
+Streaming bulk workspace export.
+Articles are read with a Mongo cursor, rendered off the event loop on the CPU executor
+(through the export cache, so unchanged articles are file reads) and written into
+a ZIP archive whose bytes are handed to the client as soon as each entry is
+complete. At most `window` rendered articles are held in memory at a time, however
+many articles the workspace has.
+"""
+
+import asyncio
+import io
+import json
+import logging
+import zipfile
+from collections import deque
+from datetime import datetime
+from typing import AsyncIterator, Iterable, List, Tuple
+
+from cpu_executor import run_cpu
+from export_cache import EXPORT_FORMATS, export_fingerprint, get_or_render_export
+from text_core import slugify
+
+logger = logging.getLogger(__name__)
+
+WORKSPACE_FORMATS = (*EXPORT_FORMATS, "json")
+DEFAULT_WORKSPACE_FORMATS = ("html", "pdf", "json")
+# Already compressed formats are stored as is
+_STORED_FORMATS = {"pdf"}
+
+
+class _ZipSink(io.RawIOBase):
+    """
+    Non-seekable write target for ZipFile: collects the written bytes until drained.
+    ZipFile detects that it cannot seek and writes data descriptors instead of
+    going back to patch local headers, so every finished entry can be sent at once.
+    """
+
+    def __init__(self):
+        super().__init__()
+        self._chunks = []
+        self._position = 0
+
+    def writable(self) -> bool:
+        return True
+
+    def write(self, data) -> int:
+        self._chunks.append(bytes(data))
+        self._position += len(data)
+        return len(data)
+
+    def tell(self) -> int:
+        return self._position
+
+    def drain(self) -> bytes:
+        data = b"".join(self._chunks)
+        self._chunks = []
+        return data
+
+
+def parse_workspace_formats(value: str) -> List[str]:
+    """Comma-separated format list -> validated, de-duplicated list (ValueError on unknown ones)."""
+    formats = list(dict.fromkeys(f.strip().lower() for f in (value or "").split(",") if f.strip()))
+    unknown = [f for f in formats if f not in WORKSPACE_FORMATS]
+    if unknown:
+        raise ValueError(f"Nieznane formaty: {', '.join(unknown)} (dostepne: {', '.join(WORKSPACE_FORMATS)})")
+    return formats or list(DEFAULT_WORKSPACE_FORMATS)
+
+
+def _json_default(value):
+    return value.isoformat() if isinstance(value, datetime) else str(value)
+
+
+def _render_article_files(article: dict, formats: Iterable[str]) -> List[Tuple[str, bytes]]:
+    """(archive name, content) for every requested format of one article. Blocking - runs on the CPU executor."""
+    article_id = article.get("id", "")
+    base = f"{slugify(article.get('title') or '') or 'artykul'}-{article_id[:8]}"
+    files = []
+    for fmt in formats:
+        if fmt == "json":
+            public = {k: v for k, v in article.items() if k != "derived"}
+            content = json.dumps(public, ensure_ascii=False, indent=2, default=_json_default).encode("utf-8")
+            files.append((f"json/{base}.json", content))
+        else:
+            content, _ = get_or_render_export(article, article_id, fmt, export_fingerprint(article, fmt))
+            files.append((f"{fmt}/{base}.{EXPORT_FORMATS[fmt].extension}", content))
+    return files
+
+
+def _write_entries(archive: zipfile.ZipFile, files: List[Tuple[str, bytes]]):
+    for name, content in files:
+        compression = zipfile.ZIP_STORED if name.endswith(".pdf") else zipfile.ZIP_DEFLATED
+        archive.writestr(name, content, compress_type=compression)
+
+
+async def stream_workspace_zip(cursor, formats: List[str], window: int = 4) -> AsyncIterator[bytes]:
+    """
+    Yield the ZIP archive of every article from `cursor` in `formats`, chunk by chunk.
+    Up to `window` articles render concurrently; entries are written in cursor order.
+    Articles that fail to render are listed in errors.json at the end of the archive.
+    """
+    sink = _ZipSink()
+    archive = zipfile.ZipFile(sink, "w")
+    pending = deque()
+    errors = []
+    count = 0
+
+    async def write_next():
+        nonlocal count
+        article_id, task = pending.popleft()
+        try:
+            files = await task
+        except Exception as e:
+            logger.warning(f"Workspace export: article {article_id} failed: {e}")
+            errors.append({"id": article_id, "error": str(e)})
+            return
+        await run_cpu(_write_entries, archive, files)
+        count += 1
+
+    try:
+        async for article in cursor:
+            task = asyncio.ensure_future(run_cpu(_render_article_files, article, formats))
+            pending.append((article.get("id"), task))
+            if len(pending) >= window:
+                await write_next()
+                chunk = sink.drain()
+                if chunk:
+                    yield chunk
+        while pending:
+            await write_next()
+            chunk = sink.drain()
+            if chunk:
+                yield chunk
+
+        if errors:
+            archive.writestr("errors.json", json.dumps(errors, ensure_ascii=False, indent=2))
+        archive.close()
+        logger.info(f"Workspace export: {count} articles, {len(errors)} failed")
+        yield sink.drain()
+    finally:
+        # Client went away mid-stream: stop the renders that are still queued
+        for _, task in pending:
+            task.cancel()
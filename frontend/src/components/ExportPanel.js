@@ -19,6 +19,8 @@ const ExportPanel = ({ articleId }) => {
   const [loadingFb, setLoadingFb] = useState(false);
   const [loadingGb, setLoadingGb] = useState(false);
   const [loadingHtml, setLoadingHtml] = useState(false);
+  const [loadingFastHtml, setLoadingFastHtml] = useState(false);
+  const [fastHtmlBudget, setFastHtmlBudget] = useState(null);
   const [loadingPdf, setLoadingPdf] = useState(false);
   const [loadingWp, setLoadingWp] = useState(false);
   const [wpResult, setWpResult] = useState(null);
@@ -55,9 +57,9 @@ const ExportPanel = ({ articleId }) => {
   const downloadHtml = async () => {
     setLoadingHtml(true);
     try {
-      const res = await axios.post(`${BACKEND_URL}/api/articles/${articleId}/export`, { format: 'html' });
-      const blob = new Blob([res.data.content], { type: 'text/html' });
-      const url = URL.createObjectURL(blob);
+      // GET with ETag: the browser revalidates and reuses the cached file on 304
+      const res = await axios.get(`${BACKEND_URL}/api/articles/${articleId}/export/html`, { responseType: 'blob' });
+      const url = URL.createObjectURL(res.data);
       const a = document.createElement('a');
       a.href = url;
       a.download = 'article.html';
@@ -71,14 +73,36 @@ const ExportPanel = ({ articleId }) => {
     }
   };
 
+  const downloadFastHtml = async () => {
+    setLoadingFastHtml(true);
+    try {
+      const res = await axios.get(`${BACKEND_URL}/api/articles/${articleId}/export/html_optimized`, { responseType: 'blob' });
+      const url = URL.createObjectURL(res.data);
+      const a = document.createElement('a');
+      a.href = url;
+      a.download = 'article.html';
+      a.click();
+      URL.revokeObjectURL(url);
+      // "total=123; html=...; over=none" -> { total: '123', ... }
+      const header = res.headers['x-export-budget'] || '';
+      const budget = Object.fromEntries(header.split(';').map((p) => p.trim().split('=')).filter((p) => p.length === 2));
+      setFastHtmlBudget(header ? budget : null);
+      if (budget.over && budget.over !== 'none') {
+        toast.warning(`HTML pobrany, przekroczony budzet: ${budget.over}`);
+      } else {
+        toast.success('Zoptymalizowany HTML pobrany');
+      }
+    } catch (e) {
+      toast.error('Blad pobierania HTML');
+    } finally {
+      setLoadingFastHtml(false);
+    }
+  };
+
   const downloadPdf = async () => {
     setLoadingPdf(true);
     try {
-      const res = await axios.post(
-        `${BACKEND_URL}/api/articles/${articleId}/export`, 
-        { format: 'pdf' },
-        { responseType: 'blob' }
-      );
+      const res = await axios.get(`${BACKEND_URL}/api/articles/${articleId}/export/pdf`, { responseType: 'blob' });
       const url = URL.createObjectURL(res.data);
       const a = document.createElement('a');
       a.href = url;
@@ -269,6 +293,27 @@ const ExportPanel = ({ articleId }) => {
             {loadingHtml ? <Loader2 size={14} className="animate-spin" /> : <Download size={14} />}
             Pobierz HTML
           </Button>
+          <Button
+            variant="outline"
+            size="sm"
+            onClick={downloadFastHtml}
+            disabled={loadingFastHtml}
+            className="gap-1 w-full"
+            style={{ marginTop: 6 }}
+            data-testid="export-html-optimized-button"
+          >
+            {loadingFastHtml ? <Loader2 size={14} className="animate-spin" /> : <Download size={14} />}
+            Pobierz HTML zoptymalizowany
+          </Button>
+          {fastHtmlBudget && (
+            <div style={{ fontSize: 11, color: 'hsl(215, 16%, 45%)', marginTop: 6 }} data-testid="export-html-optimized-budget">
+              {(Number(fastHtmlBudget.html_gzip) / 1024).toFixed(1)} KB gzip, CSS {(Number(fastHtmlBudget.css) / 1024).toFixed(1)} KB,
+              obrazy {(Number(fastHtmlBudget.images) / 1024).toFixed(0)} KB
+              {fastHtmlBudget.over !== 'none' && (
+                <span style={{ color: 'hsl(0, 60%, 45%)' }}> - ponad budzet: {fastHtmlBudget.over}</span>
+              )}
+            </div>
+          )}
         </div>
       </div>
 
@@ -681,9 +681,9 @@ const ImageGenerator = ({ articleId, article, onInsertImage }) => {
                   }
                 }}
               >
-                {img.data ? (
+                {img.data || img.url ? (
                   <img
-                    src={`data:${img.mime_type};base64,${img.data}`}
+                    src={img.data ? `data:${img.mime_type};base64,${img.data}` : `${BACKEND_URL}${img.url}`}
                     alt={img.prompt}
                     style={{ width: '100%', aspectRatio: '1', objectFit: 'cover', display: 'block' }}
                   />
@@ -43,14 +43,14 @@ const SEOAssistantPanel = ({ articleId, article, onApplySuggestion }) => {
     }
   }, [chatMessages]);
 
-  const handleAnalyze = async () => {
+  const handleAnalyze = async (mode = 'analyze', force = false) => {
     setAnalyzing(true);
     setSuggestions([]);
     setAppliedSuggestions(new Set());
     try {
       const response = await axios.post(
         `${BACKEND_URL}/api/articles/${articleId}/seo-assistant`,
-        { mode: 'analyze' },
+        { mode, force },
         { timeout: 120000 }
       );
       const data = response.data;
@@ -61,7 +61,14 @@ const SEOAssistantPanel = ({ articleId, article, onApplySuggestion }) => {
           { role: 'assistant', content: data.assistant_message }
         ]);
       }
-      toast.success('Analiza SEO zakonczona');
+      if (data.incremental_available) {
+        toast.info(`Zmieniono sekcje: ${data.changed_sections.length}. Pokazano poprzednia analize.`, {
+          action: { label: 'Analizuj zmiany', onClick: () => handleAnalyze('analyze_sections') },
+          cancel: { label: 'Pelna analiza', onClick: () => handleAnalyze('analyze', true) },
+        });
+      } else {
+        toast.success(data.cached ? 'Analiza SEO (bez zmian w artykule)' : 'Analiza SEO zakonczona');
+      }
     } catch (error) {
       const msg = error.response?.data?.detail || 'Blad analizy SEO';
       toast.error(msg);
@@ -146,7 +153,7 @@ const SEOAssistantPanel = ({ articleId, article, onApplySuggestion }) => {
           <Badge variant="outline" style={{ fontSize: 10, padding: '1px 6px', marginLeft: 'auto' }}>GPT-5.2</Badge>
         </div>
         <Button
-          onClick={handleAnalyze}
+          onClick={() => handleAnalyze()}
           disabled={analyzing}
           size="sm"
           className="gap-1 w-full"
@@ -88,6 +88,42 @@ const SEOScorePanel = ({ seoScore, onRescore, scoring }) => {
         ))}
       </div>
 
+      {/* Keyword distribution heatmap */}
+      {seoScore.keyword_distribution && seoScore.keyword_distribution.total_words > 0 && (() => {
+        const dist = seoScore.keyword_distribution;
+        const maxBin = Math.max(1, ...dist.bins);
+        return (
+          <div className="panel-section" data-testid="keyword-heatmap">
+            <div className="panel-section-title">Rozkład słowa kluczowego</div>
+            <div style={{ display: 'flex', gap: 2, marginBottom: 6 }}>
+              {dist.bins.map((count, idx) => (
+                <div
+                  key={idx}
+                  title={`${count} wystąpień`}
+                  style={{
+                    flex: 1,
+                    height: 18,
+                    borderRadius: 2,
+                    background: count ? `hsla(158, 55%, 34%, ${0.25 + 0.75 * (count / maxBin)})` : 'hsl(214, 18%, 92%)'
+                  }}
+                />
+              ))}
+            </div>
+            {dist.section_anchors.map((anchor, idx) => (
+              <div key={anchor || idx} style={{ display: 'flex', justifyContent: 'space-between', fontSize: 12, color: 'hsl(215, 16%, 45%)' }}>
+                <span>#{anchor || idx + 1}</span>
+                <span>{dist.section_hits[idx]} / {dist.section_words[idx]} słów</span>
+              </div>
+            ))}
+            {dist.largest_gap.words > 300 && (
+              <p style={{ fontSize: 12, color: 'hsl(38, 92%, 35%)', marginTop: 6 }}>
+                Najdłuższy fragment bez frazy: {dist.largest_gap.words} słów (od słowa {dist.largest_gap.start})
+              </p>
+            )}
+          </div>
+        );
+      })()}
+
       {/* Recommendations */}
       {seoScore.recommendations && seoScore.recommendations.length > 0 && (
         <div className="panel-section" data-testid="seo-checklist">
@@ -0,0 +1,136 @@
+// Editor HTML -> sections (same rules as backend/html_sections.py) and
+// JSON-patch operations between the last saved article and the current one.
+
+// Attribute text of a tag: quoted values may contain ">"
+const ATTRS = `((?:[^>"']|"[^"]*"|'[^']*')*)`;
+// Comment, raw-text element (body not parsed as markup) or <h2>/<h3> tag
+const TOKEN_RE = new RegExp(
+  `<(?:!--[\\s\\S]*?(?:-->|$)|(script|style)\\b${ATTRS}>[\\s\\S]*?(?:<\\/\\1\\s*>|$)|(\\/?)h([23])\\b${ATTRS}>)`,
+  'gi'
+);
+const ID_ATTR_RE = /(?:^|\s)id\s*=\s*(?:"([^"]*)"|'([^']*)'|([^\s"'>]+))/i;
+const H1_RE = /<h1[^>]*>([\s\S]*?)<\/h1>/i;
+const TAG_RE = /<[^>]+>/g;
+
+const DIACRITICS = {
+  ą: 'a', à: 'a', á: 'a', â: 'a', ã: 'a', ä: 'a', å: 'a', ć: 'c', ç: 'c', č: 'c',
+  ę: 'e', è: 'e', é: 'e', ê: 'e', ë: 'e', ł: 'l', ń: 'n', ñ: 'n',
+  ó: 'o', ò: 'o', ô: 'o', õ: 'o', ö: 'o', ś: 's', š: 's', ş: 's', ż: 'z', ź: 'z', ž: 'z'
+};
+
+const PATCHABLE_FIELDS = ['title', 'slug', 'meta_title', 'meta_description', 'faq', 'toc', 'internal_link_suggestions', 'sources'];
+const SECTION_FIELDS = ['heading', 'anchor', 'content'];
+
+const stripTags = (html) => html.replace(TAG_RE, '');
+
+export const slugify = (text) => text
+  .trim()
+  .toLowerCase()
+  .replace(/[ąàáâãäåćçčęèéêëłńñóòôõöśšşżźž]/g, (ch) => DIACRITICS[ch])
+  .replace(/[^a-z0-9\s-]/g, '')
+  .replace(/[\s-]+/g, '-')
+  .slice(0, 80)
+  .replace(/^-+|-+$/g, '');
+
+export const extractH1Title = (html) => {
+  const match = H1_RE.exec(html || '');
+  return match ? stripTags(match[1]).trim() : '';
+};
+
+export const parseHtmlToSections = (html) => {
+  if (!html || !html.trim()) return [];
+  const sections = [];
+  let section = null;
+  let target = null;
+  let bodyStart = 0;
+
+  const emit = ({ level, id, tagStart, innerStart, innerEnd, end }) => {
+    if (target) target.content = html.slice(bodyStart, tagStart).trim();
+    const text = stripTags(html.slice(innerStart, innerEnd)).trim();
+    const anchor = id || slugify(text);
+    if (level === '2') {
+      section = { heading: text, anchor, content: '', subsections: [] };
+      sections.push(section);
+      target = section;
+    } else if (section) {
+      target = { heading: text, anchor, content: '' };
+      section.subsections.push(target);
+    } else {
+      target = null;
+    }
+    bodyStart = end;
+  };
+
+  // Open headings, outermost first; `nested` holds headings completed inside them
+  const stack = [];
+  const dropUnclosed = (depth) => {
+    stack.splice(depth).forEach((entry) => entry.nested.forEach(emit));
+  };
+
+  TOKEN_RE.lastIndex = 0;
+  let match;
+  while ((match = TOKEN_RE.exec(html)) !== null) {
+    const [, , , closing, level, attrs] = match;
+    if (level === undefined) continue; // comment or script/style body
+    if (!closing) {
+      const depth = stack.findIndex((entry) => entry.level >= level);
+      dropUnclosed(depth === -1 ? stack.length : depth);
+      const id = ID_ATTR_RE.exec(attrs);
+      stack.push({
+        level,
+        id: id ? (id[1] ?? id[2] ?? id[3]) : '',
+        tagStart: match.index,
+        innerStart: match.index + match[0].length,
+        nested: []
+      });
+      continue;
+    }
+    let k = stack.length - 1;
+    while (k >= 0 && stack[k].level !== level) k -= 1;
+    if (k < 0) continue;
+    // Anything still open inside the heading is part of its text
+    const [entry] = stack.splice(k);
+    const heading = { ...entry, innerEnd: match.index, end: match.index + match[0].length };
+    if (stack.length) stack[stack.length - 1].nested.push(heading);
+    else emit(heading);
+  }
+  dropUnclosed(0);
+  if (target) target.content = html.slice(bodyStart).trim();
+  return sections;
+};
+
+const same = (a, b) => JSON.stringify(a) === JSON.stringify(b);
+
+const fragmentOps = (path, saved, current) => SECTION_FIELDS
+  .filter((field) => (saved[field] || '') !== (current[field] || ''))
+  .map((field) => ({ op: 'replace', path: `${path}/${field}`, value: current[field] || '' }));
+
+// Operations that turn `saved` into `current` (both plain article objects)
+export const buildArticlePatch = (saved, current) => {
+  const ops = [];
+  for (const field of PATCHABLE_FIELDS) {
+    if (current[field] === undefined || current[field] === null) continue;
+    if (!same(saved[field], current[field])) {
+      ops.push({ op: 'replace', path: `/${field}`, value: current[field] });
+    }
+  }
+
+  const savedSections = saved.sections || [];
+  const sections = current.sections || [];
+  if (savedSections.length !== sections.length) {
+    ops.push({ op: 'replace', path: '/sections', value: sections });
+    return ops;
+  }
+  sections.forEach((section, i) => {
+    const savedSection = savedSections[i];
+    ops.push(...fragmentOps(`/sections/${i}`, savedSection, section));
+    const savedSubs = savedSection.subsections || [];
+    const subs = section.subsections || [];
+    if (savedSubs.length !== subs.length) {
+      ops.push({ op: 'replace', path: `/sections/${i}/subsections`, value: subs });
+      return;
+    }
+    subs.forEach((sub, j) => ops.push(...fragmentOps(`/sections/${i}/subsections/${j}`, savedSubs[j], sub)));
+  });
+  return ops;
+};
@@ -14,6 +14,7 @@ import SEOAssistantPanel from '../components/SEOAssistantPanel';
 import EditorToolbar from '../components/EditorToolbar';
 import AIChatPanel from '../components/AIChatPanel';
 import AIRewriter from '../components/AIRewriter';
+import { buildArticlePatch, extractH1Title, parseHtmlToSections } from '../lib/articlePatch';
 
 const BACKEND_URL = process.env.REACT_APP_BACKEND_URL;
 
@@ -27,7 +28,11 @@ const ArticleEditor = () => {
   const [regenerating, setRegenerating] = useState(null); // null, 'faq', 'meta'
   const [hasUnsavedChanges, setHasUnsavedChanges] = useState(false);
   const autosaveTimerRef = useRef(null);
+  const liveScoreTimerRef = useRef(null);
   const editorContentRef = useRef(null);
+  // Article as last stored on the server; saves send only the difference to it
+  const lastSavedRef = useRef(null);
+  const etagRef = useRef(null);
   
   const [editorTab, setEditorTab] = useState('visual');
   const [rightTab, setRightTab] = useState('seo');
@@ -57,6 +62,34 @@ const ArticleEditor = () => {
     // eslint-disable-next-line react-hooks/exhaustive-deps
   }, [metaTitle, metaDescription, article?.faq, hasUnsavedChanges]);
 
+  // Live SEO score of unsaved content (stateless endpoint, nothing is stored)
+  useEffect(() => {
+    if (!article || !hasUnsavedChanges) return;
+    if (liveScoreTimerRef.current) clearTimeout(liveScoreTimerRef.current);
+    liveScoreTimerRef.current = setTimeout(async () => {
+      try {
+        const response = await axios.post(`${BACKEND_URL}/api/score/live`, {
+          primary_keyword: article.primary_keyword || '',
+          secondary_keywords: article.secondary_keywords || [],
+          html_content: htmlContent,
+          title: article.title || '',
+          meta_description: metaDescription,
+          faq: article.faq || [],
+          toc: article.toc || [],
+          internal_link_suggestions: article.internal_link_suggestions || [],
+          sources: article.sources || []
+        });
+        setArticle(prev => (prev ? { ...prev, seo_score: response.data } : prev));
+      } catch (e) {
+        // Live score is best-effort; the saved score stays visible
+      }
+    }, 800);
+    return () => {
+      if (liveScoreTimerRef.current) clearTimeout(liveScoreTimerRef.current);
+    };
+    // eslint-disable-next-line react-hooks/exhaustive-deps
+  }, [htmlContent, metaDescription, article?.faq, hasUnsavedChanges]);
+
   const performAutosave = async () => {
     if (!article || saving) return;
     try {
@@ -71,6 +104,8 @@ const ArticleEditor = () => {
       setLoading(true);
       const response = await axios.get(`${BACKEND_URL}/api/articles/${articleId}`);
       setArticle(response.data);
+      lastSavedRef.current = response.data;
+      etagRef.current = response.headers.etag || null;
       setHtmlContent(buildHtmlFromArticle(response.data));
       setMetaTitle(response.data.meta_title || '');
       setMetaDescription(response.data.meta_description || '');
@@ -115,26 +150,45 @@ const ArticleEditor = () => {
         setHtmlContent(currentHtml);
       }
       
-      const updateData = {
-        title: article.title,
+      // Same sync rules as the server: HTML headings become sections, <h1> the title
+      const parsedSections = parseHtmlToSections(currentHtml);
+      const current = {
+        title: (parsedSections.length && extractH1Title(currentHtml)) || article.title,
         slug: article.slug,
         meta_title: metaTitle,
         meta_description: metaDescription,
-        sections: article.sections,
+        sections: parsedSections.length ? parsedSections : article.sections,
         faq: article.faq,
         toc: article.toc,
         internal_link_suggestions: article.internal_link_suggestions,
-        sources: article.sources,
-        html_content: currentHtml
+        sources: article.sources
       };
-      const response = await axios.put(`${BACKEND_URL}/api/articles/${articleId}`, updateData);
-      setArticle(response.data);
+      const ops = buildArticlePatch(lastSavedRef.current || {}, current);
+      if (ops.length) {
+        // If-Match: the save only applies to the version this tab loaded (412 otherwise)
+        const headers = etagRef.current ? { 'If-Match': etagRef.current } : {};
+        try {
+          const response = await axios.patch(`${BACKEND_URL}/api/articles/${articleId}`, ops, { headers });
+          setArticle(prev => ({ ...prev, ...current, updated_at: response.data.updated_at }));
+          lastSavedRef.current = { ...lastSavedRef.current, ...current };
+          etagRef.current = response.headers.etag || null;
+        } catch (patchError) {
+          if (patchError.response?.status !== 400) throw patchError;
+          // Patch did not apply to the stored article: fall back to a full save
+          const response = await axios.put(`${BACKEND_URL}/api/articles/${articleId}`, { ...current, html_content: currentHtml }, { headers });
+          setArticle(response.data);
+          lastSavedRef.current = response.data;
+          etagRef.current = response.headers.etag || null;
+        }
+      }
       setHasUnsavedChanges(false);
       if (!isAutosave) {
         toast.success('Artykuł zapisany');
       }
     } catch (error) {
-      if (!isAutosave) {
+      if (error.response?.status === 412) {
+        toast.error('Artykuł został zmieniony w innej karcie - odśwież stronę, aby nie nadpisać zmian');
+      } else if (!isAutosave) {
         toast.error('Błąd podczas zapisywania');
       }
     } finally {
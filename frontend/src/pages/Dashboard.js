@@ -1,6 +1,6 @@
 import React, { useState, useEffect } from 'react';
 import { Link, useNavigate } from 'react-router-dom';
-import { Plus, Search, FileText, TrendingUp, AlertTriangle, ArrowRight, Trash2 } from 'lucide-react';
+import { Plus, Search, FileText, TrendingUp, AlertTriangle, ArrowRight, Trash2, Download, Loader2 } from 'lucide-react';
 import { Button } from '../components/ui/button';
 import { Input } from '../components/ui/input';
 import { toast } from 'sonner';
@@ -14,6 +14,7 @@ const Dashboard = () => {
   const [stats, setStats] = useState({ total_articles: 0, avg_seo_score: 0, needs_improvement: 0 });
   const [searchQuery, setSearchQuery] = useState('');
   const [loading, setLoading] = useState(true);
+  const [exporting, setExporting] = useState(false);
 
   useEffect(() => {
     fetchData();
@@ -49,6 +50,28 @@ const Dashboard = () => {
     }
   };
 
+  // Whole workspace as one ZIP (HTML, PDF and JSON of every article), built and streamed by the server
+  const handleExportWorkspace = async () => {
+    setExporting(true);
+    try {
+      const res = await axios.get(`${BACKEND_URL}/api/export/workspace`, {
+        params: { formats: 'html,pdf,json' },
+        responseType: 'blob'
+      });
+      const url = URL.createObjectURL(res.data);
+      const a = document.createElement('a');
+      a.href = url;
+      a.download = 'workspace.zip';
+      a.click();
+      URL.revokeObjectURL(url);
+      toast.success('Eksport ZIP pobrany');
+    } catch (error) {
+      toast.error('Błąd podczas eksportu artykułów');
+    } finally {
+      setExporting(false);
+    }
+  };
+
   const filteredArticles = articles.filter(a => 
     a.title?.toLowerCase().includes(searchQuery.toLowerCase()) ||
     a.primary_keyword?.toLowerCase().includes(searchQuery.toLowerCase())
@@ -76,14 +99,26 @@ const Dashboard = () => {
     <div className="page-container">
       <div className="page-header">
         <h1>Pulpit</h1>
-        <Button 
-          onClick={() => navigate('/generator')}
-          data-testid="dashboard-new-article-button"
-          className="gap-2"
-        >
-          <Plus size={18} />
-          Nowy artykuł
-        </Button>
+        <div className="flex gap-2">
+          <Button
+            variant="outline"
+            onClick={handleExportWorkspace}
+            disabled={exporting || articles.length === 0}
+            data-testid="dashboard-export-workspace-button"
+            className="gap-2"
+          >
+            {exporting ? <Loader2 size={18} className="animate-spin" /> : <Download size={18} />}
+            Eksport ZIP
+          </Button>
+          <Button 
+            onClick={() => navigate('/generator')}
+            data-testid="dashboard-new-article-button"
+            className="gap-2"
+          >
+            <Plus size={18} />
+            Nowy artykuł
+          </Button>
+        </div>
       </div>
 
       {/* Stats */}
@@ -344,7 +344,7 @@ export default function ImageLibrary() {
                 >
                   {img.has_data ? (
                     <img
-                      src={`data:${img.mime_type};base64,${img.data || ''}`}
+                      src={img.url ? `${BACKEND_URL}${img.url}` : `data:${img.mime_type};base64,${img.data || ''}`}
                       alt={img.prompt || ''}
                       style={{ width: '100%', height: '100%', objectFit: 'cover' }}
                       loading="lazy"